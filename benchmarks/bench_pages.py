@@ -0,0 +1,222 @@
+"""Prestatiebenchmark: draai home.py en alle pagina's headless via Streamlit's AppTest.
+
+Per pagina en per scenariogrootte (standaard 10, 100, 1.000 en 10.000 vectoren)
+wordt gemeten:
+  - eerste run (koude caches) en mediane rerun (warm, zelfde invoer) in seconden;
+  - piekgeheugen van Python-allocaties tijdens de eerste run (tracemalloc, MB);
+  - grootte van de geserialiseerde Plotly-figuren en van het hele element-antwoord (bytes).
+
+Gebruik (vanuit de projectmap):
+    python benchmarks/bench_pages.py                       # rapport naar benchmarks/report.json
+    python benchmarks/bench_pages.py --sizes 10 100 --reruns 3 -o /tmp/rapport.json
+    python benchmarks/bench_pages.py --baseline benchmarks/baseline.json --tolerance 0.25
+
+Met `--baseline` eindigt het script met exitcode 1 als een rerun-tijd of
+figuurgrootte meer dan `--tolerance` (fractie) slechter is dan in de baseline.
+De pagina's gebruiken tijdens de meting een tijdelijke scenariodatabase
+(`$STATICA_DB`), nooit die in `~/.statica`.
+"""
+import argparse
+import json
+import platform
+import statistics
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Vóór het importeren van statica/de pagina's: scenario's naar een wegwerpbestand, niet naar ~/.statica
+_DB_DIR = tempfile.TemporaryDirectory(prefix="statica-bench-")
+os.environ["STATICA_DB"] = os.path.join(_DB_DIR.name, "scenarios.sqlite3")
+
+import streamlit as st  # noqa: E402
+from streamlit.logger import set_log_level  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from statica.store import (ENTRY2D_FIELDS, ENTRY3D_FIELDS, KNOWN2D_FIELDS, KNOWN3D_FIELDS,  # noqa: E402
+                           RIGID_LOAD_FIELDS, RIGID_SUPPORT_FIELDS, TRUSS_MEMBER_FIELDS, TRUSS_NODE_FIELDS,
+                           VectorStore)
+from statica.truss import pratt_truss  # noqa: E402
+
+SIZES = [10, 100, 1_000, 10_000]
+PALETTE = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd"]
+TIMEOUT = 300
+
+
+# ===================================
+# Synthetische scenario's (zelfde invoeropslag als de pagina's in session_state zetten)
+# ===================================
+def entries_3d(n, rng):
+    xyz = rng.uniform(-10, 10, (n, 3))
+    return VectorStore(ENTRY3D_FIELDS, [{"x": x, "y": y, "z": z, "color": PALETTE[i % len(PALETTE)]}
+                                        for i, (x, y, z) in enumerate(xyz.tolist())])
+
+
+def entries_2d(n, rng):
+    F = rng.uniform(1, 100, n)
+    theta = rng.uniform(-180, 180, n)
+    return VectorStore(ENTRY2D_FIELDS, [{"mode": "angle", "force": f, "theta": t, "color": PALETTE[i % len(PALETTE)]}
+                                        for i, (f, t) in enumerate(zip(F.tolist(), theta.tolist()))])
+
+
+def known_forces(n, rng):
+    F = rng.uniform(1, 100, n)
+    theta = rng.uniform(-180, 180, n)
+    return VectorStore(KNOWN2D_FIELDS, [{"F": f, "theta": t, "color": PALETTE[i % len(PALETTE)]}
+                                        for i, (f, t) in enumerate(zip(F.tolist(), theta.tolist()))])
+
+
+def known_3d(n, rng):
+    xyz = rng.uniform(-10, 10, (n, 3))
+    return VectorStore(KNOWN3D_FIELDS, [{"x": x, "y": y, "z": z, "color": PALETTE[i % len(PALETTE)]}
+                                        for i, (x, y, z) in enumerate(xyz.tolist())])
+
+
+def truss(n, rng):
+    """Pratt-ligger met ongeveer n staven (4 per vak); geeft (knopen, staven)."""
+    nodes, members = pratt_truss(max(2, n // 4), span=max(2, n // 4) * 2.0)
+    node_store, member_store = VectorStore(TRUSS_NODE_FIELDS), VectorStore(TRUSS_MEMBER_FIELDS)
+    node_store.replace_columns(nodes)
+    member_store.replace_columns(members)
+    return node_store, member_store
+
+
+def rigid_loads(n, rng):
+    """n belastingen verdeeld over ongeveer n/10 belastinggevallen, op een ingeklemde console."""
+    xyz, pts = rng.uniform(-10, 10, (n, 3)), rng.uniform(0, 2, (n, 3))
+    case = rng.integers(1, max(2, n // 10) + 1, n)
+    loads = VectorStore(RIGID_LOAD_FIELDS)
+    loads.replace_columns({"case": case.astype(float), "x": xyz[:, 0], "y": xyz[:, 1], "z": xyz[:, 2],
+                           "px": pts[:, 0], "py": pts[:, 1], "pz": pts[:, 2], "color": [PALETTE[0]] * n})
+    supports = VectorStore(RIGID_SUPPORT_FIELDS, [{"type": t, c: 1.0} for t in ("kracht", "moment") for c in "xyz"])
+    return loads, supports
+
+
+# (label, pad, sessie-sleutel(s), scenariobouwer); home.py heeft geen invoer.
+# Bij een tuple sleutels geeft de bouwer per sleutel één opslag terug.
+PAGES = [
+    ("home", "home.py", None, None),
+    ("3d", "pages/1_3D_Vector_Visualisatie.py", "entries", entries_3d),
+    ("2d", "pages/2_2D_Vector_Visualisatie.py", "entries2d", entries_2d),
+    ("solver", "pages/3_2D_Onbekende_Vector_Solver.py", "known_forces", known_forces),
+    ("solver3d", "pages/4_3D_Onbekende_Vector_Solver.py", "known3d", known_3d),
+    ("truss", "pages/5_2D_Vakwerk_Solver.py", ("truss_nodes", "truss_members"), truss),
+    ("rigid3d", "pages/6_3D_Oplegreacties.py", ("rigid_loads", "rigid_supports"), rigid_loads),
+]
+
+
+# ===================================
+# Meten
+# ===================================
+def payload_sizes(at):
+    """Bytes van alle Plotly-specs en van alle elementen samen (zoals naar de browser gestuurd)."""
+    fig_bytes = sum(len(el.proto.spec) for el in at.get("plotly_chart"))
+    total = 0
+    stack = [at._tree]
+    while stack:
+        node = stack.pop()
+        proto = getattr(node, "proto", None)
+        if proto is not None and hasattr(proto, "ByteSize"):
+            total += proto.ByteSize()
+        stack.extend(getattr(node, "children", {}).values())
+    return fig_bytes, total
+
+
+def bench_page(path, state_key, scenario, reruns):
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    at = AppTest.from_file(str(ROOT / path), default_timeout=TIMEOUT)
+    if isinstance(state_key, tuple):
+        for key, value in zip(state_key, scenario):
+            at.session_state[key] = value
+    elif state_key is not None:
+        at.session_state[state_key] = scenario
+
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if at.exception:
+        raise RuntimeError(f"{path}: {at.exception[0].message}")
+
+    times = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+    fig_bytes, total_bytes = payload_sizes(at)
+    return {
+        "first_run_s": round(first, 4),
+        "rerun_s": round(statistics.median(times), 4) if times else None,
+        "peak_mem_mb": round(peak / 2**20, 2),
+        "figure_bytes": fig_bytes,
+        "payload_bytes": total_bytes,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Lijst regressies t.o.v. de baseline (zelfde pagina + n)."""
+    base = {(r["page"], r["n"]): r for r in baseline["results"]}
+    out = []
+    for r in results:
+        b = base.get((r["page"], r["n"]))
+        if not b:
+            continue
+        for metric in ("rerun_s", "figure_bytes"):
+            old, new = b.get(metric), r.get(metric)
+            if old and new and new > old * (1 + tolerance):
+                out.append(f"{r['page']} n={r['n']}: {metric} {old} → {new} (+{(new/old - 1)*100:.0f}%)")
+    return out
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Benchmark alle pagina's headless via Streamlit AppTest.")
+    p.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="aantallen vectoren per scenario")
+    p.add_argument("--pages", nargs="+", default=[label for label, *_ in PAGES], help="subset van: " + ", ".join(l for l, *_ in PAGES))
+    p.add_argument("--reruns", type=int, default=5, help="aantal warme reruns per meting (mediaan)")
+    p.add_argument("-o", "--output", default=str(ROOT / "benchmarks" / "report.json"))
+    p.add_argument("--baseline", help="eerder rapport; bij regressie exitcode 1")
+    p.add_argument("--tolerance", type=float, default=0.25, help="toegestane verslechtering t.o.v. baseline (fractie)")
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args(argv)
+
+    set_log_level("error")   # geen 'No runtime found'/deprecatie-regels tussen de meetresultaten
+    rng = np.random.default_rng(args.seed)
+    results = []
+    for label, path, state_key, build in PAGES:
+        if label not in args.pages:
+            continue
+        for n in ([0] if build is None else args.sizes):
+            scenario = build(n, rng) if build else None
+            r = {"page": label, "n": n, **bench_page(path, state_key, scenario, args.reruns)}
+            results.append(r)
+            print(f"{label:9s} n={n:<6d} eerste {r['first_run_s']:.3f}s  rerun {r['rerun_s']:.3f}s  "
+                  f"piek {r['peak_mem_mb']:.1f} MB  figuur {r['figure_bytes']/1024:.1f} kB", file=sys.stderr)
+
+    report = {
+        "meta": {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+                 "streamlit": st.__version__, "platform": platform.platform(), "reruns": args.reruns, "seed": args.seed},
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Rapport: {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text(encoding="utf-8")), args.tolerance)
+        for line in regressions:
+            print("REGRESSIE:", line, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
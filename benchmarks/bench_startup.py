@@ -0,0 +1,75 @@
+"""Koude-start-meting: eerste render van home.py en een lege pagina in een vers Python-proces.
+
+Elke meting start een nieuw proces (lege importcache, zoals een net opgeschaalde
+container) en rapporteert de tijd tot en met de eerste volledige run, plus welke
+zware modules daarbij geladen zijn. Ter vergelijking draait elke pagina ook in
+een 'eager'-variant die pandas en pyarrow vooraf importeert, zoals de pagina's
+dat vroeger bovenaan deden; het verschil is de winst van de lazy imports.
+
+Gebruik (vanuit de projectmap):
+    python benchmarks/bench_startup.py [--repeat 5] [-o benchmarks/startup.json]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+TARGETS = {
+    "home": "home.py",
+    "3d (leeg)": "pages/1_3D_Vector_Visualisatie.py",
+    "2d (leeg)": "pages/2_2D_Vector_Visualisatie.py",
+}
+HEAVY = ["pandas", "pyarrow", "plotly.validators"]
+
+# Draait in het kindproces; meet vanaf vóór `import streamlit`
+CHILD = r"""
+import sys, time, json
+t0 = time.perf_counter()
+if {eager}:
+    import pandas, pyarrow.parquet
+sys.path.insert(0, {root!r})
+from streamlit.logger import set_log_level
+set_log_level("error")
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({path!r}, default_timeout=120).run()
+elapsed = time.perf_counter() - t0
+assert not at.exception, at.exception
+print(json.dumps({{"s": elapsed, "loaded": [m for m in {heavy!r} if any(k == m or k.startswith(m + ".") for k in sys.modules)]}}))
+"""
+
+
+def measure(path, eager, repeat):
+    runs, loaded = [], []
+    code = CHILD.format(eager=eager, root=str(ROOT), path=str(ROOT / path), heavy=HEAVY)
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT)
+        res = json.loads(out.stdout.strip().splitlines()[-1])
+        runs.append(res["s"])
+        loaded = res["loaded"]
+    return {"median_s": round(statistics.median(runs), 4), "min_s": round(min(runs), 4), "loaded": loaded}
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Meet de koude start van home.py en lege pagina's.")
+    p.add_argument("--repeat", type=int, default=5, help="aantal verse processen per meting")
+    p.add_argument("-o", "--output", default=str(ROOT / "benchmarks" / "startup.json"))
+    args = p.parse_args(argv)
+
+    results = []
+    for label, path in TARGETS.items():
+        lazy = measure(path, False, args.repeat)
+        eager = measure(path, True, args.repeat)
+        gain = eager["median_s"] - lazy["median_s"]
+        results.append({"target": label, "lazy": lazy, "eager": eager, "gain_s": round(gain, 4)})
+        print(f"{label:10s} lazy {lazy['median_s']:.3f}s  eager {eager['median_s']:.3f}s  winst {gain:.3f}s  "
+              f"geladen: {', '.join(lazy['loaded']) or '—'}", file=sys.stderr)
+
+    Path(args.output).write_text(json.dumps({"repeat": args.repeat, "results": results}, indent=2), encoding="utf-8")
+    print(f"Rapport: {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
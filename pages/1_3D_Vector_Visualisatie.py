@@ -1,53 +1,50 @@
 import math
+import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
+
+from statica.vectors import EPS, vec_norm, resultant, cart_to_alpha_beta_gamma, entries_to_cart
+from statica.moments import force_couple, line_of_action, moments_about, reduces_to_single_force
+from statica.plotting import (BATCH_THRESHOLD_3D, LOD_THRESHOLD, LOD_TOP_K, LOD_LAT_BINS, LOD_COLOR,
+                              add_arrows3d_batched, lod_reduce)
+from statica.export import export_section
+from statica.editor import HEX_COLOR_RE, input_mode_radio, bulk_editor, reset_bulk_editor
+from statica.store import ENTRY3D_FIELDS, VectorStore
+from statica.profiling import Profiler
+from statica.presets import preset_picker
+from statica.scenarios import scenario_section
+from statica.share import share_section
+from statica.paging import lazy_section, page_slice, sum_line
+from statica.cache import SCENE_CACHE_ENTRIES, TABLE_CACHE_ENTRIES, FIGURE_CACHE_ENTRIES, scenario_hash
+from statica.fileio import import_widget, imported_columns, export_widget, table_to_cart, table_colors, table_points
 
 st.set_page_config(page_title="🧭 3D Vector Visualisatie", layout="wide")
 st.title("🧭 3D Vector Visualisatie")
+prof = Profiler("3d")
+preset_picker("3d")
+share_section("3d")
+scenario_section("3d")
+export_section("3d")
 
 # ===================================
 # Helpers
 # ===================================
-def vec_norm(x, y, z):
-    return math.sqrt(x*x + y*y + z*z)
-
-def cart_to_alpha_beta_gamma(x, y, z):
-    mag = vec_norm(x,y,z)
-    if mag < 1e-12:
-        return None, None, None, 0.0
-    a = math.degrees(math.acos(max(-1,min(1,x/mag))))
-    b = math.degrees(math.acos(max(-1,min(1,y/mag))))
-    g = math.degrees(math.acos(max(-1,min(1,z/mag))))
-    return a, b, g, mag
-
-def alpha_beta_gamma_to_cart(mag, alpha_deg, beta_deg, gamma_deg, normalize_if_needed=True):
-    ca = math.cos(math.radians(alpha_deg))
-    cb = math.cos(math.radians(beta_deg))
-    cg = math.cos(math.radians(gamma_deg))
-    s = ca*ca + cb*cb + cg*cg
-    if s <= 1e-12:
-        return 0.0, 0.0, 0.0
-    if normalize_if_needed and abs(s - 1.0) > 1e-3:
-        k = math.sqrt(s)
-        ca, cb, cg = ca/k, cb/k, cg/k
-    return mag*ca, mag*cb, mag*cg
-
-def add_arrow(fig, x, y, z, color, linewidth, markersize, show_points, draw_arrowheads, name):
+def add_arrow(fig, x, y, z, color, linewidth, markersize, show_points, draw_arrowheads, name, origin=(0.0, 0.0, 0.0)):
+    ox, oy, oz = origin
     fig.add_trace(go.Scatter3d(
-        x=[0, x], y=[0, y], z=[0, z],
+        x=[ox, ox+x], y=[oy, oy+y], z=[oz, oz+z],
         mode="lines+markers" if show_points else "lines",
         line=dict(width=linewidth, color=color),
         marker=dict(size=markersize, color=color),
         name=name
     ))
     if draw_arrowheads and (abs(x)+abs(y)+abs(z) > 1e-12):
-        norm = vec_norm(x,y,z)
+        norm = float(vec_norm((x, y, z)))
         frac = 0.04
         bx, by, bz = (1-frac)*x, (1-frac)*y, (1-frac)*z
         colorscale = [[0, color], [1, color]]
         fig.add_trace(go.Cone(
-            x=[bx], y=[by], z=[bz],
+            x=[ox+bx], y=[oy+by], z=[oz+bz],
             u=[x], v=[y], w=[z],
             sizemode="absolute",
             sizeref=max(1e-9, norm * 0.06),
@@ -56,20 +53,8 @@ def add_arrow(fig, x, y, z, color, linewidth, markersize, show_points, draw_arro
             name=f"{name} arrow"
         ))
 
-def entry_to_cart(ent, normalize_dircos=True):
-    if ent["mode"] == "cart":
-        x,y,z = ent["x"], ent["y"], ent["z"]
-        mag = vec_norm(x,y,z)
-        if (ent.get("force") or 0) > 0 and mag > 1e-12:
-            scale = ent["force"] / mag
-            return x*scale, y*scale, z*scale
-        return x,y,z
-    else:
-        mag = ent.get("force") or 0.0
-        return alpha_beta_gamma_to_cart(mag, ent["alpha"], ent["beta"], ent["gamma"], normalize_if_needed=normalize_dircos)
-
 def pad_range(vals, pr=0.15):
-    vmin, vmax = min(vals), max(vals)
+    vmin, vmax = float(np.min(vals)), float(np.max(vals))
     if abs(vmax - vmin) < 1e-9:
         vmin -= 1.0; vmax += 1.0
     pad = (vmax - vmin) * pr
@@ -106,6 +91,8 @@ def add_origin_axes(fig, xr, yr, zr, color="#9e9e9e", width=2, with_labels=False
             showlegend=False
         ))
 
+MOMENT_COLOR = "#6a1b9a"
+
 # Plotly default palette (10)
 COLOR_PALETTE = ["#1f77b4","#ff7f0e","#2ca02c","#d62728","#9467bd",
                  "#8c564b","#e377c2","#7f7f7f","#bcbd22","#17becf"]
@@ -113,291 +100,512 @@ COLOR_PALETTE = ["#1f77b4","#ff7f0e","#2ca02c","#d62728","#9467bd",
 # ===================================
 # Session state
 # ===================================
+# Invoer kolomgewijs (statica.store); hybride velden zijn gewone kolommen
 if "entries" not in st.session_state:
-    st.session_state.entries = [
-        {"mode":"cart","force":0.0,"x":0.0,"y":0.0,"z":0.0,
-         "alpha":0.0,"beta":0.0,"gamma":0.0,"color":COLOR_PALETTE[0],
-         # hybride velden (per vector)
-         "hyb_enable": False, "hyb_beta": 0.0, "hyb_use_z": False, "hyb_z": 0.0, "hyb_xsign": "+"},
-    ]
+    st.session_state.entries = VectorStore(ENTRY3D_FIELDS, [{"color": COLOR_PALETTE[0]}])
 if "color_index" not in st.session_state:
     st.session_state.color_index = 1
 
 # ===================================
-# Sidebar opties
+# Sidebar opties (instellingen die de berekening raken)
 # ===================================
+# Startwaarden via session_state (deellinks zetten dezelfde sleutels)
+for _key, _value in (("normalize_3d", True), ("resultant_color_3d", "#e41a1c"),
+                     ("moment_ax_3d", 0.0), ("moment_ay_3d", 0.0), ("moment_az_3d", 0.0)):
+    st.session_state.setdefault(_key, _value)
 with st.sidebar:
     st.header("Instellingen")
-    draw_arrowheads = st.checkbox("Pijlkoppen tonen", value=True)
-    show_points = st.checkbox("Eindpunten tonen", value=True)
-    linewidth = st.slider("Lijndikte", 1, 12, 6)
-    markersize = st.slider("Marker grootte", 1, 12, 5)
-    autoscale = st.checkbox("Autoschaal assen", value=True)
-    normalize_dircos = st.checkbox("Normaliseer αβγ (cos²-som → 1)", value=True)
-    show_resultant = st.checkbox("Toon resultante vector in 3D", value=True)
-    resultant_color = st.color_picker("Kleur resultante", value="#e41a1c")
-
-    st.markdown("---")
-    # Nieuw: assen door oorsprong + opties
-    show_origin_axes = st.checkbox("Toon assen door oorsprong (X/Y/Z)", value=True)
-    origin_axes_color = st.color_picker("Kleur assen (0,0,0)", value="#9e9e9e")
-    origin_axes_width = st.slider("Lijndikte assen (0,0,0)", 1, 8, 2)
-    show_origin_axis_labels = st.checkbox("Toon labels bij oorsprong-assen (X/Y/Z)", value=True)
-
-    st.markdown("---")
-    # Nieuw: grid/titels/assen
-    show_axis_numbers = st.checkbox("Toon as-getallen (ticks)", value=True)
-    show_grid = st.checkbox("Toon rasterlijnen (grid)", value=True)
-    hide_xyz_axes = st.checkbox("Verberg X/Y/Z-assen (alles van Plotly-assen)", value=False)
-
-    st.markdown("---")
-    if not autoscale:
-        st.caption("As-bereiken")
-        xmin = st.number_input("Xmin", value=-10.0)
-        xmax = st.number_input("Xmax", value=10.0)
-        ymin = st.number_input("Ymin", value=-10.0)
-        ymax = st.number_input("Ymax", value=10.0)
-        zmin = st.number_input("Zmin", value=-10.0)
-        zmax = st.number_input("Zmax", value=10.0)
-    st.markdown("---")
+    normalize_dircos = st.checkbox("Normaliseer αβγ (cos²-som → 1)", key="normalize_3d")
+    resultant_color = st.color_picker("Kleur resultante", key="resultant_color_3d")
+    st.caption("Momentpunt A")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        ax = st.number_input("Ax", step=1.0, key="moment_ax_3d")
+    with c2:
+        ay = st.number_input("Ay", step=1.0, key="moment_ay_3d")
+    with c3:
+        az = st.number_input("Az", step=1.0, key="moment_az_3d")
+    about = (float(ax), float(ay), float(az))
     if st.button("🗑️ Verwijder alle vectoren"):
-        st.session_state.entries = [{"mode":"cart","force":0.0,"x":0.0,"y":0.0,"z":0.0,
-                                     "alpha":0.0,"beta":0.0,"gamma":0.0,"color":COLOR_PALETTE[0],
-                                     "hyb_enable": False, "hyb_beta": 0.0, "hyb_use_z": False, "hyb_z": 0.0, "hyb_xsign": "+"}]
+        st.session_state.entries.clear()
+        st.session_state.entries.append(color=COLOR_PALETTE[0])
         st.session_state.color_index = 1
+        reset_bulk_editor("entries_bulk")
 
 # ===================================
-# Invoer per vector
+# Invoer per vector (fragment: widgetinteracties herlopen alleen de invoer)
 # ===================================
-st.subheader("Vectoren invoeren (van oorsprong)")
-
-if st.button("➕ Voeg rij toe"):
-    color = COLOR_PALETTE[st.session_state.color_index % len(COLOR_PALETTE)]
-    st.session_state.entries.append({
-        "mode": "cart",
-        "force": 0.0,
-        "x": 0.0, "y": 0.0, "z": 0.0,
-        "alpha": 0.0, "beta": 0.0, "gamma": 0.0,
-        "color": color,
-        "hyb_enable": False, "hyb_beta": 0.0, "hyb_use_z": False, "hyb_z": 0.0, "hyb_xsign": "+"
-    })
-    st.session_state.color_index += 1
-
-new_entries = []
-for i, ent in enumerate(st.session_state.entries):
-    cols = st.columns([1.4, 1.8, 1.6, 1.6, 1.6, 1.8, 0.8], gap="small")
-    with cols[0]:
-        mode = st.selectbox(
-            f"Modus {i+1}",
-            ["cart", "dir"],
-            index=0 if ent["mode"]=="cart" else 1,
-            key=f"mode_{i}",
+st.subheader("Vectoren invoeren (met aangrijpingspunt)")
+
+def point_inputs(i, rid, ent):
+    """Aangrijpingspunt van één rij (ingeklapt; standaard de oorsprong)."""
+    with st.expander(f"📍 Aangrijpingspunt · Vector {i+1}"):
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            px = st.number_input(f"Px{i+1}", value=float(ent["px"]), key=f"px_{rid}")
+        with c2:
+            py = st.number_input(f"Py{i+1}", value=float(ent["py"]), key=f"py_{rid}")
+        with c3:
+            pz = st.number_input(f"Pz{i+1}", value=float(ent["pz"]), key=f"pz_{rid}")
+    return {"px": px, "py": py, "pz": pz}
+
+@st.fragment
+def input_grid():
+    store = st.session_state.entries
+    before = store.version
+    bulk_mode = input_mode_radio(len(store), key="input_mode_3d")
+
+    if bulk_mode:
+        bulk_editor(
+            store, "entries_bulk",
+            column_config={
+                "mode": st.column_config.SelectboxColumn("Modus", options=["cart", "dir"], default="cart", required=True),
+                "force": st.column_config.NumberColumn("Kracht N", min_value=0.0, default=0.0),
+                "x": st.column_config.NumberColumn("X", default=0.0),
+                "y": st.column_config.NumberColumn("Y", default=0.0),
+                "z": st.column_config.NumberColumn("Z", default=0.0),
+                "alpha": st.column_config.NumberColumn("α°", default=0.0),
+                "beta": st.column_config.NumberColumn("β°", default=0.0),
+                "gamma": st.column_config.NumberColumn("γ°", default=0.0),
+                "color": st.column_config.TextColumn("Kleur", validate=HEX_COLOR_RE),
+                "px": st.column_config.NumberColumn("Px", default=0.0),
+                "py": st.column_config.NumberColumn("Py", default=0.0),
+                "pz": st.column_config.NumberColumn("Pz", default=0.0),
+            },
+            visible=["mode", "force", "x", "y", "z", "alpha", "beta", "gamma", "color", "px", "py", "pz"],
+            palette=COLOR_PALETTE,
         )
-    with cols[1]:
-        force = st.number_input(f"Kracht N {i+1}", value=float(ent.get("force",0.0)), min_value=0.0, key=f"force_{i}")
-
-    if mode == "cart":
-        with cols[2]:
-            x = st.number_input(f"X{i+1}", value=float(ent.get("x",0.0)), key=f"x_{i}")
-        with cols[3]:
-            y = st.number_input(f"Y{i+1}", value=float(ent.get("y",0.0)), key=f"y_{i}")
-        with cols[4]:
-            z = st.number_input(f"Z{i+1}", value=float(ent.get("z",0.0)), key=f"z_{i}")
-        with cols[5]:
-            color = st.color_picker(f"Kleur {i+1}", value=ent.get("color",COLOR_PALETTE[i%len(COLOR_PALETTE)]), key=f"color_{i}")
-        with cols[6]:
-            delete_clicked = st.button("🗑️", key=f"del_{i}")
-
-        # --- Hybride: β + Y ⇒ α & X (optioneel Z=0 of opgegeven) ---
-        with st.expander(f"Hybride opties (β + Y ⇒ α & X) · Vector {i+1}"):
-            hyb_enable = st.checkbox("Gebruik β° en Y om α en X af te leiden (neem Z=0 tenzij hieronder opgegeven)", value=ent.get("hyb_enable", False), key=f"hyb_enable_{i}")
-            c1, c2, c3, c4 = st.columns([1.1,1.1,1.1,1.1])
-            with c1:
-                hyb_beta = st.number_input(f"β° hyb {i+1}", value=float(ent.get("hyb_beta", 0.0)), key=f"hyb_beta_{i}")
-            with c2:
-                hyb_use_z = st.checkbox("Z opgegeven", value=ent.get("hyb_use_z", False), key=f"hyb_use_z_{i}")
-            with c3:
-                hyb_z = st.number_input(f"Z hyb {i+1}", value=float(ent.get("hyb_z", 0.0)), key=f"hyb_z_{i}")
-            with c4:
-                hyb_xsign = st.selectbox("Teken X", ["+","-"], index=0 if ent.get("hyb_xsign","+")=="+" else 1, key=f"hyb_xsign_{i}")
-
-        # Bereken X (en daarmee α) vanuit β en Y indien geactiveerd
-        if hyb_enable:
-            cb = math.cos(math.radians(hyb_beta))
-            if abs(cb) < 1e-12:
-                st.warning(f"Vector {i+1}: β=90° maakt Y=F·cosβ nul; kan α/X niet afleiden.")
+        st.caption("Tabelmodus: cart gebruikt X/Y/Z (optioneel geschaald naar Kracht), dir gebruikt Kracht + α/β/γ. "
+                   "Px/Py/Pz is het aangrijpingspunt (leeg = oorsprong). Hybride opties staan in de modus 'Per rij'.")
+    else:
+        reset_bulk_editor("entries_bulk")
+        if st.button("➕ Voeg rij toe"):
+            color = COLOR_PALETTE[st.session_state.color_index % len(COLOR_PALETTE)]
+            store.append(color=color)
+            st.session_state.color_index += 1
+
+        # Widget-sleutels per stabiel rij-ID: verwijderen verschuift de overige rijen niet
+        deleted = []
+        for i, rid in enumerate(store.ids.tolist()):
+            ent = store.row(i)
+            cols = st.columns([1.4, 1.8, 1.6, 1.6, 1.6, 1.8, 0.8], gap="small")
+            with cols[0]:
+                mode = st.selectbox(
+                    f"Modus {i+1}",
+                    ["cart", "dir"],
+                    index=0 if ent["mode"]=="cart" else 1,
+                    key=f"mode_{rid}",
+                )
+            with cols[1]:
+                force = st.number_input(f"Kracht N {i+1}", value=float(ent.get("force",0.0)), min_value=0.0, key=f"force_{rid}")
+
+            if mode == "cart":
+                with cols[2]:
+                    x = st.number_input(f"X{i+1}", value=float(ent.get("x",0.0)), key=f"x_{rid}")
+                with cols[3]:
+                    y = st.number_input(f"Y{i+1}", value=float(ent.get("y",0.0)), key=f"y_{rid}")
+                with cols[4]:
+                    z = st.number_input(f"Z{i+1}", value=float(ent.get("z",0.0)), key=f"z_{rid}")
+                with cols[5]:
+                    color = st.color_picker(f"Kleur {i+1}", value=ent.get("color",COLOR_PALETTE[i%len(COLOR_PALETTE)]), key=f"color_{rid}")
+                with cols[6]:
+                    delete_clicked = st.button("🗑️", key=f"del_{rid}")
+
+                # --- Hybride: β + Y ⇒ α & X (optioneel Z=0 of opgegeven) ---
+                with st.expander(f"Hybride opties (β + Y ⇒ α & X) · Vector {i+1}"):
+                    hyb_enable = st.checkbox("Gebruik β° en Y om α en X af te leiden (neem Z=0 tenzij hieronder opgegeven)", value=ent.get("hyb_enable", False), key=f"hyb_enable_{rid}")
+                    c1, c2, c3, c4 = st.columns([1.1,1.1,1.1,1.1])
+                    with c1:
+                        hyb_beta = st.number_input(f"β° hyb {i+1}", value=float(ent.get("hyb_beta", 0.0)), key=f"hyb_beta_{rid}")
+                    with c2:
+                        hyb_use_z = st.checkbox("Z opgegeven", value=ent.get("hyb_use_z", False), key=f"hyb_use_z_{rid}")
+                    with c3:
+                        hyb_z = st.number_input(f"Z hyb {i+1}", value=float(ent.get("hyb_z", 0.0)), key=f"hyb_z_{rid}")
+                    with c4:
+                        hyb_xsign = st.selectbox("Teken X", ["+","-"], index=0 if ent.get("hyb_xsign","+")=="+" else 1, key=f"hyb_xsign_{rid}")
+
+                # Bereken X (en daarmee α) vanuit β en Y indien geactiveerd
+                if hyb_enable:
+                    cb = math.cos(math.radians(hyb_beta))
+                    if abs(cb) < 1e-12:
+                        st.warning(f"Vector {i+1}: β=90° maakt Y=F·cosβ nul; kan α/X niet afleiden.")
+                    else:
+                        # Neem F = Y / cosβ (kan negatief zijn als Y en cosβ tegengesteld teken hebben)
+                        F_est = y / cb
+                        z_eff = hyb_z if hyb_use_z else 0.0
+                        rest = F_est*F_est - y*y - z_eff*z_eff
+                        if rest < -1e-9:
+                            st.error(f"Vector {i+1}: Combinatie β={hyb_beta:.2f}°, Y={y:.2f}, Z={z_eff:.2f} is onmogelijk (|F|^2 < Y^2+Z^2).")
+                        else:
+                            # numerieke ruis klemmen
+                            rest = max(0.0, rest)
+                            x_est = math.sqrt(rest)
+                            if hyb_xsign == "-":
+                                x_est = -x_est
+                            x, z = x_est, (z_eff if hyb_use_z else z)
+
+                point = point_inputs(i, rid, ent)
+                if delete_clicked:
+                    deleted.append(i)
+                else:
+                    store.update(i, {"mode":"cart","force":force,"x":x,"y":y,"z":z,"color":color,
+                                     "hyb_enable": hyb_enable, "hyb_beta": hyb_beta, "hyb_use_z": hyb_use_z, "hyb_z": hyb_z, "hyb_xsign": hyb_xsign,
+                                     **point})
+
             else:
-                # Neem F = Y / cosβ (kan negatief zijn als Y en cosβ tegengesteld teken hebben)
-                F_est = y / cb
-                z_eff = hyb_z if hyb_use_z else 0.0
-                rest = F_est*F_est - y*y - z_eff*z_eff
-                if rest < -1e-9:
-                    st.error(f"Vector {i+1}: Combinatie β={hyb_beta:.2f}°, Y={y:.2f}, Z={z_eff:.2f} is onmogelijk (|F|^2 < Y^2+Z^2).")
+                with cols[2]:
+                    alpha = st.number_input(f"α°{i+1}", value=float(ent.get("alpha",0.0)), key=f"alpha_{rid}")
+                with cols[3]:
+                    beta = st.number_input(f"β°{i+1}", value=float(ent.get("beta",0.0)), key=f"beta_{rid}")
+                with cols[4]:
+                    gamma = st.number_input(f"γ°{i+1}", value=float(ent.get("gamma",0.0)), key=f"gamma_{rid}")
+                with cols[5]:
+                    color = st.color_picker(f"Kleur {i+1}", value=ent.get("color",COLOR_PALETTE[i%len(COLOR_PALETTE)]), key=f"color_{rid}")
+                with cols[6]:
+                    delete_clicked = st.button("🗑️", key=f"del_{rid}")
+                point = point_inputs(i, rid, ent)
+                if delete_clicked:
+                    deleted.append(i)
                 else:
-                    # numerieke ruis klemmen
-                    rest = max(0.0, rest)
-                    x_est = math.sqrt(rest)
-                    if hyb_xsign == "-":
-                        x_est = -x_est
-                    x, z = x_est, (z_eff if hyb_use_z else z)
-
-        if not delete_clicked:
-            new_entries.append({
-                "mode":"cart","force":force,"x":x,"y":y,"z":z,
-                "alpha":0.0,"beta":0.0,"gamma":0.0,"color":color,
-                "hyb_enable": hyb_enable, "hyb_beta": hyb_beta, "hyb_use_z": hyb_use_z, "hyb_z": hyb_z, "hyb_xsign": hyb_xsign
-            })
+                    store.update(i, {"mode":"dir","force":force,"alpha":alpha,"beta":beta,"gamma":gamma,"color":color, **point})
+        store.delete(deleted)
 
-    else:
-        with cols[2]:
-            alpha = st.number_input(f"α°{i+1}", value=float(ent.get("alpha",0.0)), key=f"alpha_{i}")
-        with cols[3]:
-            beta = st.number_input(f"β°{i+1}", value=float(ent.get("beta",0.0)), key=f"beta_{i}")
-        with cols[4]:
-            gamma = st.number_input(f"γ°{i+1}", value=float(ent.get("gamma",0.0)), key=f"gamma_{i}")
-        with cols[5]:
-            color = st.color_picker(f"Kleur {i+1}", value=ent.get("color",COLOR_PALETTE[i%len(COLOR_PALETTE)]), key=f"color_{i}")
-        with cols[6]:
-            delete_clicked = st.button("🗑️", key=f"del_{i}")
-        if not delete_clicked:
-            new_entries.append({"mode":"dir","force":force,"x":0.0,"y":0.0,"z":0.0,
-                                "alpha":alpha,"beta":beta,"gamma":gamma,"color":color,
-                                "hyb_enable": ent.get("hyb_enable", False), "hyb_beta": ent.get("hyb_beta",0.0),
-                                "hyb_use_z": ent.get("hyb_use_z", False), "hyb_z": ent.get("hyb_z",0.0), "hyb_xsign": ent.get("hyb_xsign","+")})
-
-st.session_state.entries = new_entries
+    with st.expander("📂 Importeren uit bestand"):
+        st.caption("Kolommen: `x,y,z` (optioneel `force`) of `force,alpha,beta,gamma`; optioneel `mode` (cart/dir), `color` en aangrijpingspunt `px,py,pz`.")
+        import_widget("3d", "import_3d")
+
+    # Alleen bij gewijzigde invoer de hele pagina herberekenen
+    if store.version != before:
+        st.rerun()
+
+with prof.phase("invoer"):
+    input_grid()
 
 # ===================================
-# Plot
+# Berekening (alleen bij volledige rerun, gecachet per scenario)
 # ===================================
-def is_blank(ent):
-    if ent["mode"] == "cart":
-        return (ent.get("force") or 0) <= 0 and vec_norm(ent.get("x",0.0),ent.get("y",0.0),ent.get("z",0.0)) <= 0
-    else:
-        return (ent.get("force") or 0) <= 0
-
-usable_entries = [e for e in st.session_state.entries if not is_blank(e)]
-vectors = [entry_to_cart(ent, normalize_dircos=normalize_dircos) for ent in usable_entries]
-colors  = [ent.get("color",COLOR_PALETTE[i%len(COLOR_PALETTE)]) for i,ent in enumerate(usable_entries)]
+@st.cache_data(max_entries=SCENE_CACHE_ENTRIES, show_spinner=False)
+def compute_scene(scene_key, _entries, _imported, normalize_dircos):
+    """Eén gevectoriseerde conversie per scenario; plot, tabel en uitleg hergebruiken deze arrays."""
+    store = _entries
+    # Lege rijen (geen kracht en, bij cart, ook geen componenten) tellen niet mee
+    blank = (store.col("force") <= 0) & (store.is_("mode", "dir") | ~store.stack("x", "y", "z").any(axis=1))
+    usable = np.flatnonzero(~blank)
+    vectors = entries_to_cart(store, normalize_dircos=normalize_dircos)[usable]
+    points  = store.stack("px", "py", "pz")[usable]
+    colors  = store.col("color")[usable].tolist()
+    n_manual = len(vectors)
+    if _imported is not None:
+        imp_vectors = table_to_cart(_imported, normalize_dircos=normalize_dircos)
+        keep = np.abs(imp_vectors).sum(axis=1) > 0
+        vectors = np.vstack([vectors, imp_vectors[keep]])
+        points = np.vstack([points, table_points(_imported, 3)[keep]])
+        colors += np.asarray(table_colors(_imported, COLOR_PALETTE[0]), dtype=object)[keep].tolist()
+    return usable, vectors, points, colors, n_manual, resultant(vectors)
+
+imported = imported_columns("import_3d")
+scene_key = scenario_hash(st.session_state.entries, imported, normalize_dircos)
+with prof.phase("berekening"):
+    usable, vectors, points, colors, n_manual, R = compute_scene(scene_key, st.session_state.entries, imported, normalize_dircos)
+    # Kracht-koppelstelsel in A en de centrale as: één gevectoriseerde stap over alle krachten
+    _, M_A = force_couple(points, vectors, about)
+    axis = line_of_action(R, M_A, about) if len(vectors) else None
 
 with st.sidebar:
-    st.markdown("---")
     st.caption(f"Aantal getekende vectoren: **{len(vectors)}**")
 
-fig = go.Figure()
-xs, ys, zs = [], [], []
-for i, ((x, y, z), color) in enumerate(zip(vectors, colors), start=1):
-    add_arrow(fig, x, y, z, color, linewidth, markersize, show_points, draw_arrowheads, f"Vector {i}")
-    xs += [0, x]; ys += [0, y]; zs += [0, z]
-
-# Resultante vector optioneel
-Rx = Ry = Rz = 0.0
-if vectors and show_resultant:
-    Rx = sum(x for x,y,z in vectors)
-    Ry = sum(y for x,y,z in vectors)
-    Rz = sum(z for x,y,z in vectors)
-    add_arrow(fig, Rx, Ry, Rz, resultant_color, linewidth+2, markersize+2, show_points, draw_arrowheads, "Resultante")
-
-# Asbereiken
-if xs and ys and zs:
-    if show_resultant and (Rx or Ry or Rz):
-        xs += [0, Rx]; ys += [0, Ry]; zs += [0, Rz]
-    if autoscale:
-        xr = pad_range(xs); yr = pad_range(ys); zr = pad_range(zs)
+# ===================================
+# Plot (fragment: weergave-opties in de sidebar herlopen alleen de figuur)
+# ===================================
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def build_figure(scene_key, _vectors, _points, _colors, _R, resultant_color, moment, style):
+    """Plotly-figuur per (scenario, momentpunt, weergave); wordt na het bouwen niet meer aangepast en dus gedeeld.
+
+    `moment` = (A, M_A, as) met as = (P₀, richting) van de centrale as, of None bij R = 0.
+    """
+    vectors, points, colors = _vectors, _points, _colors
+    about, M_A, axis = moment
+    Rx, Ry, Rz = _R.tolist()
+    linewidth, markersize = style["linewidth"], style["markersize"]
+    show_points, draw_arrowheads = style["show_points"], style["draw_arrowheads"]
+    fig = go.Figure()
+    if style["lod"]:
+        # Level-of-detail: top-K los, de rest per richtingsvak opgeteld in het |F|-gewogen aangrijpingspunt
+        # (resultante blijft exact over alle vectoren)
+        top, bins, counts, bin_at = lod_reduce(vectors, style["lod_k"], style["lod_lat_bins"], box=style["ranges"], origins=points)
+        add_arrows3d_batched(fig, vectors[top], [colors[i] for i in top], linewidth, markersize, show_points,
+                             draw_arrowheads, label=f"Top {len(top)}", names=[f"Vector {i+1}" for i in top.tolist()],
+                             origins=points[top])
+        add_arrows3d_batched(fig, bins, [LOD_COLOR] * len(bins), max(1, linewidth - 2), markersize, show_points,
+                             draw_arrowheads, legendgroup="bundels", label=f"Gebundeld ({int(counts.sum())} vectoren)",
+                             names=[f"Bundel (n={c})" for c in counts.tolist()], origins=bin_at)
+        drawn = np.vstack([points[top], points[top] + vectors[top], bin_at, bin_at + bins])
+    elif len(vectors) >= style["batch_threshold"]:
+        add_arrows3d_batched(fig, vectors, colors, linewidth, markersize, show_points, draw_arrowheads, origins=points)
+        drawn = np.vstack([points, points + vectors])
     else:
-        xr, yr, zr = (xmin, xmax), (ymin, ymax), (zmin, zmax)
-else:
-    xr, yr, zr = (-1, 1), (-1, 1), (-1, 1)
-
-# Oorsprong-assen (optioneel met labels)
-if show_origin_axes:
-    add_origin_axes(fig, xr, yr, zr, color=origin_axes_color, width=origin_axes_width, with_labels=show_origin_axis_labels)
-
-# As layout toggles
-def axis_cfg(title):
-    if hide_xyz_axes:
-        return dict(visible=False)
-    return dict(
-        title=title,
-        range=[xr[0], xr[1]] if title=="X" else ([yr[0], yr[1]] if title=="Y" else [zr[0], zr[1]]),
-        showticklabels=show_axis_numbers,
-        showgrid=show_grid
-    )
-
-fig.update_layout(
-    scene=dict(
-        xaxis=axis_cfg("X"),
-        yaxis=axis_cfg("Y"),
-        zaxis=axis_cfg("Z"),
-        aspectmode="cube",
-    ),
-    margin=dict(l=0, r=0, t=40, b=0),
-    legend=dict(orientation="h", yanchor="top", y=1.12, xanchor="left", x=0.0)
-)
+        for i, ((x, y, z), color, p) in enumerate(zip(vectors.tolist(), colors, points.tolist()), start=1):
+            add_arrow(fig, x, y, z, color, linewidth, markersize, show_points, draw_arrowheads, f"Vector {i}", origin=p)
+        drawn = np.vstack([points, points + vectors])
+
+    # Resultante optioneel, op de centrale as (door P₀); zonder as (R = 0) vanuit de oorsprong
+    R_at = (0.0, 0.0, 0.0) if axis is None else axis[0]
+    if len(vectors) and style["show_resultant"]:
+        add_arrow(fig, Rx, Ry, Rz, resultant_color, linewidth+2, markersize+2, show_points, draw_arrowheads, "Resultante",
+                  origin=R_at)
+
+    # Asbereiken
+    if len(vectors):
+        pts = np.vstack([np.zeros((1, 3)), drawn, [about]])
+        if style["show_resultant"] and (Rx or Ry or Rz):
+            pts = np.vstack([pts, R_at, np.add(R_at, [Rx, Ry, Rz])])
+        if style["ranges"] is None:
+            xr = pad_range(pts[:, 0]); yr = pad_range(pts[:, 1]); zr = pad_range(pts[:, 2])
+        else:
+            xr, yr, zr = style["ranges"]
+    else:
+        xr, yr, zr = (-1, 1), (-1, 1), (-1, 1)
+
+    # Centrale as van het stelsel en het moment in A (richting; lengte op schaal van de figuur)
+    if len(vectors):
+        span = max(xr[1] - xr[0], yr[1] - yr[0], zr[1] - zr[0])
+        if style["show_line"] and axis is not None:
+            p0, u = np.asarray(axis[0]), np.asarray(axis[1])
+            a, b = p0 - span * u, p0 + span * u
+            fig.add_trace(go.Scatter3d(x=[a[0], b[0]], y=[a[1], b[1]], z=[a[2], b[2]], mode="lines",
+                                       line=dict(color=resultant_color, width=2, dash="dash"), name="Centrale as"))
+        M_mag = float(vec_norm(M_A))
+        if style["show_moment"] and M_mag > EPS:
+            m = np.asarray(M_A) / M_mag * 0.25 * span
+            add_arrow(fig, *m.tolist(), MOMENT_COLOR, linewidth, markersize, show_points, draw_arrowheads,
+                      f"M_A = {M_mag:.2f} N·m (richting)", origin=about)
+        fig.add_trace(go.Scatter3d(x=[about[0]], y=[about[1]], z=[about[2]], mode="markers+text", text=["A"],
+                                   marker=dict(size=4, color="#424242"), name="Momentpunt A"))
+
+    # Oorsprong-assen (optioneel met labels)
+    if style["show_origin_axes"]:
+        add_origin_axes(fig, xr, yr, zr, color=style["origin_axes_color"], width=style["origin_axes_width"],
+                        with_labels=style["show_origin_axis_labels"])
+
+    # As layout toggles
+    def axis_cfg(title):
+        if style["hide_xyz_axes"]:
+            return dict(visible=False)
+        return dict(
+            title=title,
+            range=[xr[0], xr[1]] if title=="X" else ([yr[0], yr[1]] if title=="Y" else [zr[0], zr[1]]),
+            showticklabels=style["show_axis_numbers"],
+            showgrid=style["show_grid"]
+        )
 
-st.markdown("## Interactieve 3D Vectoren")
-st.plotly_chart(fig, use_container_width=True)
+    fig.update_layout(
+        scene=dict(
+            xaxis=axis_cfg("X"),
+            yaxis=axis_cfg("Y"),
+            zaxis=axis_cfg("Z"),
+            aspectmode="cube",
+        ),
+        margin=dict(l=0, r=0, t=40, b=0),
+        legend=dict(orientation="h", yanchor="top", y=1.12, xanchor="left", x=0.0)
+    )
+    return fig
+
+@st.fragment
+def plot_section(scene_key, vectors, points, colors, R, moment):
+    with st.sidebar:
+        st.markdown("---")
+        st.subheader("Weergave")
+        style = dict(
+            draw_arrowheads=st.checkbox("Pijlkoppen tonen", value=True),
+            show_points=st.checkbox("Eindpunten tonen", value=True),
+            linewidth=st.slider("Lijndikte", 1, 12, 6),
+            markersize=st.slider("Marker grootte", 1, 12, 5),
+        )
+        autoscale = st.checkbox("Autoschaal assen", value=True)
+        style["show_resultant"] = st.checkbox("Toon resultante vector in 3D", value=True)
+        style["show_line"] = st.checkbox("Toon centrale as (werklijn resultante)", value=True, key="show_line_3d")
+        style["show_moment"] = st.checkbox("Toon moment M_A (richting)", value=True, key="show_moment_3d")
+        style["batch_threshold"] = st.number_input("Gebatcht tekenen vanaf (aantal vectoren)", min_value=1, value=BATCH_THRESHOLD_3D, step=10,
+                                                   help="Boven dit aantal worden alle vectoren in één schacht-trace en één pijlkop-trace getekend.")
+        style["lod"] = st.toggle("Level-of-detail (LOD)", value=len(vectors) >= LOD_THRESHOLD, key="lod_on",
+                                 help="Toon alleen de K grootste vectoren los; de rest wordt per richting gebundeld. "
+                                      "De resultante en de tabel blijven exact over alle vectoren.")
+        style["lod_k"], style["lod_lat_bins"] = LOD_TOP_K, LOD_LAT_BINS
+        if style["lod"]:
+            style["lod_k"] = st.slider("Aantal losse vectoren (K)", 10, 5000, LOD_TOP_K, step=10, key="lod_k")
+            style["lod_lat_bins"] = st.slider("Richtingsresolutie bundels (banden)", 2, 36, LOD_LAT_BINS, key="lod_lat_bins",
+                                              help="Bolrooster van banden × 2·banden richtingsvakken.")
+            st.caption("Verfijnen: verhoog K of de resolutie, of zet 'Autoschaal assen' uit om in te zoomen; "
+                       "dan komen alleen vectoren binnen het kader in aanmerking voor de top-K.")
+
+        st.markdown("---")
+        # Nieuw: assen door oorsprong + opties
+        style["show_origin_axes"] = st.checkbox("Toon assen door oorsprong (X/Y/Z)", value=True)
+        style["origin_axes_color"] = st.color_picker("Kleur assen (0,0,0)", value="#9e9e9e")
+        style["origin_axes_width"] = st.slider("Lijndikte assen (0,0,0)", 1, 8, 2)
+        style["show_origin_axis_labels"] = st.checkbox("Toon labels bij oorsprong-assen (X/Y/Z)", value=True)
+
+        st.markdown("---")
+        # Nieuw: grid/titels/assen
+        style["show_axis_numbers"] = st.checkbox("Toon as-getallen (ticks)", value=True)
+        style["show_grid"] = st.checkbox("Toon rasterlijnen (grid)", value=True)
+        style["hide_xyz_axes"] = st.checkbox("Verberg X/Y/Z-assen (alles van Plotly-assen)", value=False)
+
+        style["ranges"] = None
+        if not autoscale:
+            st.markdown("---")
+            st.caption("As-bereiken")
+            xmin = st.number_input("Xmin", value=-10.0)
+            xmax = st.number_input("Xmax", value=10.0)
+            ymin = st.number_input("Ymin", value=-10.0)
+            ymax = st.number_input("Ymax", value=10.0)
+            zmin = st.number_input("Zmin", value=-10.0)
+            zmax = st.number_input("Zmax", value=10.0)
+            style["ranges"] = ((xmin, xmax), (ymin, ymax), (zmin, zmax))
+
+    st.markdown("## Interactieve 3D Vectoren")
+    with prof.phase("figuur bouwen"):
+        fig = build_figure(scene_key, vectors, points, colors, R, resultant_color, moment, style)
+    with prof.phase("plotly_chart"):
+        st.plotly_chart(fig, width="stretch")
+
+# Lege pagina: geen figuur of tabel bouwen (en dus ook pandas/Plotly-figuren niet laden)
+if len(vectors):
+    # Hashbaar: het momentpunt en de as horen bij de cachesleutel van de figuur
+    moment = (about, tuple(M_A.tolist()),
+              None if axis is None else (tuple(axis[0].tolist()), tuple(axis[1].tolist())))
+    plot_section(scene_key, vectors, points, colors, R, moment)
+else:
+    st.info("Nog geen vectoren: vul hierboven een vector in (of importeer een bestand) voor de 3D-weergave en de tabel.")
 
 # ===================================
-# Resultaten onder de plot
+# Resultaten onder de plot (fragmenten: tabel en uitleg herlopen los van elkaar)
 # ===================================
-if vectors:
-    rows = []
-    for i, ((x,y,z), color) in enumerate(zip(vectors, colors), start=1):
-        a, b, g, mag = cart_to_alpha_beta_gamma(x, y, z)
-        rows.append({
-            "Vector": f"{i}",
-            "X": round(x,2), "Y": round(y,2), "Z": round(z,2),
-            "Kracht / |v| (N)": round(mag,2),
-            "α (°) vanaf x-as": None if a is None else round(a,2),
-            "β (°) vanaf y-as": None if b is None else round(b,2),
-            "γ (°) vanaf z-as": None if g is None else round(g,2),
-            "Kleur": color
-        })
-
-    Rx = sum(x for x,y,z in vectors)
-    Ry = sum(y for x,y,z in vectors)
-    Rz = sum(z for x,y,z in vectors)
-    Ra, Rb, Rg, Rmag = cart_to_alpha_beta_gamma(Rx, Ry, Rz)
-    rows.append({
-        "Vector": "Resultante",
-        "X": round(Rx,2), "Y": round(Ry,2), "Z": round(Rz,2),
-        "Kracht / |v| (N)": round(Rmag,2),
-        "α (°) vanaf x-as": None if Ra is None else round(Ra,2),
-        "β (°) vanaf y-as": None if Rb is None else round(Rb,2),
-        "γ (°) vanaf z-as": None if Rg is None else round(Rg,2),
-        "Kleur": resultant_color
-    })
-
-    st.markdown("### Resultaten")
-    st.dataframe(pd.DataFrame(rows), use_container_width=True)
-
-    st.markdown("### Uitleg (stap voor stap)")
-    desc = []
-    for i, ent in enumerate([e for e in st.session_state.entries if not is_blank(e)], start=1):
-        if ent["mode"] == "dir":
+def results_frame(rows, vectors, points, colors, R, resultant_color, about, M_A, R_at):
+    """Resultatentabel voor de vectoren in `rows` (slice) plus altijd de resultante-rij."""
+    import pandas as pd  # lazy: pandas pas laden bij de eerste tabel
+    n = len(vectors)
+    idx = np.arange(n)[rows]
+    vectors, points = vectors[rows], points[rows]
+    Rx, Ry, Rz = R.tolist()
+    angles, mags = cart_to_alpha_beta_gamma(vectors)
+    R_angles, R_mag = cart_to_alpha_beta_gamma(R)
+    # Resultante-rij: aangrijpingspunt op de centrale as (P₀), moment = totaal om A
+    P_R = (np.nan, np.nan, np.nan) if R_at is None else R_at
+    M = np.vstack([moments_about(points, vectors, about), M_A]) if len(vectors) else np.array([M_A], dtype=float)
+    return pd.DataFrame({
+        "Vector": [f"{i}" for i in (idx + 1).tolist()] + ["Resultante"],
+        "X": np.append(vectors[:, 0], Rx).round(2),
+        "Y": np.append(vectors[:, 1], Ry).round(2),
+        "Z": np.append(vectors[:, 2], Rz).round(2),
+        "Kracht / |v| (N)": np.append(mags, R_mag).round(2),
+        "α (°) vanaf x-as": np.append(angles[:, 0], R_angles[0, 0]).round(2),
+        "β (°) vanaf y-as": np.append(angles[:, 1], R_angles[0, 1]).round(2),
+        "γ (°) vanaf z-as": np.append(angles[:, 2], R_angles[0, 2]).round(2),
+        "Px": np.append(points[:, 0], P_R[0]).round(2),
+        "Py": np.append(points[:, 1], P_R[1]).round(2),
+        "Pz": np.append(points[:, 2], P_R[2]).round(2),
+        "Mx (N·m)": M[:, 0].round(2),
+        "My (N·m)": M[:, 1].round(2),
+        "Mz (N·m)": M[:, 2].round(2),
+        "Kleur": colors[rows] + [resultant_color],
+    }, index=np.append(idx, n))
+
+@st.cache_data(max_entries=TABLE_CACHE_ENTRIES, show_spinner=False)
+def results_table(scene_key, start, stop, _vectors, _points, _colors, _R, resultant_color, about, M_A, R_at):
+    """Alleen de rijen van de zichtbare pagina (gecachet per scenario en pagina)."""
+    return results_frame(slice(start, stop), _vectors, _points, _colors, _R, resultant_color, about, M_A, R_at)
+
+@st.fragment
+def results_section(scene_key, vectors, points, colors, R, resultant_color, about, M_A, R_at):
+    exp, is_open = lazy_section(f"📋 Resultaten ({len(vectors)} vectoren + resultante)", key="results_open_3d")
+    if not is_open:
+        return
+    args = (vectors, points, colors, R, resultant_color, about, M_A, R_at)
+    with exp:
+        sl = page_slice(len(vectors), key="results_page_3d")
+        st.dataframe(results_table(scene_key, sl.start, sl.stop, *args), width="stretch")
+        # Volledige tabel pas bij het downloaden
+        export_widget(lambda: results_frame(slice(None), *args), "vectoren_3d", key="export_3d")
+
+@st.fragment
+def explanation_section(entries, usable, vectors, points, n_manual, R, about, M_A, axis):
+    exp, is_open = lazy_section("📝 Uitleg (stap voor stap)", key="explain_open_3d")
+    if not is_open:
+        return
+    Rx, Ry, Rz = R.tolist()
+    R_angles, R_mag = cart_to_alpha_beta_gamma(R)
+    Ra, Rb, Rg = R_angles[0].tolist()
+    Rmag = float(R_mag[0])
+
+    with exp:
+        sl = page_slice(n_manual, key="explain_page_3d")
+        desc = []
+        # Alleen de zichtbare pagina uitschrijven
+        for i, (pos, (X, Y, Z)) in enumerate(zip(usable[sl].tolist(), vectors[sl].tolist()), start=sl.start+1):
+            ent = entries.row(pos)
             F = ent.get("force") or 0.0
-            a = ent.get("alpha",0.0); b = ent.get("beta",0.0); g = ent.get("gamma",0.0)
-            cx, cy, cz = math.cos(math.radians(a)), math.cos(math.radians(b)), math.cos(math.radians(g))
-            X = F * cx; Y = F * cy; Z = F * cz
-            desc.append(f"**Vector {i} (dir):** F={F:.2f} N, α={a:.2f}°, β={b:.2f}°, γ={g:.2f}° → X={X:.2f}, Y={Y:.2f}, Z={Z:.2f}")
-        else:
-            x0,y0,z0 = ent.get("x",0.0), ent.get("y",0.0), ent.get("z",0.0)
-            F = ent.get("force") or 0.0
-            base_mag = vec_norm(x0,y0,z0)
-            if F > 0 and base_mag > 1e-12:
-                s = F / base_mag
-                X, Y, Z = x0*s, y0*s, z0*s
-                desc.append(f"**Vector {i} (cart):** Basis=({x0:.2f},{y0:.2f},{z0:.2f}), F={F:.2f} N, s={s:.2f} → X={X:.2f}, Y={Y:.2f}, Z={Z:.2f}")
+            if ent["mode"] == "dir":
+                a = ent.get("alpha",0.0); b = ent.get("beta",0.0); g = ent.get("gamma",0.0)
+                desc.append(f"**Vector {i} (dir):** F={F:.2f} N, α={a:.2f}°, β={b:.2f}°, γ={g:.2f}° → X={X:.2f}, Y={Y:.2f}, Z={Z:.2f}")
             else:
-                extra = " (hybride toegepast)" if ent.get("hyb_enable", False) else ""
-                desc.append(f"**Vector {i} (cart):** Direct (X,Y,Z)=({x0:.2f},{y0:.2f},{z0:.2f}){extra}")
-    desc.append("**Som van componenten:**")
-    desc.append("Rx = " + " + ".join([f"{x:.2f}" for x,_,_ in vectors]) + f" = {Rx:.2f}")
-    desc.append("Ry = " + " + ".join([f"{y:.2f}" for _,y,_ in vectors]) + f" = {Ry:.2f}")
-    desc.append("Rz = " + " + ".join([f"{z:.2f}" for _,_,z in vectors]) + f" = {Rz:.2f}")
-    desc.append(f"**Resultante:** R=({Rx:.2f},{Ry:.2f},{Rz:.2f}), |R|={Rmag:.2f} N, hoeken: α={Ra:.2f}°, β={Rb:.2f}°, γ={Rg:.2f}°")
-    st.markdown("\n\n".join(desc))
+                x0,y0,z0 = ent.get("x",0.0), ent.get("y",0.0), ent.get("z",0.0)
+                base_mag = math.sqrt(x0*x0 + y0*y0 + z0*z0)
+                if F > 0 and base_mag > EPS:
+                    desc.append(f"**Vector {i} (cart):** Basis=({x0:.2f},{y0:.2f},{z0:.2f}), F={F:.2f} N, s={F/base_mag:.2f} → X={X:.2f}, Y={Y:.2f}, Z={Z:.2f}")
+                else:
+                    extra = " (hybride toegepast)" if ent.get("hyb_enable", False) else ""
+                    desc.append(f"**Vector {i} (cart):** Direct (X,Y,Z)=({x0:.2f},{y0:.2f},{z0:.2f}){extra}")
+        if len(vectors) > n_manual:
+            desc.append(f"**Vector {n_manual+1}–{len(vectors)}:** geïmporteerd uit bestand (componenten: zie tabel)")
+        desc.append("**Som van componenten:**")
+        desc.append(sum_line("Rx", vectors[:, 0].tolist(), Rx))
+        desc.append(sum_line("Ry", vectors[:, 1].tolist(), Ry))
+        desc.append(sum_line("Rz", vectors[:, 2].tolist(), Rz))
+        desc.append(f"**Resultante:** R=({Rx:.2f},{Ry:.2f},{Rz:.2f}), |R|={Rmag:.2f} N, hoeken: α={Ra:.2f}°, β={Rb:.2f}°, γ={Rg:.2f}°")
+        ax, ay, az = about
+        Mx, My, Mz = M_A.tolist()
+        desc.append(f"**Moment om A=({ax:.2f},{ay:.2f},{az:.2f}):** M_i = (P_i − A) × F_i, opgeteld per component:")
+        M = moments_about(points, vectors, about)
+        desc.append(sum_line("Mx", M[:, 0].tolist(), Mx))
+        desc.append(sum_line("My", M[:, 1].tolist(), My))
+        desc.append(sum_line("Mz", M[:, 2].tolist(), Mz))
+        if axis is None:
+            desc.append(f"R = 0: het stelsel is een zuiver koppel M=({Mx:.2f},{My:.2f},{Mz:.2f}) N·m (gelijk om elk punt).")
+        else:
+            p0, _, M_par = axis
+            desc.append(f"**Centrale as:** door P₀ = A + (R × M_A)/|R|² = ({p0[0]:.2f},{p0[1]:.2f},{p0[2]:.2f}), "
+                        f"richting R; koppel langs de as M∥ = (R·M_A)/|R|²·R = "
+                        f"({M_par[0]:.2f},{M_par[1]:.2f},{M_par[2]:.2f}) N·m.")
+        st.markdown("\n\n".join(desc))
+
+def moment_summary(R, M_A, about, axis):
+    """Equivalent kracht-koppelstelsel in A, de centrale as en het resterende koppel langs die as."""
+    st.markdown("### ⟲ Moment en kracht-koppelstelsel")
+    Rx, Ry, Rz = R.tolist()
+    Mx, My, Mz = M_A.tolist()
+    st.write(f"In **A = ({about[0]:.2f}, {about[1]:.2f}, {about[2]:.2f})**: **R = ({Rx:.2f}, {Ry:.2f}, {Rz:.2f}) N** "
+             f"en **M_A = ({Mx:.2f}, {My:.2f}, {Mz:.2f}) N·m**, |M_A| = {float(vec_norm(M_A)):.2f} N·m.")
+    if axis is None:
+        st.write("R = 0: zuiver koppel, zonder werklijn.")
+        return
+    p0, _, M_par = axis
+    where = f"**P₀ = ({p0[0]:.2f}, {p0[1]:.2f}, {p0[2]:.2f})**"
+    if reduces_to_single_force(R, M_A):
+        st.write(f"R ⊥ M_A: het stelsel is te herleiden tot één kracht R op de werklijn door {where}.")
+    else:
+        st.write(f"Het stelsel is niet te herleiden tot één kracht: R op de centrale as door {where} "
+                 f"plus een koppel langs die as M∥ = ({M_par[0]:.2f}, {M_par[1]:.2f}, {M_par[2]:.2f}) N·m.")
+
+if len(vectors):
+    moment_summary(R, M_A, about, axis)
+    with prof.phase("tabel"):
+        R_at = None if axis is None else tuple(axis[0].tolist())
+        results_section(scene_key, vectors, points, colors, R, resultant_color, about, tuple(M_A.tolist()), R_at)
+    with prof.phase("uitleg"):
+        explanation_section(st.session_state.entries, usable, vectors, points, n_manual, R, about, M_A, axis)
 
 st.markdown("---")
 st.caption("Hybride invoer: vink in cart-modus de expander aan. Vul β° en Y in; optioneel Z. Dan wordt α automatisch bepaald en X berekend (met gekozen teken). Assen door oorsprong, labels, rasterlijnen en zichtbaarheid van Plotly-assen kun je links instellen. Alle resultaten afgerond op 2 decimalen.")
+
+prof.report()
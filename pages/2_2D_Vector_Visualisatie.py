@@ -1,48 +1,41 @@
-import math
+import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
+
+from statica.vectors import resultant, xy_to_polar, entries2d_to_xy
+from statica.moments import force_couple, line_of_action, moments_about
+from statica.loads import LOAD_SHAPES, LOAD_TOL, loads_to_forces
+from statica.plotting import add_arrows2d_batched
+from statica.export import export_section
+from statica.editor import HEX_COLOR_RE, input_mode_radio, bulk_editor, reset_bulk_editor
+from statica.store import ENTRY2D_FIELDS, LOAD2D_FIELDS, VectorStore
+from statica.profiling import Profiler
+from statica.presets import preset_picker
+from statica.scenarios import scenario_section
+from statica.share import share_section
+from statica.paging import lazy_section, page_slice, sum_line
+from statica.cache import SCENE_CACHE_ENTRIES, TABLE_CACHE_ENTRIES, FIGURE_CACHE_ENTRIES, scenario_hash
+from statica.fileio import import_widget, imported_columns, export_widget, table_to_xy, table_colors, table_points
 
 # Sidebar zichtbaar
 st.set_page_config(page_title="🧭 2D Vector Visualisatie", layout="wide", initial_sidebar_state="expanded")
 st.title("🧭 2D Vector Visualisatie")
+prof = Profiler("2d")
+preset_picker("2d")
+share_section("2d")
+scenario_section("2d")
+export_section("2d")
 
 # ----------------------------
 # Helpers
 # ----------------------------
-def vec_norm2(x, y):
-    return math.sqrt(x*x + y*y)
-
-def angle_from_x_deg(x, y):
-    """Richtingshoek t.o.v. X-as ([-180,180])"""
-    if abs(x) < 1e-12 and abs(y) < 1e-12:
-        return None
-    return math.degrees(math.atan2(y, x))
-
 def pad_range(vals, pr=0.15):
-    vmin, vmax = min(vals), max(vals)
+    vmin, vmax = float(np.min(vals)), float(np.max(vals))
     if abs(vmax - vmin) < 1e-9:
         vmin -= 1.0; vmax += 1.0
     pad = (vmax - vmin) * pr
     return (vmin - pad, vmax + pad)
 
-def add_arrow2d(fig, x, y, color, linewidth, markersize, name, draw_arrowhead=True):
-    fig.add_trace(go.Scatter(
-        x=[0, x], y=[0, y],
-        mode="lines+markers",
-        line=dict(color=color, width=linewidth),
-        marker=dict(size=markersize, color=color),
-        name=name
-    ))
-    if draw_arrowhead and (abs(x) + abs(y) > 1e-12):
-        fig.add_annotation(
-            x=x, y=y, ax=0, ay=0,
-            xref="x", yref="y", axref="x", ayref="y",
-            showarrow=True, arrowhead=3, arrowsize=1.2,
-            arrowwidth=max(1, linewidth-1), arrowcolor=color,
-            opacity=0
-        )
-
 # Plotly default 10-kleuren
 COLOR_PALETTE = [
     "#1f77b4","#ff7f0e","#2ca02c","#d62728","#9467bd",
@@ -52,226 +45,441 @@ COLOR_PALETTE = [
 # ----------------------------
 # Session state
 # ----------------------------
+# Invoer kolomgewijs (statica.store): mode "cart" (x,y, optioneel geschaald naar force)
+# of "angle" (force + theta in graden t.o.v. ref "X-as"/"Y-as")
 if "entries2d" not in st.session_state:
-    st.session_state.entries2d = [{
-        "mode": "cart",      # "cart" of "angle"
-        "force": 0.0,        # optioneel: schaal de (x,y) naar F
-        "x": 0.0, "y": 0.0,  # gebruikt in cart
-        "theta": 0.0,        # graden
-        "ref": "X-as",       # "X-as" of "Y-as" (alleen voor angle)
-        "color": COLOR_PALETTE[0]
-    }]
+    st.session_state.entries2d = VectorStore(ENTRY2D_FIELDS, [{"color": COLOR_PALETTE[0]}])
 if "color_index_2d" not in st.session_state:
     st.session_state.color_index_2d = 1
+# Verdeelde lasten (statica.loads): per rij een profiel q(x) langs de X-as
+if "loads2d" not in st.session_state:
+    st.session_state.loads2d = VectorStore(LOAD2D_FIELDS)
 
 # ----------------------------
-# Sidebar
+# Sidebar (instellingen die de berekening raken)
 # ----------------------------
+# Startwaarden via session_state (deellinks zetten dezelfde sleutels)
+for _key, _value in (("resultant_color_2d", "#e41a1c"), ("moment_ax_2d", 0.0), ("moment_ay_2d", 0.0),
+                     ("load_discretize_2d", True), ("load_tol_2d", LOAD_TOL * 100)):
+    st.session_state.setdefault(_key, _value)
 with st.sidebar:
     st.header("Instellingen")
-    draw_arrowheads = st.checkbox("Pijlkoppen tonen", value=True)
-    linewidth = st.slider("Lijndikte", 1, 12, 4)
-    markersize = st.slider("Marker grootte", 1, 12, 6)
-    autoscale = st.checkbox("Autoschaal assen", value=True)
-    show_resultant = st.checkbox("Toon resultante vector", value=True)
-    resultant_color = st.color_picker("Kleur resultante", value="#e41a1c")
-
-    if not autoscale:
-        st.caption("As-bereiken")
-        xmin = st.number_input("Xmin", value=-10.0)
-        xmax = st.number_input("Xmax", value=10.0)
-        ymin = st.number_input("Ymin", value=-10.0)
-        ymax = st.number_input("Ymax", value=10.0)
-
-    st.markdown("---")
-    if st.button("🗑️ Verwijder alle vectoren"):
-        st.session_state.entries2d = [{
-            "mode":"cart","force":0.0,"x":0.0,"y":0.0,"theta":0.0,"ref":"X-as","color":COLOR_PALETTE[0]
-        }]
+    resultant_color = st.color_picker("Kleur resultante", key="resultant_color_2d")
+    st.caption("Momentpunt A (momenten tegen de klok in positief)")
+    c1, c2 = st.columns(2)
+    with c1:
+        ax = st.number_input("Ax", step=1.0, key="moment_ax_2d")
+    with c2:
+        ay = st.number_input("Ay", step=1.0, key="moment_ay_2d")
+    about = (float(ax), float(ay))
+    st.caption("Verdeelde lasten")
+    load_discretize = st.checkbox("Opdelen in puntkrachten", key="load_discretize_2d",
+                                  help="Uit: elke last wordt één kracht W in x̄. Aan: N puntkrachten, N adaptief gekozen.")
+    load_tol = st.number_input("Max. aandeel per puntkracht (%)", min_value=0.5, max_value=100.0, step=0.5,
+                               key="load_tol_2d", disabled=not load_discretize,
+                               help="N is het kleinste aantal waarbij geen puntkracht meer dan dit deel van ∫|q| dx draagt.")
+    if st.button("🗑️ Verwijder alle vectoren en lasten"):
+        st.session_state.entries2d.clear()
+        st.session_state.entries2d.append(color=COLOR_PALETTE[0])
         st.session_state.color_index_2d = 1
+        reset_bulk_editor("entries2d_bulk")
+        st.session_state.loads2d.clear()
+        reset_bulk_editor("loads2d_bulk")
 
 # ----------------------------
-# Invoer
+# Invoer (fragment: widgetinteracties herlopen alleen de invoer)
 # ----------------------------
-st.subheader("Vectoren invoeren (van oorsprong)")
-
-if st.button("➕ Voeg rij toe"):
-    color = COLOR_PALETTE[st.session_state.color_index_2d % len(COLOR_PALETTE)]
-    st.session_state.entries2d.append({
-        "mode":"cart","force":0.0,"x":0.0,"y":0.0,"theta":0.0,"ref":"X-as","color":color
-    })
-    st.session_state.color_index_2d += 1
-
-new_entries = []
-for i, ent in enumerate(st.session_state.entries2d):
-    cols = st.columns([1.1, 1.1, 1.2, 1.2, 1.3, 0.7], gap="small")
-    with cols[0]:
-        mode = st.selectbox(
-            f"Modus {i+1}",
-            ["cart", "angle"],  # cart: X,Y | angle: F, θ, ref
-            index=0 if ent["mode"]=="cart" else 1,
-            key=f"mode2d_{i}"
+st.subheader("Vectoren invoeren (met aangrijpingspunt)")
+
+@st.fragment
+def input_grid():
+    store = st.session_state.entries2d
+    before = store.version
+    bulk_mode = input_mode_radio(len(store), key="input_mode_2d")
+
+    if bulk_mode:
+        bulk_editor(
+            store, "entries2d_bulk",
+            column_config={
+                "mode": st.column_config.SelectboxColumn("Modus", options=["cart", "angle"], default="cart", required=True),
+                "force": st.column_config.NumberColumn("Kracht N", min_value=0.0, default=0.0),
+                "x": st.column_config.NumberColumn("X", default=0.0),
+                "y": st.column_config.NumberColumn("Y", default=0.0),
+                "theta": st.column_config.NumberColumn("θ°", default=0.0),
+                "ref": st.column_config.SelectboxColumn("Ref", options=["X-as", "Y-as"], default="X-as", required=True),
+                "color": st.column_config.TextColumn("Kleur", validate=HEX_COLOR_RE),
+                "px": st.column_config.NumberColumn("Px", default=0.0),
+                "py": st.column_config.NumberColumn("Py", default=0.0),
+            },
+            palette=COLOR_PALETTE,
         )
-    with cols[1]:
-        force = st.number_input(f"Kracht N {i+1}", value=float(ent["force"]), min_value=0.0, key=f"force2d_{i}")
-
-    if mode == "cart":
-        with cols[2]:
-            x = st.number_input(f"X{i+1}", value=float(ent["x"]), key=f"x2d_{i}")
-        with cols[3]:
-            y = st.number_input(f"Y{i+1}", value=float(ent["y"]), key=f"y2d_{i}")
-        with cols[4]:
-            color = st.color_picker(f"Kleur {i+1}", value=ent.get("color", COLOR_PALETTE[i % len(COLOR_PALETTE)]), key=f"color2d_{i}")
-        with cols[5]:
-            if st.button("🗑️", key=f"del2d_{i}"):
-                pass
-            else:
-                new_entries.append({
-                    "mode":"cart","force":force,"x":x,"y":y,
-                    "theta":0.0,"ref":"X-as","color":color
-                })
+        st.caption("Tabelmodus: cart gebruikt X/Y (optioneel geschaald naar Kracht), angle gebruikt Kracht + θ t.o.v. de gekozen referentie-as. "
+                   "Px/Py is het aangrijpingspunt (leeg = oorsprong).")
     else:
-        with cols[2]:
-            theta = st.number_input(f"θ°{i+1}", value=float(ent["theta"]), key=f"theta2d_{i}")
-        with cols[3]:
-            ref_axis = st.selectbox(
-                "Ref",
-                ["X-as", "Y-as"],
-                index=0 if ent.get("ref","X-as")=="X-as" else 1,
-                key=f"ref2d_{i}"
-            )
-        with cols[4]:
-            color = st.color_picker(f"Kleur {i+1}", value=ent.get("color", COLOR_PALETTE[i % len(COLOR_PALETTE)]), key=f"color2d_{i}")
-        with cols[5]:
-            if st.button("🗑️", key=f"del2d_{i}"):
-                pass
+        reset_bulk_editor("entries2d_bulk")
+        if st.button("➕ Voeg rij toe"):
+            color = COLOR_PALETTE[st.session_state.color_index_2d % len(COLOR_PALETTE)]
+            store.append(color=color)
+            st.session_state.color_index_2d += 1
+
+        # Widget-sleutels per stabiel rij-ID: verwijderen verschuift de overige rijen niet
+        deleted = []
+        for i, rid in enumerate(store.ids.tolist()):
+            ent = store.row(i)
+            cols = st.columns([1.1, 1.1, 1.2, 1.2, 1.3, 0.7], gap="small")
+            with cols[0]:
+                mode = st.selectbox(
+                    f"Modus {i+1}",
+                    ["cart", "angle"],  # cart: X,Y | angle: F, θ, ref
+                    index=0 if ent["mode"]=="cart" else 1,
+                    key=f"mode2d_{rid}"
+                )
+            with cols[1]:
+                force = st.number_input(f"Kracht N {i+1}", value=float(ent["force"]), min_value=0.0, key=f"force2d_{rid}")
+
+            if mode == "cart":
+                with cols[2]:
+                    x = st.number_input(f"X{i+1}", value=float(ent["x"]), key=f"x2d_{rid}")
+                with cols[3]:
+                    y = st.number_input(f"Y{i+1}", value=float(ent["y"]), key=f"y2d_{rid}")
+                with cols[4]:
+                    color = st.color_picker(f"Kleur {i+1}", value=ent.get("color", COLOR_PALETTE[i % len(COLOR_PALETTE)]), key=f"color2d_{rid}")
+                with cols[5]:
+                    delete_clicked = st.button("🗑️", key=f"del2d_{rid}")
+                values = {"mode":"cart","force":force,"x":x,"y":y,"color":color}
+            else:
+                with cols[2]:
+                    theta = st.number_input(f"θ°{i+1}", value=float(ent["theta"]), key=f"theta2d_{rid}")
+                with cols[3]:
+                    ref_axis = st.selectbox(
+                        "Ref",
+                        ["X-as", "Y-as"],
+                        index=0 if ent.get("ref","X-as")=="X-as" else 1,
+                        key=f"ref2d_{rid}"
+                    )
+                with cols[4]:
+                    color = st.color_picker(f"Kleur {i+1}", value=ent.get("color", COLOR_PALETTE[i % len(COLOR_PALETTE)]), key=f"color2d_{rid}")
+                with cols[5]:
+                    delete_clicked = st.button("🗑️", key=f"del2d_{rid}")
+                values = {"mode":"angle","force":force,"theta":theta,"ref":ref_axis,"color":color}
+
+            with st.expander(f"📍 Aangrijpingspunt · Vector {i+1}"):
+                c1, c2 = st.columns(2)
+                with c1:
+                    values["px"] = st.number_input(f"Px{i+1}", value=float(ent["px"]), key=f"px2d_{rid}")
+                with c2:
+                    values["py"] = st.number_input(f"Py{i+1}", value=float(ent["py"]), key=f"py2d_{rid}")
+            if delete_clicked:
+                deleted.append(i)
             else:
-                new_entries.append({
-                    "mode":"angle","force":force,"x":0.0,"y":0.0,
-                    "theta":theta,"ref":ref_axis,"color":color
-                })
+                store.update(i, values)
+        store.delete(deleted)
+
+    with st.expander("📂 Importeren uit bestand"):
+        st.caption("Kolommen: `x,y` (optioneel `force`) of `force,theta` (optioneel `ref` = X-as/Y-as); optioneel `mode` (cart/angle), `color` en aangrijpingspunt `px,py`.")
+        import_widget("2d", "import_2d")
+
+    # Alleen bij gewijzigde invoer de hele pagina herberekenen
+    if store.version != before:
+        st.rerun()
+
+@st.fragment
+def load_grid():
+    store = st.session_state.loads2d
+    before = store.version
+    # Editor (en daarmee pandas/pyarrow) alleen opbouwen als de sectie open is of er lasten zijn
+    exp, is_open = lazy_section("📏 Verdeelde belastingen q(x) langs de X-as", key="loads2d_open", expanded=len(store) > 0)
+    if is_open or len(store):
+        with exp:
+            bulk_editor(
+                store, "loads2d_bulk",
+                column_config={
+                    "shape": st.column_config.SelectboxColumn("Profiel", options=list(LOAD_SHAPES), default="uniform", required=True),
+                    "x0": st.column_config.NumberColumn("x₀", default=0.0),
+                    "x1": st.column_config.NumberColumn("x₁", default=1.0),
+                    "q0": st.column_config.NumberColumn("q₀ (N/m)", default=0.0),
+                    "q1": st.column_config.NumberColumn("q₁ (N/m)", default=0.0),
+                    "samples": st.column_config.TextColumn("Tabel x:q", help="Alleen bij profiel tabel, bijv. 0:0; 2:5; 4:3"),
+                    "theta": st.column_config.NumberColumn("Richting θ°", default=-90.0),
+                    "y": st.column_config.NumberColumn("Hoogte y", default=0.0),
+                    "color": st.column_config.TextColumn("Kleur", validate=HEX_COLOR_RE),
+                },
+                palette=COLOR_PALETTE,
+            )
+            st.caption("uniform: q₀ van x₀ tot x₁ · lineair: q₀ → q₁ · tabel: punten x:q met lineair verloop. "
+                       "q is positief in richting θ (−90° = naar beneden). Waar q van teken wisselt wordt een stuk in het "
+                       "nulpunt gesplitst, zodat resultante én moment van de puntkrachten exact gelijk zijn aan die "
+                       "van de verdeelde last.")
 
-st.session_state.entries2d = new_entries
+    if store.version != before:
+        st.rerun()
+
+with prof.phase("invoer"):
+    input_grid()
+    load_grid()
 
 # ----------------------------
-# Berekeningen
+# Berekeningen (alleen bij volledige rerun, gecachet per scenario)
 # ----------------------------
-vectors = []        # (x,y,color)
-explain_rows = []   # strings
-
-for ent in st.session_state.entries2d:
-    mode = ent["mode"]
-    F = ent["force"] or 0.0
-
-    if mode == "cart":
-        x0, y0 = ent["x"], ent["y"]
-        mag0 = vec_norm2(x0, y0)
-        if F > 0 and mag0 > 1e-12:
-            s = F / mag0
-            x, y = x0*s, y0*s
-            explain_rows.append(
-                f"**cart**: basis (x0,y0)=({x0:.2f},{y0:.2f}), F={F:.2f} → s=F/||v0||={F:.2f}/{mag0:.2f}={s:.2f} → X={x:.2f}, Y={y:.2f}"
-            )
-        else:
-            x, y = x0, y0
-            explain_rows.append(f"**cart**: direct (X,Y)=({x:.2f},{y:.2f})")
-
-    else:
-        theta = float(ent["theta"])
-        ref_axis = ent.get("ref", "X-as")
-        if ref_axis == "X-as":
-            x = F * math.cos(math.radians(theta))
-            y = F * math.sin(math.radians(theta))
-            explain_rows.append(
-                f"**angle-X**: F={F:.2f} N, θ={theta:.2f}° vanaf X → X=F·cosθ={x:.2f}, Y=F·sinθ={y:.2f}"
-            )
-        else:  # Y-as
-            # Hoek gemeten vanaf Y: componenten omgedraaid
-            x = F * math.sin(math.radians(theta))
-            y = F * math.cos(math.radians(theta))
-            explain_rows.append(
-                f"**angle-Y**: F={F:.2f} N, θ={theta:.2f}° vanaf Y → X=F·sinθ={x:.2f}, Y=F·cosθ={y:.2f}"
-            )
-
-    if abs(x) + abs(y) > 0:
-        vectors.append((x, y, ent["color"]))
+@st.cache_data(max_entries=SCENE_CACHE_ENTRIES, show_spinner=False)
+def compute_scene(scene_key, _entries, _imported, _loads, load_discretize, load_tol):
+    """Eén gevectoriseerde conversie per scenario; plot, tabel en uitleg hergebruiken deze arrays.
+
+    Volgorde van de krachten: invoer, import, dan de puntkrachten van de verdeelde lasten.
+    """
+    all_xy = entries2d_to_xy(_entries)
+    keep = np.abs(all_xy).sum(axis=1) > 0
+    vectors = all_xy[keep]
+    points = _entries.stack("px", "py")[keep]
+    colors = _entries.col("color")[keep].tolist()
+    n_imported = 0
+    if _imported is not None:
+        imp_xy = table_to_xy(_imported)
+        imp_keep = np.abs(imp_xy).sum(axis=1) > 0
+        vectors = np.vstack([vectors, imp_xy[imp_keep]])
+        points = np.vstack([points, table_points(_imported, 2)[imp_keep]])
+        colors += np.asarray(table_colors(_imported, COLOR_PALETTE[0]), dtype=object)[imp_keep].tolist()
+        n_imported = int(imp_keep.sum())
+    load_xy, load_points, load_colors, load_info = loads_to_forces(
+        _loads, load_discretize, load_tol / 100, default_color=COLOR_PALETTE[0])
+    vectors = np.vstack([vectors, load_xy])
+    points = np.vstack([points, load_points])
+    colors += load_colors
+    return all_xy, vectors, points, colors, n_imported, load_info, resultant(vectors)
+
+entries = st.session_state.entries2d
+loads = st.session_state.loads2d
+imported = imported_columns("import_2d")
+scene_key = scenario_hash(entries, imported, loads, load_discretize, load_tol)
+with prof.phase("berekening"):
+    all_xy, vectors, points, colors, n_imported, load_info, R = compute_scene(
+        scene_key, entries, imported, loads, load_discretize, load_tol)
+    for k, inf in enumerate(load_info, start=1):
+        if inf["error"]:
+            st.warning(f"Verdeelde last {k} genegeerd: {inf['error']}.")
+    # Kracht-koppelstelsel in A en werklijn van R: één gevectoriseerde stap over alle krachten
+    _, M_A = force_couple(points, vectors, about)
+    line = line_of_action(R, M_A, about) if len(vectors) else None
 
 # ----------------------------
-# Plot
+# Plot (fragment: weergave-opties in de sidebar herlopen alleen de figuur)
 # ----------------------------
-fig = go.Figure()
-xs, ys = [], []
-for i, (x, y, color) in enumerate(vectors, start=1):
-    add_arrow2d(fig, x, y, color, linewidth, markersize, f"Vector {i}", draw_arrowheads)
-    xs += [0, x]; ys += [0, y]
-
-Rx = Ry = 0.0
-if vectors:
-    Rx = sum(x for x, y, _ in vectors)
-    Ry = sum(y for x, y, _ in vectors)
-    if show_resultant:
-        add_arrow2d(fig, Rx, Ry, resultant_color, linewidth+1, markersize+2, "Resultante", True)
-        xs += [0, Rx]; ys += [0, Ry]
-
-if xs and ys:
-    if autoscale:
-        xr = pad_range(xs); yr = pad_range(ys)
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def build_figure(scene_key, _vectors, _points, _colors, _R, resultant_color, about, line, style):
+    """Plotly-figuur per (scenario, momentpunt, weergave); wordt na het bouwen niet meer aangepast en dus gedeeld.
+
+    `line` = (P₀, richting) van de werklijn van R, of None (geen resultante of zuiver koppel).
+    """
+    vectors, points = _vectors, _points
+    linewidth, markersize = style["linewidth"], style["markersize"]
+    Rx, Ry = _R.tolist()
+    fig = go.Figure()
+    add_arrows2d_batched(fig, vectors, _colors, linewidth, markersize, style["draw_arrowheads"], origins=points)
+
+    if len(vectors):
+        pts = np.vstack([np.zeros((1, 2)), points, points + vectors, [about]])
+        # Resultante op haar werklijn (door P₀); zonder werklijn vanuit de oorsprong
+        R_at = np.zeros(2) if line is None else np.asarray(line[0])
+        if style["show_resultant"]:
+            add_arrows2d_batched(fig, [[Rx, Ry]], [resultant_color], linewidth+1, markersize+2, True,
+                                 names=["Resultante"], origins=[R_at])
+            pts = np.vstack([pts, R_at, R_at + [Rx, Ry]])
+        if style["ranges"] is None:
+            xr = pad_range(pts[:, 0]); yr = pad_range(pts[:, 1])
+        else:
+            xr, yr = style["ranges"]
+        if style["show_line"] and line is not None:
+            # Werklijn over het hele zichtbare kader
+            p0, u = np.asarray(line[0]), np.asarray(line[1])
+            t = 2.0 * max(xr[1] - xr[0], yr[1] - yr[0]) + float(np.abs(p0).max())
+            a, b = p0 - t * u, p0 + t * u
+            fig.add_trace(go.Scatter(x=[a[0], b[0]], y=[a[1], b[1]], mode="lines", name="Werklijn R",
+                                     line=dict(color=resultant_color, width=1, dash="dash"), hoverinfo="skip"))
+        fig.add_trace(go.Scatter(x=[about[0]], y=[about[1]], mode="markers+text", text=["A"], textposition="top right",
+                                 marker=dict(symbol="x", size=10, color="#424242"), name="Momentpunt A"))
     else:
-        xr, yr = (xmin, xmax), (ymin, ymax)
+        xr, yr = (-1, 1), (-1, 1)
+
+    fig.update_layout(
+        xaxis=dict(title="X", zeroline=True, range=[xr[0], xr[1]]),
+        yaxis=dict(title="Y", zeroline=True, scaleanchor="x", scaleratio=1, range=[yr[0], yr[1]]),
+        margin=dict(l=10, r=10, t=40, b=10),
+        legend=dict(orientation="h", yanchor="top", y=1.12, xanchor="left", x=0.0),
+        showlegend=True
+    )
+    return fig
+
+@st.fragment
+def plot_section(scene_key, vectors, points, colors, R, about, line):
+    with st.sidebar:
+        st.markdown("---")
+        st.subheader("Weergave")
+        style = dict(
+            draw_arrowheads=st.checkbox("Pijlkoppen tonen", value=True),
+            linewidth=st.slider("Lijndikte", 1, 12, 4),
+            markersize=st.slider("Marker grootte", 1, 12, 6),
+        )
+        autoscale = st.checkbox("Autoschaal assen", value=True)
+        style["show_resultant"] = st.checkbox("Toon resultante vector", value=True)
+        style["show_line"] = st.checkbox("Toon werklijn resultante", value=True, key="show_line_2d")
+
+        style["ranges"] = None
+        if not autoscale:
+            st.caption("As-bereiken")
+            xmin = st.number_input("Xmin", value=-10.0)
+            xmax = st.number_input("Xmax", value=10.0)
+            ymin = st.number_input("Ymin", value=-10.0)
+            ymax = st.number_input("Ymax", value=10.0)
+            style["ranges"] = ((xmin, xmax), (ymin, ymax))
+
+    st.markdown("## Interactieve 2D Vectoren")
+    with prof.phase("figuur bouwen"):
+        line_key = None if line is None else (tuple(line[0].tolist()), tuple(line[1].tolist()))
+        fig = build_figure(scene_key, vectors, points, colors, R, resultant_color, about, line_key, style)
+    with prof.phase("plotly_chart"):
+        st.plotly_chart(fig, width="stretch")
+
+# Lege pagina: geen figuur of tabel bouwen (en dus ook pandas/Plotly-figuren niet laden)
+if len(vectors):
+    plot_section(scene_key, vectors, points, colors, R, about, line)
 else:
-    xr, yr = (-1, 1), (-1, 1)
-
-fig.update_layout(
-    xaxis=dict(title="X", zeroline=True, range=[xr[0], xr[1]]),
-    yaxis=dict(title="Y", zeroline=True, scaleanchor="x", scaleratio=1, range=[yr[0], yr[1]]),
-    margin=dict(l=10, r=10, t=40, b=10),
-    legend=dict(orientation="h", yanchor="top", y=1.12, xanchor="left", x=0.0),
-    showlegend=True
-)
-
-st.markdown("## Interactieve 2D Vectoren")
-st.plotly_chart(fig, use_container_width=True)
+    st.info("Nog geen vectoren: vul hierboven een vector in (of importeer een bestand) voor de 2D-weergave en de tabel.")
 
 # ----------------------------
-# Resultaten + Uitleg
+# Resultaten + Uitleg (fragmenten: tabel en uitleg herlopen los van elkaar)
 # ----------------------------
-if vectors:
-    rows = []
-    for i, (x, y, color) in enumerate(vectors, start=1):
-        mag = vec_norm2(x, y)
-        angx = angle_from_x_deg(x, y)
-        rows.append({
-            "Vector": f"{i}",
-            "X": round(x, 2), "Y": round(y, 2),
-            "|v| (N)": round(mag, 2),
-            "θ (° vanaf X-as)": None if angx is None else round(angx, 2),
-            "Kleur": color
-        })
-
-    Rmag = vec_norm2(Rx, Ry)
-    Rang = angle_from_x_deg(Rx, Ry)
-
-    rows.append({
-        "Vector": "Resultante",
-        "X": round(Rx, 2), "Y": round(Ry, 2),
-        "|R| (N)": round(Rmag, 2),
-        "θ (° vanaf X-as)": None if Rang is None else round(Rang, 2),
-        "Kleur": resultant_color
-    })
-
-    st.markdown("### Resultaten")
-    st.dataframe(pd.DataFrame(rows), use_container_width=True)
-
-    st.markdown("### Uitleg (stap voor stap)")
-    for i, text in enumerate(explain_rows, start=1):
-        st.markdown(f"- **Vector {i}:** {text}")
-
-    st.markdown("**Som van componenten:**")
-    st.markdown("Rx = " + " + ".join([f"{x:.2f}" for x, _, _ in vectors]) + f" = {Rx:.2f}")
-    st.markdown("Ry = " + " + ".join([f"{y:.2f}" for _, y, _ in vectors]) + f" = {Ry:.2f}")
-
-    st.markdown("**Resultante:**")
-    st.markdown(f"R = (Rx, Ry) = ({Rx:.2f}, {Ry:.2f}), |R| = √(Rx²+Ry²) = {Rmag:.2f} N.")
-    if Rmag > 0:
-        st.markdown("**Richtingshoek van R (vanaf X-as):**")
-        st.markdown(f"θ = atan2(Ry, Rx) = atan2({Ry:.2f}, {Rx:.2f}) = {Rang:.2f}°.")
+def results_frame(rows, vectors, points, colors, R, resultant_color, about, M_A, R_at):
+    """Resultatentabel voor de vectoren in `rows` (slice) plus altijd de resultante-rij."""
+    import pandas as pd  # lazy: pandas pas laden bij de eerste tabel
+    n = len(vectors)
+    idx = np.arange(n)[rows]
+    vectors, points = vectors[rows], points[rows]
+    angles, mags = xy_to_polar(vectors)
+    (Rang,), (Rmag,) = xy_to_polar(R)
+    # Resultante-rij: aangrijpingspunt op de werklijn (P₀), moment = totaal om A
+    P_R = (np.nan, np.nan) if R_at is None else R_at
+    return pd.DataFrame({
+        "Vector": [f"{i}" for i in (idx + 1).tolist()] + ["Resultante"],
+        "X": np.append(vectors[:, 0], R[0]).round(2),
+        "Y": np.append(vectors[:, 1], R[1]).round(2),
+        "|v| (N)": np.append(mags, np.nan).round(2),
+        "θ (° vanaf X-as)": np.append(angles, Rang).round(2),
+        "Px": np.append(points[:, 0], P_R[0]).round(2),
+        "Py": np.append(points[:, 1], P_R[1]).round(2),
+        "M_A (N·m)": np.append(moments_about(points, vectors, about), M_A).round(2),
+        "Kleur": colors[rows] + [resultant_color],
+        "|R| (N)": np.append(np.full(len(idx), np.nan), Rmag).round(2),
+    }, index=np.append(idx, n))
+
+@st.cache_data(max_entries=TABLE_CACHE_ENTRIES, show_spinner=False)
+def results_table(scene_key, start, stop, _vectors, _points, _colors, _R, resultant_color, about, M_A, R_at):
+    """Alleen de rijen van de zichtbare pagina (gecachet per scenario en pagina)."""
+    return results_frame(slice(start, stop), _vectors, _points, _colors, _R, resultant_color, about, M_A, R_at)
+
+@st.fragment
+def results_section(scene_key, vectors, points, colors, R, resultant_color, about, M_A, R_at):
+    exp, is_open = lazy_section(f"📋 Resultaten ({len(vectors)} vectoren + resultante)", key="results_open_2d")
+    if not is_open:
+        return
+    args = (vectors, points, colors, R, resultant_color, about, M_A, R_at)
+    with exp:
+        sl = page_slice(len(vectors), key="results_page_2d")
+        st.dataframe(results_table(scene_key, sl.start, sl.stop, *args), width="stretch")
+        # Volledige tabel pas bij het downloaden
+        export_widget(lambda: results_frame(slice(None), *args), "vectoren_2d", key="export_2d")
+
+@st.fragment
+def explanation_section(entries, all_xy, n_imported, load_info, vectors, points, R, about, M_A, line):
+    exp, is_open = lazy_section("📝 Uitleg (stap voor stap)", key="explain_open_2d")
+    if not is_open:
+        return
+    Rx, Ry = R.tolist()
+    (Rang,), (Rmag,) = xy_to_polar(R)
+    Rang, Rmag = float(Rang), float(Rmag)
+
+    with exp:
+        sl = page_slice(len(entries), key="explain_page_2d")
+        explain_rows = []   # strings, alleen voor de zichtbare pagina
+        for i, (x, y) in zip(range(len(entries))[sl], all_xy[sl].tolist()):
+            ent = entries.row(i)
+            F = ent["force"] or 0.0
+            if ent["mode"] == "cart":
+                x0, y0 = ent["x"], ent["y"]
+                mag0 = (x0*x0 + y0*y0) ** 0.5
+                if F > 0 and mag0 > 1e-12:
+                    explain_rows.append(
+                        f"**cart**: basis (x0,y0)=({x0:.2f},{y0:.2f}), F={F:.2f} → s=F/||v0||={F:.2f}/{mag0:.2f}={F/mag0:.2f} → X={x:.2f}, Y={y:.2f}"
+                    )
+                else:
+                    explain_rows.append(f"**cart**: direct (X,Y)=({x:.2f},{y:.2f})")
+            elif ent.get("ref", "X-as") == "X-as":
+                explain_rows.append(
+                    f"**angle-X**: F={F:.2f} N, θ={float(ent['theta']):.2f}° vanaf X → X=F·cosθ={x:.2f}, Y=F·sinθ={y:.2f}"
+                )
+            else:  # Y-as: hoek gemeten vanaf Y, componenten omgedraaid
+                explain_rows.append(
+                    f"**angle-Y**: F={F:.2f} N, θ={float(ent['theta']):.2f}° vanaf Y → X=F·sinθ={x:.2f}, Y=F·cosθ={y:.2f}"
+                )
+        lines = [f"- **Vector {i}:** {text}" for i, text in enumerate(explain_rows, start=sl.start+1)]
+        if n_imported:
+            lines.append(f"- **Geïmporteerd:** {n_imported} vectoren uit bestand (componenten: zie tabel)")
+        for k, inf in enumerate(load_info, start=1):
+            if inf["error"] is None:
+                where = "geen ligging (W = 0)" if inf["xbar"] is None else f"x̄ = ∫x·q dx / W = {inf['xbar']:.2f}"
+                lines.append(f"- **Verdeelde last {k}:** W = ∫q dx = {inf['W']:.2f} N, {where} "
+                             f"→ {inf['n']} puntkracht(en) (componenten: zie tabel)")
+        st.markdown("\n".join(lines))
+
+        st.markdown("**Som van componenten:**")
+        st.markdown(sum_line("Rx", vectors[:, 0].tolist(), Rx))
+        st.markdown(sum_line("Ry", vectors[:, 1].tolist(), Ry))
+
+        st.markdown("**Resultante:**")
+        st.markdown(f"R = (Rx, Ry) = ({Rx:.2f}, {Ry:.2f}), |R| = √(Rx²+Ry²) = {Rmag:.2f} N.")
+        if Rmag > 0:
+            st.markdown("**Richtingshoek van R (vanaf X-as):**")
+            st.markdown(f"θ = atan2(Ry, Rx) = atan2({Ry:.2f}, {Rx:.2f}) = {Rang:.2f}°.")
+
+        ax, ay = about
+        st.markdown(f"**Moment om A = ({ax:.2f}, {ay:.2f})** (M = (Px−Ax)·Fy − (Py−Ay)·Fx, tegen de klok in positief):")
+        st.markdown(sum_line("M_A", moments_about(points, vectors, about).tolist(), M_A))
+        if line is None:
+            st.markdown(f"R = 0: het stelsel is een zuiver koppel M = {M_A:.2f} N·m (gelijk om elk punt).")
+        else:
+            px, py = line[0].tolist()
+            st.markdown(f"Werklijn van R: door P₀ = A + M_A·(Ry, −Rx)/|R|² = ({px:.2f}, {py:.2f}), "
+                        f"richting θ = {Rang:.2f}°; daar geeft R alleen hetzelfde moment als het hele stelsel.")
+
+def moment_summary(R, M_A, about, line):
+    """Equivalent kracht-koppelstelsel in A en de werklijn van R."""
+    st.markdown("### ⟲ Moment en kracht-koppelstelsel")
+    Rx, Ry = R.tolist()
+    st.write(f"In **A = ({about[0]:.2f}, {about[1]:.2f})**: **R = ({Rx:.2f}, {Ry:.2f}) N** en **M_A = {M_A:.2f} N·m** "
+             "(tegen de klok in positief).")
+    if line is None:
+        st.write(f"R = 0: zuiver koppel van **{M_A:.2f} N·m**, zonder werklijn.")
+    else:
+        px, py = line[0].tolist()
+        st.write(f"Eén kracht R op de werklijn door **P₀ = ({px:.2f}, {py:.2f})** is gelijkwaardig aan het hele stelsel.")
+
+def loads_summary(load_info):
+    """Resultante en ligging per verdeelde last, met het aantal puntkrachten dat ervoor in de set staat."""
+    done = [(k, inf) for k, inf in enumerate(load_info, start=1) if inf["error"] is None]
+    if not done:
+        return
+    st.markdown("### 📏 Verdeelde belastingen")
+    st.markdown("\n".join(
+        f"- **Last {k}:** W = {inf['W']:.2f} N"
+        + ("" if inf["xbar"] is None else f" op x̄ = {inf['xbar']:.2f}")
+        + f" · {inf['n']} puntkracht(en)" for k, inf in done))
+
+if len(vectors):
+    loads_summary(load_info)
+    moment_summary(R, M_A, about, line)
+    with prof.phase("tabel"):
+        R_at = None if line is None else tuple(line[0].tolist())
+        results_section(scene_key, vectors, points, colors, R, resultant_color, about, M_A, R_at)
+    with prof.phase("uitleg"):
+        explanation_section(entries, all_xy, n_imported, load_info, vectors, points, R, about, M_A, line)
+
+prof.report()
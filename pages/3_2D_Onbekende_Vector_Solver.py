@@ -1,37 +1,56 @@
-import math
+import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
+from plotly.subplots import make_subplots
+
+from statica.vectors import polar_to_xy, xy_to_polar, resultant
+from statica.export import export_section
+from statica.editor import HEX_COLOR_RE, input_mode_radio, bulk_editor, reset_bulk_editor
+from statica.store import KNOWN2D_FIELDS, VectorStore
+from statica.profiling import Profiler
+from statica.presets import preset_picker
+from statica.scenarios import scenario_section
+from statica.share import share_section
+from statica.cache import SCENE_CACHE_ENTRIES, TABLE_CACHE_ENTRIES, FIGURE_CACHE_ENTRIES, scenario_hash
+from statica.fileio import import_widget, imported_columns, export_widget, table_colors
+from statica.plotting import add_arrows2d_batched
+from statica.solver import STATUS_ILL, STATUS_SINGULAR, solve_unknown_force, solve_two_magnitudes, sweep_target_angle, sweep_known_angle
 
 st.set_page_config(page_title="🧭 2D Onbekende Vector Solver", layout="wide", initial_sidebar_state="expanded")
 st.title("🧭 2D Onbekende Vector Solver")
+prof = Profiler("solver")
+preset_picker("solver")
+share_section("solver")
+scenario_section("solver")
+export_section("solver")
 
 # =========================
 # Helpers
 # =========================
-def deg2rad(d): return math.radians(d)
-def rad2deg(r): return math.degrees(r)
-def norm2(x,y): return math.sqrt(x*x + y*y)
-def angle_deg(x,y): 
-    return None if (abs(x)<1e-12 and abs(y)<1e-12) else rad2deg(math.atan2(y,x))
-
 def xy_from_F_theta(F, theta_deg):
-    c, s = math.cos(deg2rad(theta_deg)), math.sin(deg2rad(theta_deg))
-    return F*c, F*s
+    """Grootte(s) + hoek(en) vanaf X-as → (N,2) componenten."""
+    return polar_to_xy(F, theta_deg)
+
+def angle_deg(x, y):
+    theta = float(xy_to_polar([x, y])[0][0])
+    return None if np.isnan(theta) else theta
 
 # =========================
 # Sidebar: Resultant target
 # =========================
+# Startwaarden via session_state (voorbeeldbibliotheek en deellinks zetten dezelfde sleutels)
+for _key, _value in (("target_R", 1000.0), ("target_phi", 0.0), ("target_alpha", -30.0), ("theta_a", 30.0), ("theta_b", -45.0)):
+    st.session_state.setdefault(_key, _value)
 with st.sidebar:
     st.header("Doel (resultante)")
     colA, colB = st.columns(2)
     with colA:
-        Rmag = st.number_input("|R| (N)", value=1000.0, min_value=0.0, step=10.0)
-    ori_choice = st.radio("Richting van R kiezen als:", ["Hoek vanaf X-as (φ)", "Langs x′-as (met rotatie α)"])
+        Rmag = st.number_input("|R| (N)", min_value=0.0, step=10.0, key="target_R")
+    ori_choice = st.radio("Richting van R kiezen als:", ["Hoek vanaf X-as (φ)", "Langs x′-as (met rotatie α)"], key="target_ori")
     if ori_choice == "Hoek vanaf X-as (φ)":
-        phi = st.number_input("φ (° vanaf X-as)", value=0.0, step=1.0)
+        phi = st.number_input("φ (° vanaf X-as)", step=1.0, key="target_phi")
     else:
-        alpha = st.number_input("α (° van X naar x′)", value=-30.0, step=1.0)
+        alpha = st.number_input("α (° van X naar x′)", step=1.0, key="target_alpha")
         phi = alpha  # R ligt langs x′ → zelfde richting als rotatie-as
     st.markdown("---")
     
@@ -40,123 +59,296 @@ with st.sidebar:
 # =========================
 st.subheader("Bekende krachten (grootte + hoek vanaf X-as)")
 if "known_forces" not in st.session_state:
-    st.session_state.known_forces = [
+    st.session_state.known_forces = VectorStore(KNOWN2D_FIELDS, [
         {"F": 450.0, "theta": 45.0, "color": "#1f77b4"},  # F2
         {"F": 200.0, "theta": 0.0,   "color": "#ff7f0e"}  # F3
-    ]
+    ])
 if "color_idx" not in st.session_state:
     st.session_state.color_idx = 2
 
 PALETTE = ["#1f77b4","#ff7f0e","#2ca02c","#d62728","#9467bd",
            "#8c564b","#e377c2","#7f7f7f","#bcbd22","#17becf"]
 
-col_btn1, col_btn2 = st.columns([1,3])
-with col_btn1:
-    if st.button("➕ Voeg bekende kracht toe"):
-        st.session_state.known_forces.append({"F":0.0,"theta":0.0,"color":PALETTE[st.session_state.color_idx%len(PALETTE)]})
-        st.session_state.color_idx += 1
-with col_btn2:
-    if st.button("🗑️ Leeg lijst"):
-        st.session_state.known_forces = []
-        st.session_state.color_idx = 0
-
-rows = []
-new_list = []
-for i, ent in enumerate(st.session_state.known_forces):
-    c = st.columns([1.2,1.2,1.5,0.6])
-    with c[0]:
-        Fi = st.number_input(f"F{i+1} (N)", value=float(ent["F"]), min_value=0.0, key=f"F_{i}")
-    with c[1]:
-        thetai = st.number_input(f"θ{i+1} (°)", value=float(ent["theta"]), key=f"th_{i}")
-    with c[2]:
-        colori = st.color_picker(f"Kleur {i+1}", value=ent["color"], key=f"col_{i}")
-    with c[3]:
-        if st.button("🗑️", key=f"del_{i}"):
-            continue
-    new_list.append({"F":Fi,"theta":thetai,"color":colori})
-st.session_state.known_forces = new_list
+# Invoer als fragment: widgetinteracties herlopen alleen dit blok
+@st.fragment
+def input_grid():
+    store = st.session_state.known_forces
+    before = store.version
+    bulk_mode = input_mode_radio(len(store), key="input_mode_solver")
+
+    col_btn1, col_btn2 = st.columns([1,3])
+    with col_btn1:
+        if st.button("➕ Voeg bekende kracht toe", disabled=bulk_mode):
+            store.append(color=PALETTE[st.session_state.color_idx%len(PALETTE)])
+            st.session_state.color_idx += 1
+    with col_btn2:
+        if st.button("🗑️ Leeg lijst"):
+            store.clear()
+            st.session_state.color_idx = 0
+            reset_bulk_editor("known_forces_bulk")
+
+    if bulk_mode:
+        bulk_editor(
+            store, "known_forces_bulk",
+            column_config={
+                "F": st.column_config.NumberColumn("F (N)", min_value=0.0, default=0.0),
+                "theta": st.column_config.NumberColumn("θ (°)", default=0.0),
+                "color": st.column_config.TextColumn("Kleur", validate=HEX_COLOR_RE),
+            },
+            palette=PALETTE,
+        )
+    else:
+        reset_bulk_editor("known_forces_bulk")
+        # Widget-sleutels per stabiel rij-ID: verwijderen verschuift de overige rijen niet
+        deleted = []
+        for i, rid in enumerate(store.ids.tolist()):
+            ent = store.row(i)
+            c = st.columns([1.2,1.2,1.5,0.6])
+            with c[0]:
+                Fi = st.number_input(f"F{i+1} (N)", value=float(ent["F"]), min_value=0.0, key=f"F_{rid}")
+            with c[1]:
+                thetai = st.number_input(f"θ{i+1} (°)", value=float(ent["theta"]), key=f"th_{rid}")
+            with c[2]:
+                colori = st.color_picker(f"Kleur {i+1}", value=ent["color"], key=f"col_{rid}")
+            with c[3]:
+                if st.button("🗑️", key=f"del_{rid}"):
+                    deleted.append(i)
+                    continue
+            store.update(i, {"F":Fi,"theta":thetai,"color":colori})
+        store.delete(deleted)
+
+    with st.expander("📂 Importeren uit bestand"):
+        st.caption("Kolommen: `F,theta` (hoek vanaf X-as); optioneel `color`. Geïmporteerde krachten tellen mee als bekende krachten.")
+        import_widget("solver", "import_solver")
+
+    # Alleen bij gewijzigde invoer de hele pagina herberekenen
+    if store.version != before:
+        st.rerun()
+
+with prof.phase("invoer"):
+    input_grid()
 
 st.markdown("---")
 
 # =========================
 # Onbekende kracht F1
 # =========================
-st.subheader("Onbekende kracht F₁ (wordt berekend)")
-st.caption("We nemen precies **één** onbekende kracht F₁. Het programma kiest F₁ zó dat de som exact de gewenste resultante geeft.")
+UNKNOWN_MODES = ["Eén kracht F₁ (grootte + richting)", "Twee grootten F₁, F₂ (richtingen bekend)"]
+st.subheader("Onbekende kracht(en) (wordt berekend)")
+unknown_mode = st.radio("Onbekenden", UNKNOWN_MODES, horizontal=True, key="unknown_mode")
+two_unknowns = unknown_mode == UNKNOWN_MODES[1]
+if not two_unknowns:
+    st.caption("We nemen precies **één** onbekende kracht F₁. Het programma kiest F₁ zó dat de som exact de gewenste resultante geeft.")
+else:
+    st.caption("F₁ en F₂ werken langs bekende lijnen (hoeken θ₁, θ₂); alleen hun grootten worden berekend. "
+               "Een negatieve grootte betekent: tegen de gekozen richting in.")
+    c1, c2 = st.columns(2)
+    with c1:
+        theta_a = st.number_input("θ₁ (° vanaf X-as)", step=1.0, key="theta_a")
+    with c2:
+        theta_b = st.number_input("θ₂ (° vanaf X-as)", step=1.0, key="theta_b")
 
 # =========================
 # Rekenen
 # =========================
-# Som van bekende krachten
-Sx = Sy = 0.0
-for ent in st.session_state.known_forces:
-    x,y = xy_from_F_theta(ent["F"], ent["theta"])
-    Sx += x; Sy += y
+# Alle bekende krachten in één gevectoriseerde stap, gecachet per invoerset
+@st.cache_data(max_entries=SCENE_CACHE_ENTRIES, show_spinner=False)
+def compute_known(known_key, _known, _imported):
+    known_xy = xy_from_F_theta(_known.col("F"), _known.col("theta"))
+    imp_xy = xy_from_F_theta(_imported["F"], _imported["theta"]) if _imported is not None else np.zeros((0, 2))
+    imp_colors = table_colors(_imported, "#7f7f7f") if _imported is not None else []
+    return known_xy, imp_xy, imp_colors, resultant(known_xy) + resultant(imp_xy)
+
+known = st.session_state.known_forces
+imported = imported_columns("import_solver")
+known_key = scenario_hash(known, imported)
+with prof.phase("berekening"):
+    known_xy, imp_xy, imp_colors, S = compute_known(known_key, known, imported)
+
+# Som van bekende krachten (handmatig + geïmporteerd)
+Sx, Sy = S.tolist()
 
 # Doelcomponenten van R
-Rx_target, Ry_target = xy_from_F_theta(Rmag, phi)
+(Rx_target, Ry_target), = xy_from_F_theta(Rmag, phi).tolist()
+
+# Wat F₁ moet leveren (zelfde kern als de batch-solver: python -m statica.batch)
+D, F1s, theta1s = solve_unknown_force(S, (Rx_target, Ry_target))
+(Dx, Dy), = D.tolist()
+F1 = float(F1s[0])
+theta1 = None if np.isnan(theta1s[0]) else float(theta1s[0])
+
+# Figuur en tabel hangen af van invoer én doel; de opgeloste waarden gaan als argument mee
+scene_key = scenario_hash(known_key, Rmag, phi)
+solved = (float(Rmag), float(phi), Rx_target, Ry_target, Dx, Dy, F1, theta1)
+
+# =========================
+# Twee onbekende grootten (2×2-stelsel langs bekende werklijnen)
+# =========================
+def pad_range(vals, pr=0.15):
+    vmin, vmax = float(np.min(vals)), float(np.max(vals))
+    if abs(vmax - vmin) < 1e-9: vmin -= 1.0; vmax += 1.0
+    pad = (vmax - vmin) * pr
+    return (vmin - pad, vmax + pad)
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def two_magnitudes_figure(two_key, _known, _known_xy, _imp_xy, target, solution):
+    """Figuur bij twee onbekende grootten; `target` = (|R|, φ, Rx, Ry), `solution` = (θ₁, θ₂, F₁, F₂)."""
+    known, known_xy, imp_xy = _known, _known_xy, _imp_xy
+    Rmag, phi, Rx_target, Ry_target = target
+    theta_a, theta_b, Fa, Fb = solution
+    (ax, ay), (bx, by) = xy_from_F_theta([Fa, Fb], [theta_a, theta_b]).tolist()
+    fig = go.Figure()
+    for i, (ent, (x, y)) in enumerate(zip(known, known_xy.tolist()), start=1):
+        fig.add_trace(go.Scatter(x=[0,x], y=[0,y], mode="lines+markers", line=dict(color=ent["color"], width=3),
+                                 marker=dict(size=6, color=ent["color"]), name=f"F{i} (bekend) = {ent['F']:.0f} N @ {ent['theta']:.0f}°"))
+    if len(imp_xy):
+        add_arrows2d_batched(fig, imp_xy, ["#7f7f7f"] * len(imp_xy), 2, 4, draw_arrowheads=False,
+                             names=[f"Import {i}" for i in range(1, len(imp_xy)+1)])
+    for name, (x, y), color in (("F₁", (ax, ay), "#d62728"), ("F₂", (bx, by), "#9467bd")):
+        fig.add_trace(go.Scatter(x=[0,x], y=[0,y], mode="lines+markers", line=dict(color=color, width=4),
+                                 marker=dict(size=7, color=color), name=f"{name} (onbekend)"))
+    fig.add_trace(go.Scatter(x=[0,Rx_target], y=[0,Ry_target], mode="lines+markers", line=dict(color="#e41a1c", width=5, dash="dash"),
+                             marker=dict(size=8, color="#e41a1c"), name=f"Gewenste R = {Rmag:.0f} N @ {phi:.1f}°"))
+    xs = np.concatenate([[0, Rx_target, ax, bx], known_xy[:, 0], imp_xy[:, 0]])
+    ys = np.concatenate([[0, Ry_target, ay, by], known_xy[:, 1], imp_xy[:, 1]])
+    xr = pad_range(xs); yr = pad_range(ys)
+    fig.update_layout(
+        xaxis=dict(title="X", zeroline=True, range=[xr[0], xr[1]]),
+        yaxis=dict(title="Y", zeroline=True, scaleanchor="x", scaleratio=1, range=[yr[0], yr[1]]),
+        margin=dict(l=10, r=10, t=40, b=10),
+        legend=dict(orientation="h", yanchor="top", y=1.12, xanchor="left", x=0.0)
+    )
+    return fig
 
-# Wat F₁ moet leveren
-Dx = Rx_target - Sx
-Dy = Ry_target - Sy
-F1 = norm2(Dx, Dy)
-theta1 = angle_deg(Dx, Dy)
+@st.cache_data(max_entries=TABLE_CACHE_ENTRIES, show_spinner=False)
+def two_magnitudes_table(two_key, _known, _known_xy, _imp_xy, target, solution):
+    """Tabel bij twee onbekende grootten; argumenten als bij `two_magnitudes_figure`."""
+    known, known_xy, imp_xy = _known, _known_xy, _imp_xy
+    Rmag, phi, Rx_target, Ry_target = target
+    theta_a, theta_b, Fa, Fb = solution
+    (ax, ay), (bx, by) = xy_from_F_theta([Fa, Fb], [theta_a, theta_b]).tolist()
+    rows = [{"Kracht": f"F{i} (bekend)", "F (N)": round(ent["F"],2), "θ (°)": round(ent["theta"],2), "X": round(x,2), "Y": round(y,2)}
+            for i, (ent, (x, y)) in enumerate(zip(known, known_xy.tolist()), start=1)]
+    if len(imp_xy):
+        Ix, Iy = resultant(imp_xy).tolist()
+        rows.append({"Kracht": f"Geïmporteerd (Σ van {len(imp_xy)})", "F (N)": round(float(np.hypot(Ix, Iy)),2),
+                     "θ (°)": None if angle_deg(Ix, Iy) is None else round(angle_deg(Ix, Iy),2), "X": round(Ix,2), "Y": round(Iy,2)})
+    rows.append({"Kracht": "F₁ (oplossing)", "F (N)": round(Fa,2), "θ (°)": round(theta_a,2), "X": round(ax,2), "Y": round(ay,2)})
+    rows.append({"Kracht": "F₂ (oplossing)", "F (N)": round(Fb,2), "θ (°)": round(theta_b,2), "X": round(bx,2), "Y": round(by,2)})
+    rows.append({"Kracht": "R (gewenst)", "F (N)": round(Rmag,2), "θ (°)": round(phi,2), "X": round(Rx_target,2), "Y": round(Ry_target,2)})
+    import pandas as pd  # lazy: pandas pas laden bij de eerste tabel
+    return pd.DataFrame(rows)
+
+@st.fragment
+def two_magnitudes_section(two_key, known, known_xy, imp_xy, D, target, theta_a, theta_b):
+    Fa, Fb, cond, status = solve_two_magnitudes(D, theta_a, theta_b)
+    Fa, Fb, cond, status = float(Fa[0]), float(Fb[0]), float(cond[0]), int(status[0])
+    if status == STATUS_SINGULAR:
+        st.error("De werklijnen van F₁ en F₂ zijn evenwijdig: het stelsel is singulier en heeft geen (unieke) oplossing.")
+        return
+    if status == STATUS_ILL:
+        st.warning(f"De werklijnen zijn bijna evenwijdig (conditiegetal {cond:.2e}): de uitkomst is erg gevoelig voor afronding.")
+
+    solution = (float(theta_a), float(theta_b), Fa, Fb)
+    st.markdown("## Vectoren")
+    with prof.phase("figuur bouwen"):
+        fig = two_magnitudes_figure(two_key, known, known_xy, imp_xy, target, solution)
+    with prof.phase("plotly_chart"):
+        st.plotly_chart(fig, width="stretch")
+
+    st.markdown("### Uitkomst F₁, F₂ (zodat ΣF = R)")
+    st.write(f"**F₁ = {Fa:.2f} N** langs θ₁ = {theta_a:.2f}°, **F₂ = {Fb:.2f} N** langs θ₂ = {theta_b:.2f}°")
+    results = two_magnitudes_table(two_key, known, known_xy, imp_xy, target, solution)
+    st.dataframe(results, width="stretch")
+    export_widget(results, "solver_2d_twee_grootten", key="export_solver2")
+
+    (Dx, Dy), = np.asarray(D, dtype=float).reshape(1, 2).tolist()
+    st.markdown("**Werkwijze (in het kort):**")
+    st.markdown(
+    f"""
+- F₁ en F₂ moeten samen leveren: **Dx = {Dx:.2f}**, **Dy = {Dy:.2f}**.  
+- Met eenheidsvectoren u₁ = (cos θ₁, sin θ₁) en u₂ = (cos θ₂, sin θ₂): **F₁·u₁ + F₂·u₂ = D**, een 2×2-stelsel.  
+- det = cos θ₁·sin θ₂ − sin θ₁·cos θ₂ = {np.sin(np.radians(theta_b - theta_a)):.4f} (0 ⇔ evenwijdige werklijnen), conditiegetal {cond:.2f}.  
+- Oplossing: **F₁ = {Fa:.2f} N**, **F₂ = {Fb:.2f} N**.
+    """
+    )
+
+if two_unknowns:
+    with prof.phase("twee grootten"):
+        two_key = scenario_hash(known_key, Rmag, phi, theta_a, theta_b)
+        two_magnitudes_section(two_key, known, known_xy, imp_xy, D, solved[:4], theta_a, theta_b)
+    prof.report()
+    st.stop()
 
 # =========================
 # Visualisatie
 # =========================
-fig = go.Figure()
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def build_figure(scene_key, _known, _known_xy, _imp_xy, _imp_colors, solved):
+    """Plotly-figuur per scenario; wordt na het bouwen niet meer aangepast en dus gedeeld.
+
+    `solved` = (|R|, φ, Rx, Ry, Dx, Dy, F₁, θ₁): doel en oplossing, onderdeel van de cachesleutel.
+    """
+    known, known_xy, imp_xy, imp_colors = _known, _known_xy, _imp_xy, _imp_colors
+    Rmag, phi, Rx_target, Ry_target, Dx, Dy, F1, theta1 = solved
+    fig = go.Figure()
+
+    # bekende krachten
+    for i, (ent, (x, y)) in enumerate(zip(known, known_xy.tolist()), start=1):
+        fig.add_trace(go.Scatter(
+            x=[0,x], y=[0,y],
+            mode="lines+markers",
+            line=dict(color=ent["color"], width=3),
+            marker=dict(size=6, color=ent["color"]),
+            name=f"F{i} = {ent['F']:.0f} N @ {ent['theta']:.0f}°"
+        ))
 
-# bekende krachten
-for i, ent in enumerate(st.session_state.known_forces, start=1):
-    x,y = xy_from_F_theta(ent["F"], ent["theta"])
+    # geïmporteerde krachten: gebundeld getekend
+    if len(imp_xy):
+        add_arrows2d_batched(fig, imp_xy, imp_colors, 2, 4, draw_arrowheads=False,
+                             names=[f"Import {i}" for i in range(1, len(imp_xy)+1)])
+
+    # F1 (oplossing)
     fig.add_trace(go.Scatter(
-        x=[0,x], y=[0,y],
+        x=[0,Dx], y=[0,Dy],
         mode="lines+markers",
-        line=dict(color=ent["color"], width=3),
-        marker=dict(size=6, color=ent["color"]),
-        name=f"F{i} = {ent['F']:.0f} N @ {ent['theta']:.0f}°"
+        line=dict(color="#d62728", width=4),
+        marker=dict(size=7, color="#d62728"),
+        name=f"F1 (onbekend) = {F1:.0f} N @ {0.0 if theta1 is None else theta1:.1f}°"
     ))
 
-# F1 (oplossing)
-fig.add_trace(go.Scatter(
-    x=[0,Dx], y=[0,Dy],
-    mode="lines+markers",
-    line=dict(color="#d62728", width=4),
-    marker=dict(size=7, color="#d62728"),
-    name=f"F1 (onbekend) = {F1:.0f} N @ {0.0 if theta1 is None else theta1:.1f}°"
-))
-
-# R (doel)
-fig.add_trace(go.Scatter(
-    x=[0,Rx_target], y=[0,Ry_target],
-    mode="lines+markers",
-    line=dict(color="#e41a1c", width=5, dash="dash"),
-    marker=dict(size=8, color="#e41a1c"),
-    name=f"Gewenste R = {Rmag:.0f} N @ {phi:.1f}°"
-))
-
-# Asbereik
-xs = [0, Rx_target, Dx] + [xy_from_F_theta(ent["F"], ent["theta"])[0] for ent in st.session_state.known_forces]
-ys = [0, Ry_target, Dy] + [xy_from_F_theta(ent["F"], ent["theta"])[1] for ent in st.session_state.known_forces]
+    # R (doel)
+    fig.add_trace(go.Scatter(
+        x=[0,Rx_target], y=[0,Ry_target],
+        mode="lines+markers",
+        line=dict(color="#e41a1c", width=5, dash="dash"),
+        marker=dict(size=8, color="#e41a1c"),
+        name=f"Gewenste R = {Rmag:.0f} N @ {phi:.1f}°"
+    ))
 
-def pad_range(vals, pr=0.15):
-    vmin, vmax = min(vals), max(vals)
-    if abs(vmax - vmin) < 1e-9: vmin -= 1.0; vmax += 1.0
-    pad = (vmax - vmin) * pr
-    return (vmin - pad, vmax + pad)
+    # Asbereik
+    xs = np.concatenate([[0, Rx_target, Dx], known_xy[:, 0], imp_xy[:, 0]])
+    ys = np.concatenate([[0, Ry_target, Dy], known_xy[:, 1], imp_xy[:, 1]])
+
+    xr = pad_range(xs); yr = pad_range(ys)
 
-xr = pad_range(xs); yr = pad_range(ys)
+    fig.update_layout(
+        xaxis=dict(title="X", zeroline=True, range=[xr[0], xr[1]]),
+        yaxis=dict(title="Y", zeroline=True, scaleanchor="x", scaleratio=1, range=[yr[0], yr[1]]),
+        margin=dict(l=10, r=10, t=40, b=10),
+        legend=dict(orientation="h", yanchor="top", y=1.12, xanchor="left", x=0.0)
+    )
+    return fig
 
-fig.update_layout(
-    xaxis=dict(title="X", zeroline=True, range=[xr[0], xr[1]]),
-    yaxis=dict(title="Y", zeroline=True, scaleanchor="x", scaleratio=1, range=[yr[0], yr[1]]),
-    margin=dict(l=10, r=10, t=40, b=10),
-    legend=dict(orientation="h", yanchor="top", y=1.12, xanchor="left", x=0.0)
-)
+@st.fragment
+def plot_section(scene_key, known, known_xy, imp_xy, imp_colors, solved):
+    st.markdown("## Vectoren")
+    with prof.phase("figuur bouwen"):
+        fig = build_figure(scene_key, known, known_xy, imp_xy, imp_colors, solved)
+    with prof.phase("plotly_chart"):
+        st.plotly_chart(fig, width="stretch")
 
-st.markdown("## Vectoren")
-st.plotly_chart(fig, use_container_width=True)
+plot_section(scene_key, known, known_xy, imp_xy, imp_colors, solved)
 
 # =========================
 # Resultaten
@@ -168,27 +360,134 @@ st.write(f"Doelresultante: **R = {Rmag:.2f} N** @ **{phi:.2f}°**")
 # Controle / toelichting
 st.markdown("### Controle & Uitleg")
 # tabel
-rows = []
-for i, ent in enumerate(st.session_state.known_forces, start=1):
-    x,y = xy_from_F_theta(ent["F"], ent["theta"])
-    rows.append({"Kracht": f"F{i}", "F (N)": round(ent["F"],2), "θ (°)": round(ent["theta"],2),
-                 "X": round(x,2), "Y": round(y,2)})
-rows.append({"Kracht": "F1 (oplossing)", "F (N)": round(F1,2), "θ (°)": None if theta1 is None else round(theta1,2),
-             "X": round(Dx,2), "Y": round(Dy,2)})
-Sx2 = Sx + Dx; Sy2 = Sy + Dy
-rows.append({"Kracht": "Som = R (check)", "F (N)": round(norm2(Sx2,Sy2),2), "θ (°)": round(angle_deg(Sx2,Sy2),2),
-             "X": round(Sx2,2), "Y": round(Sy2,2)})
-rows.append({"Kracht": "R (gewenst)", "F (N)": round(Rmag,2), "θ (°)": round(phi,2),
-             "X": round(Rx_target,2), "Y": round(Ry_target,2)})
-
-st.dataframe(pd.DataFrame(rows), use_container_width=True)
-
-st.markdown("**Werkwijze (in het kort):**")
-st.markdown(
-f"""
+@st.cache_data(max_entries=TABLE_CACHE_ENTRIES, show_spinner=False)
+def results_table(scene_key, _known, _known_xy, _imp_xy, S, solved):
+    """Controletabel; som van de bekende krachten `S` = (Sx, Sy) en `solved` zoals bij `build_figure`."""
+    known, known_xy, imp_xy = _known, _known_xy, _imp_xy
+    Sx, Sy = S
+    Rmag, phi, Rx_target, Ry_target, Dx, Dy, F1, theta1 = solved
+    rows = []
+    for i, (ent, (x, y)) in enumerate(zip(known, known_xy.tolist()), start=1):
+        rows.append({"Kracht": f"F{i}", "F (N)": round(ent["F"],2), "θ (°)": round(ent["theta"],2),
+                     "X": round(x,2), "Y": round(y,2)})
+    if len(imp_xy):
+        Ix, Iy = resultant(imp_xy).tolist()
+        rows.append({"Kracht": f"Geïmporteerd (Σ van {len(imp_xy)})", "F (N)": round(float(np.hypot(Ix, Iy)),2),
+                     "θ (°)": None if angle_deg(Ix, Iy) is None else round(angle_deg(Ix, Iy),2),
+                     "X": round(Ix,2), "Y": round(Iy,2)})
+    rows.append({"Kracht": "F1 (oplossing)", "F (N)": round(F1,2), "θ (°)": None if theta1 is None else round(theta1,2),
+                 "X": round(Dx,2), "Y": round(Dy,2)})
+    Sx2 = Sx + Dx; Sy2 = Sy + Dy
+    rows.append({"Kracht": "Som = R (check)", "F (N)": round(float(np.hypot(Sx2,Sy2)),2), "θ (°)": None if angle_deg(Sx2,Sy2) is None else round(angle_deg(Sx2,Sy2),2),
+                 "X": round(Sx2,2), "Y": round(Sy2,2)})
+    rows.append({"Kracht": "R (gewenst)", "F (N)": round(Rmag,2), "θ (°)": round(phi,2),
+                 "X": round(Rx_target,2), "Y": round(Ry_target,2)})
+    import pandas as pd  # lazy: pandas pas laden bij de eerste tabel
+    return pd.DataFrame(rows)
+
+@st.fragment
+def results_section(results):
+    st.dataframe(results, width="stretch")
+    export_widget(results, "solver_2d", key="export_solver")
+
+with prof.phase("tabel"):
+    results_section(results_table(scene_key, known, known_xy, imp_xy, (Sx, Sy), solved))
+
+@st.fragment
+def explanation_section(Sx, Sy, Rx_target, Ry_target, Dx, Dy, F1, theta1):
+    st.markdown("**Werkwijze (in het kort):**")
+    st.markdown(
+    f"""
 - Bekend: som van bekende componenten: **Sx = {Sx:.2f}**, **Sy = {Sy:.2f}**.  
 - Doelcomponenten: **Rx = |R|cosφ = {Rmag:.2f}·cos({phi:.2f}°) = {Rx_target:.2f}**, **Ry = |R|sinφ = {Rmag:.2f}·sin({phi:.2f}°) = {Ry_target:.2f}**.  
 - F₁ moet leveren: **Dx = Rx − Sx = {Dx:.2f}**, **Dy = Ry − Sy = {Dy:.2f}**.  
 - Dus **F₁ = √(Dx² + Dy²) = {F1:.2f} N**, **θ₁ = atan2(Dy, Dx) = atan2({Dy:.2f}, {Dx:.2f}) = {0.0 if theta1 is None else theta1:.2f}°**.
-"""
-)
+    """
+    )
+
+with prof.phase("uitleg"):
+    explanation_section(Sx, Sy, Rx_target, Ry_target, Dx, Dy, F1, theta1)
+
+# =========================
+# Parameter-sweep (fragment: sweep-instellingen herlopen alleen deze sectie)
+# =========================
+SWEEP_PARAMS = ["φ (richting van R)", "θ van een bekende kracht"]
+SWEEP_PLOT_POINTS = 4000   # getekende punten per curve; de berekening zelf gebruikt het volle raster
+
+def plot_indices(y, max_points=SWEEP_PLOT_POINTS):
+    """Indices om te tekenen: per blok de eerste, kleinste en grootste waarde, zodat pieken en dalen blijven staan."""
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+    size = -(-n // (max_points // 3))
+    blocks = -(-n // size)
+    lo = np.full(blocks * size, np.inf); lo[:n] = np.where(np.isnan(y), np.inf, y)
+    hi = np.full(blocks * size, -np.inf); hi[:n] = np.where(np.isnan(y), -np.inf, y)
+    starts = np.arange(blocks) * size
+    idx = np.concatenate([starts, starts + lo.reshape(blocks, size).argmin(axis=1),
+                          starts + hi.reshape(blocks, size).argmax(axis=1), [n - 1]])
+    return np.unique(np.minimum(idx, n - 1))
+
+def break_wraps(theta):
+    """NaN tussen punten waar θ over ±180° springt, zodat de curve daar niet dwars over de grafiek loopt."""
+    theta = theta.copy()
+    jumps = np.abs(np.diff(theta)) > 180.0
+    theta[1:][jumps] = np.nan
+    return theta
+
+@st.fragment
+def sweep_section(S, known, Rmag, phi):
+    st.markdown("---")
+    st.markdown("### Parameter-sweep")
+    if not st.toggle("Sweep-modus", key="sweep_on", help="Reken F₁ en θ₁ in één keer uit voor een heel bereik van één parameter."):
+        return
+
+    param = st.radio("Variëer", SWEEP_PARAMS, horizontal=True, key="sweep_param")
+    k = None
+    if param == SWEEP_PARAMS[1]:
+        if not known:
+            st.info("Voeg eerst een bekende kracht toe.")
+            return
+        k = st.selectbox("Kracht", range(len(known)), format_func=lambda i: f"F{i+1} = {known[i]['F']:.0f} N", key="sweep_force")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        lo = st.number_input("Van (°)", value=-180.0, step=5.0, key="sweep_lo")
+    with c2:
+        hi = st.number_input("Tot (°)", value=180.0, step=5.0, key="sweep_hi")
+    with c3:
+        n = st.number_input("Aantal punten", min_value=2, max_value=1_000_000, value=10_000, step=1000, key="sweep_n")
+    if hi <= lo:
+        st.warning("'Tot' moet groter zijn dan 'Van'.")
+        return
+
+    grid = np.linspace(lo, hi, int(n))
+    if k is None:
+        F1s, theta1s = sweep_target_angle(S, Rmag, grid)
+        xlabel = "φ (°)"
+    else:
+        F1s, theta1s = sweep_known_angle(S, known[k]["F"], known[k]["theta"], Rmag, phi, grid)
+        xlabel = f"θ van F{k+1} (°)"
+    i_min = int(np.argmin(F1s))
+    # Tekenen met WebGL en een uitgedunde curve; het minimum komt uit het volle raster
+    shown = plot_indices(F1s)
+
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.08)
+    fig.add_trace(go.Scattergl(x=grid[shown], y=F1s[shown], mode="lines", line=dict(color="#d62728"), name="F₁ (N)"), row=1, col=1)
+    fig.add_trace(go.Scattergl(x=grid[shown], y=break_wraps(theta1s[shown]), mode="lines", line=dict(color="#1f77b4"), name="θ₁ (°)"),
+                  row=2, col=1)
+    fig.add_trace(go.Scattergl(x=[grid[i_min]], y=[F1s[i_min]], mode="markers", marker=dict(size=11, color="#2ca02c", symbol="diamond"),
+                             name="Minimum F₁"), row=1, col=1)
+    fig.update_yaxes(title_text="F₁ (N)", row=1, col=1)
+    fig.update_yaxes(title_text="θ₁ (°)", row=2, col=1)
+    fig.update_xaxes(title_text=xlabel, row=2, col=1)
+    fig.update_layout(height=520, margin=dict(l=10, r=10, t=40, b=10),
+                      legend=dict(orientation="h", yanchor="top", y=1.12, xanchor="left", x=0.0))
+    st.plotly_chart(fig, width="stretch")
+
+    theta_min = "—" if np.isnan(theta1s[i_min]) else f"{theta1s[i_min]:.2f}°"
+    st.write(f"Kleinste F₁ = **{F1s[i_min]:.2f} N** bij {xlabel.split(' (')[0]} = **{grid[i_min]:.2f}°** (θ₁ = {theta_min}).")
+
+with prof.phase("sweep"):
+    sweep_section(S, known, Rmag, phi)
+
+prof.report()
@@ -0,0 +1,267 @@
+import numpy as np
+import streamlit as st
+import plotly.graph_objects as go
+
+from statica.vectors import resultant, entries_to_cart, columns_to_cart, cart_to_alpha_beta_gamma
+from statica.plotting import add_arrows3d_batched
+from statica.export import export_section
+from statica.editor import HEX_COLOR_RE, bulk_editor, reset_bulk_editor
+from statica.store import KNOWN3D_FIELDS, UNKNOWN3D_FIELDS, VectorStore
+from statica.profiling import Profiler
+from statica.presets import preset_picker
+from statica.scenarios import scenario_section
+from statica.share import share_section
+from statica.cache import SCENE_CACHE_ENTRIES, TABLE_CACHE_ENTRIES, FIGURE_CACHE_ENTRIES, scenario_hash
+from statica.fileio import import_widget, imported_columns, export_widget, table_to_problems3d, table_length
+from statica.solver3d import STATUS_OK, STATUS_SINGULAR, STATUS_LABELS_3D, solve_magnitudes3d
+
+st.set_page_config(page_title="🧭 3D Onbekende Vector Solver", layout="wide", initial_sidebar_state="expanded")
+st.title("🧭 3D Onbekende Vector Solver")
+prof = Profiler("solver3d")
+preset_picker("solver3d")
+share_section("solver3d")
+scenario_section("solver3d")
+export_section("solver3d")
+
+# =========================
+# Helpers
+# =========================
+def pad_range(vals, pr=0.15):
+    vmin, vmax = float(np.min(vals)), float(np.max(vals))
+    if abs(vmax - vmin) < 1e-9: vmin -= 1.0; vmax += 1.0
+    pad = (vmax - vmin) * pr
+    return (vmin - pad, vmax + pad)
+
+def unknown_directions(unknowns, normalize_dircos):
+    """Richtingen van de onbekenden als (k,3); cart = X/Y/Z (lengte maakt niet uit), dir = α/β/γ."""
+    return columns_to_cart(unknowns.is_("mode", "dir"), np.ones(len(unknowns)), unknowns.stack("x", "y", "z"),
+                           unknowns.stack("alpha", "beta", "gamma"), normalize_dircos)
+
+# =========================
+# Sidebar: doel
+# =========================
+# Startwaarden via session_state (deellinks zetten dezelfde sleutels)
+for _key, _value in (("target3d_x", 0.0), ("target3d_y", 0.0), ("target3d_z", 100.0), ("normalize_solver3d", True)):
+    st.session_state.setdefault(_key, _value)
+with st.sidebar:
+    st.header("Doel (resultante)")
+    goal = st.radio("ΣF moet gelijk zijn aan:", ["Nul (evenwicht)", "Gewenste resultante R"], key="goal_3d")
+    if goal == "Nul (evenwicht)":
+        R_target = np.zeros(3)
+    else:
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            Rx = st.number_input("Rx (N)", step=10.0, key="target3d_x")
+        with c2:
+            Ry = st.number_input("Ry (N)", step=10.0, key="target3d_y")
+        with c3:
+            Rz = st.number_input("Rz (N)", step=10.0, key="target3d_z")
+        R_target = np.array([Rx, Ry, Rz])
+    st.markdown("---")
+    normalize_dircos = st.checkbox("Normaliseer α/β/γ-richtingen als cos²α+cos²β+cos²γ ≠ 1", key="normalize_solver3d")
+
+# =========================
+# Invoer: bekende krachten + onbekende richtingen
+# =========================
+PALETTE = ["#1f77b4","#ff7f0e","#2ca02c","#d62728","#9467bd",
+           "#8c564b","#e377c2","#7f7f7f","#bcbd22","#17becf"]
+UNKNOWN_COLORS = ["#d62728", "#9467bd", "#17becf"]
+MAX_UNKNOWNS = 3
+
+if "known3d" not in st.session_state:
+    # Voorbeeld: last van 500 N omlaag, gedragen door drie kabels
+    st.session_state.known3d = VectorStore(KNOWN3D_FIELDS, [{"z": -500.0, "color": "#1f77b4"}])
+if "unknowns3d" not in st.session_state:
+    st.session_state.unknowns3d = VectorStore(UNKNOWN3D_FIELDS, [
+        {"name":"F_A","x":-2.0,"y":-3.0,"z":6.0},
+        {"name":"F_B","x":3.0,"y":-2.0,"z":6.0},
+        {"name":"F_C","x":0.0,"y":4.0,"z":6.0},
+    ])
+
+DIR_COLUMNS = {
+    "mode": st.column_config.SelectboxColumn("Modus", options=["cart", "dir"], default="cart", required=True),
+    "x": st.column_config.NumberColumn("X", default=0.0),
+    "y": st.column_config.NumberColumn("Y", default=0.0),
+    "z": st.column_config.NumberColumn("Z", default=0.0),
+    "alpha": st.column_config.NumberColumn("α°", default=0.0),
+    "beta": st.column_config.NumberColumn("β°", default=0.0),
+    "gamma": st.column_config.NumberColumn("γ°", default=0.0),
+}
+
+# Invoer als fragment: tabelbewerkingen herlopen alleen dit blok
+@st.fragment
+def input_grid():
+    known, unknowns = st.session_state.known3d, st.session_state.unknowns3d
+    before = (known.version, unknowns.version)
+
+    st.subheader("Bekende krachten")
+    if st.button("🗑️ Leeg lijst"):
+        known.clear()
+        reset_bulk_editor("known3d_bulk")
+    bulk_editor(
+        known, "known3d_bulk",
+        column_config={**DIR_COLUMNS,
+                       "force": st.column_config.NumberColumn("Kracht N", min_value=0.0, default=0.0),
+                       "color": st.column_config.TextColumn("Kleur", validate=HEX_COLOR_RE)},
+        palette=PALETTE,
+    )
+    st.caption("cart gebruikt X/Y/Z (optioneel geschaald naar Kracht), dir gebruikt Kracht + α/β/γ.")
+
+    st.subheader(f"Onbekende krachten (max. {MAX_UNKNOWNS}; alleen de grootte wordt berekend)")
+    bulk_editor(
+        unknowns, "unknowns3d_bulk",
+        column_config={**DIR_COLUMNS, "name": st.column_config.TextColumn("Naam")},
+    )
+    if len(unknowns) > MAX_UNKNOWNS:
+        st.warning(f"Alleen de eerste {MAX_UNKNOWNS} onbekenden worden gebruikt.")
+    st.caption("Richting per onbekende: cart = richtingsvector X/Y/Z (lengte maakt niet uit), dir = α/β/γ. "
+               "Een negatieve uitkomst betekent: tegen de gekozen richting in.")
+
+    # Alleen bij gewijzigde invoer de hele pagina herberekenen
+    if (known.version, unknowns.version) != before:
+        st.rerun()
+
+with prof.phase("invoer"):
+    input_grid()
+
+st.markdown("---")
+
+# =========================
+# Rekenen (gecachet per scenario)
+# =========================
+@st.cache_data(max_entries=SCENE_CACHE_ENTRIES, show_spinner=False)
+def compute_scene(scene_key, _known, _unknowns, R_target, normalize_dircos):
+    known_xyz = entries_to_cart(_known, normalize_dircos=normalize_dircos)
+    S = resultant(known_xyz)
+    D = np.asarray(R_target, dtype=float) - S
+    U = unknown_directions(_unknowns, normalize_dircos)[:MAX_UNKNOWNS]
+    F, residual, cond, det, status = solve_magnitudes3d(D, U[None])
+    return known_xyz, S, D, U, F[0], float(residual[0]), float(cond[0]), float(det[0]), int(status[0])
+
+known = st.session_state.known3d
+unknowns = st.session_state.unknowns3d
+scene_key = scenario_hash(known, unknowns, R_target, normalize_dircos)
+
+if not unknowns:
+    st.info("Voeg minstens één onbekende richting toe.")
+    prof.report()
+    st.stop()
+
+with prof.phase("berekening"):
+    known_xyz, S, D, U, F, residual, cond, det, status = compute_scene(scene_key, known, unknowns, R_target, normalize_dircos)
+names = [name or f"F{i}" for i, name in enumerate(unknowns.col("name")[:MAX_UNKNOWNS].tolist(), start=1)]
+
+# =========================
+# Figuur en tabel (gecachet per scenario)
+# =========================
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def build_figure(scene_key, _known_xyz, _solved, _known_colors, names, R_target):
+    """Plotly-figuur per scenario; wordt na het bouwen niet meer aangepast en dus gedeeld."""
+    known_xyz, solved, R_target = _known_xyz, _solved, np.asarray(R_target, dtype=float)
+    fig = go.Figure()
+    add_arrows3d_batched(fig, known_xyz, _known_colors, 6, 4, True, True,
+                         legendgroup="bekend", label="Bekend", names=[f"Bekend {i}" for i in range(1, len(known_xyz)+1)])
+    add_arrows3d_batched(fig, solved, UNKNOWN_COLORS[:len(solved)], 7, 4, True, True,
+                         legendgroup="onbekend", label="Onbekend", names=list(names))
+    if R_target.any():
+        add_arrows3d_batched(fig, R_target, ["#e41a1c"], 8, 5, True, True,
+                             legendgroup="doel", label="Gewenste R", names=["R"])
+    pts = np.vstack([np.zeros((1, 3)), known_xyz, solved, R_target])
+    xr, yr, zr = (pad_range(pts[:, j]) for j in range(3))
+    fig.update_layout(
+        scene=dict(xaxis=dict(title="X", range=list(xr)), yaxis=dict(title="Y", range=list(yr)),
+                   zaxis=dict(title="Z", range=list(zr)), aspectmode="cube"),
+        margin=dict(l=0, r=0, t=40, b=0),
+        legend=dict(orientation="h", yanchor="top", y=1.12, xanchor="left", x=0.0)
+    )
+    return fig
+
+@st.cache_data(max_entries=TABLE_CACHE_ENTRIES, show_spinner=False)
+def results_table(scene_key, _known_xyz, _solved, names, R_target):
+    import pandas as pd  # lazy: pandas pas laden bij de eerste tabel
+    forces, R_target = np.vstack([_known_xyz, _solved]), np.asarray(R_target, dtype=float)
+    angles, mags = cart_to_alpha_beta_gamma(forces)
+    labels = [f"Bekend {i}" for i in range(1, len(_known_xyz)+1)] + [f"{n} (oplossing)" for n in names]
+    check = resultant(forces)
+    return pd.DataFrame({
+        "Kracht": labels + ["Som (check)", "R (gewenst)"],
+        "X": np.append(forces[:, 0], [check[0], R_target[0]]).round(2),
+        "Y": np.append(forces[:, 1], [check[1], R_target[1]]).round(2),
+        "Z": np.append(forces[:, 2], [check[2], R_target[2]]).round(2),
+        "|F| (N)": np.append(mags, [np.linalg.norm(check), np.linalg.norm(R_target)]).round(2),
+        "α (°)": np.append(angles[:, 0], [np.nan, np.nan]).round(2),
+        "β (°)": np.append(angles[:, 1], [np.nan, np.nan]).round(2),
+        "γ (°)": np.append(angles[:, 2], [np.nan, np.nan]).round(2),
+    })
+
+# =========================
+# Uitkomst
+# =========================
+st.markdown("### Uitkomst (zodat ΣF = R)")
+if status == STATUS_SINGULAR:
+    st.error(f"Geen oplossing: {STATUS_LABELS_3D[status]}.")
+else:
+    if status != STATUS_OK:
+        st.warning(f"Let op: {STATUS_LABELS_3D[status]} (conditiegetal {cond:.2e}"
+                   + (f", |det| = {det:.2e}" if len(U) == 3 else "") + f", residu {residual:.2e} N).")
+    st.write(", ".join(f"**{n} = {f:.2f} N**" for n, f in zip(names, F.tolist())))
+
+    # Plot
+    solved = F[:, None] * U
+    R_key = tuple(R_target.tolist())
+    with prof.phase("figuur bouwen"):
+        fig = build_figure(scene_key, known_xyz, solved, known.col("color").tolist(), tuple(names), R_key)
+    with prof.phase("plotly_chart"):
+        st.plotly_chart(fig, width="stretch")
+
+    # Tabel
+    with prof.phase("tabel"):
+        table = results_table(scene_key, known_xyz, solved, tuple(names), R_key)
+    st.dataframe(table, width="stretch")
+    export_widget(table, "solver_3d", key="export_solver3d")
+
+    st.markdown("**Werkwijze (in het kort):**")
+    st.markdown(
+    f"""
+- Som bekende krachten: **S = ({S[0]:.2f}, {S[1]:.2f}, {S[2]:.2f})**; de onbekenden moeten leveren **D = R − S = ({D[0]:.2f}, {D[1]:.2f}, {D[2]:.2f})**.
+- Met eenheidsvectoren u_k langs de gegeven richtingen: **Σ F_k·u_k = D**, een 3×{len(U)}-stelsel.
+- {"Drie onbekenden: det[u₁ u₂ u₃] = " + f"{det:.4f}" + " (0 ⇔ coplanaire richtingen)." if len(U) == 3 else "Minder dan drie onbekenden: het stelsel is overbepaald; de oplossing is exact alleen als D in het vlak/de lijn van de richtingen ligt."}
+    """
+    )
+
+# =========================
+# Batch: veel opgaven uit een bestand
+# =========================
+st.markdown("---")
+st.markdown("### Batch-opgaven")
+
+@st.fragment
+def batch_section():
+    with st.expander("📂 Opgaven uit bestand oplossen"):
+        st.caption("Eén opgave per rij. Kolommen `u1x,u1y,u1z` (verplicht), optioneel `u2*`, `u3*` voor meer onbekenden, "
+                   "`Sx,Sy,Sz` (som bekende krachten) en `Rx,Ry,Rz` (doel; leeg = evenwicht), en `id`.")
+        import_widget("solver3d", "import_solver3d", noun="opgaven")
+    cols = imported_columns("import_solver3d")
+    if cols is None:
+        return
+    D_b, U_b = table_to_problems3d(cols)
+    F_b, residual_b, cond_b, det_b, status_b = solve_magnitudes3d(D_b, U_b)
+    n = table_length(cols)
+    counts = np.bincount(status_b, minlength=len(STATUS_LABELS_3D))
+    st.write(f"**{n}** opgaven met {U_b.shape[1]} onbekende(n) opgelost: "
+             + ", ".join(f"{STATUS_LABELS_3D[s]}: {c}" for s, c in enumerate(counts.tolist()) if c))
+    out = {"id": cols["id"] if "id" in cols else np.arange(1, n+1)}
+    for j in range(U_b.shape[1]):
+        out[f"F{j+1} (N)"] = F_b[:, j]
+    out["Residu (N)"] = residual_b
+    out["Conditiegetal"] = cond_b
+    out["Status"] = np.asarray([STATUS_LABELS_3D[s] for s in range(len(STATUS_LABELS_3D))], dtype=object)[status_b]
+    import pandas as pd  # lazy: pandas pas laden bij de eerste tabel
+    results = pd.DataFrame(out)
+    st.dataframe(results, width="stretch")
+    export_widget(results, "solver_3d_batch", key="export_solver3d_batch")
+
+with prof.phase("batch"):
+    batch_section()
+
+prof.report()
@@ -0,0 +1,319 @@
+import numpy as np
+import streamlit as st
+import plotly.graph_objects as go
+
+from statica.truss import (STATUS_OK, STATUS_ILL, STATUS_MECHANISM, STATUS_INDETERMINATE, STATUS_LABELS_TRUSS,
+                           force_kind, pratt_truss, solve_truss, truss_arrays)
+from statica.plotting import add_arrows2d_batched, add_members_colormapped, shaft_coords
+from statica.export import export_section
+from statica.editor import bulk_editor, reset_bulk_editor
+from statica.store import TRUSS_NODE_FIELDS, TRUSS_MEMBER_FIELDS, VectorStore
+from statica.profiling import Profiler
+from statica.presets import preset_picker
+from statica.scenarios import scenario_section
+from statica.share import share_section
+from statica.paging import lazy_section, page_slice
+from statica.cache import SCENE_CACHE_ENTRIES, TABLE_CACHE_ENTRIES, FIGURE_CACHE_ENTRIES, scenario_hash
+from statica.fileio import import_widget, imported_columns, export_widget
+
+st.set_page_config(page_title="🏗️ 2D Vakwerk Solver", layout="wide", initial_sidebar_state="expanded")
+st.title("🏗️ 2D Vakwerk Solver")
+prof = Profiler("truss")
+preset_picker("truss")
+share_section("truss")
+scenario_section("truss")
+export_section("truss")
+
+# =========================
+# Helpers
+# =========================
+def pad_range(vals, pr=0.15):
+    vmin, vmax = float(np.min(vals)), float(np.max(vals))
+    if abs(vmax - vmin) < 1e-9: vmin -= 1.0; vmax += 1.0
+    pad = (vmax - vmin) * pr
+    return (vmin - pad, vmax + pad)
+
+def node_arrows(xy, forces, scale):
+    """Knoopkrachten als pijlen die in de knoop eindigen; geeft (vectoren, beginpunten, knoopnummers)."""
+    keep = np.flatnonzero(np.abs(forces).sum(axis=1) > 0)
+    v = forces[keep] * scale
+    return v, xy[keep] - v, keep + 1
+
+LOAD_COLOR, REACTION_COLOR = "#2ca02c", "#ff7f0e"
+
+# =========================
+# Session state
+# =========================
+# Voorbeeld: Pratt-ligger met 4 vakken (kolommen direct in de opslag)
+if "truss_nodes" not in st.session_state or "truss_members" not in st.session_state:
+    _nodes, _members = pratt_truss(4)
+    st.session_state.truss_nodes = VectorStore(TRUSS_NODE_FIELDS)
+    st.session_state.truss_nodes.replace_columns(_nodes)
+    st.session_state.truss_members = VectorStore(TRUSS_MEMBER_FIELDS)
+    st.session_state.truss_members.replace_columns(_members)
+
+# =========================
+# Sidebar: generator
+# =========================
+for _key, _value in (("truss_panels", 8), ("truss_span", 16.0), ("truss_height", 2.0), ("truss_load", 10_000.0)):
+    st.session_state.setdefault(_key, _value)
+with st.sidebar:
+    st.header("Pratt-ligger genereren")
+    panels = st.number_input("Aantal vakken", min_value=2, max_value=20_000, step=1, key="truss_panels")
+    c1, c2 = st.columns(2)
+    with c1:
+        span = st.number_input("Overspanning", min_value=0.1, step=1.0, key="truss_span")
+    with c2:
+        height = st.number_input("Hoogte", min_value=0.1, step=0.5, key="truss_height")
+    load = st.number_input("Last per binnenknoop (N, omlaag)", step=1000.0, key="truss_load")
+    st.caption(f"{2 * int(panels) + 2} knopen, {4 * int(panels) + 1} staven; scharnier links, rol rechts.")
+    if st.button("🏗️ Genereer (vervangt de invoer)", width="stretch"):
+        _nodes, _members = pratt_truss(int(panels), span, height, load)
+        st.session_state.truss_nodes.replace_columns(_nodes)
+        st.session_state.truss_members.replace_columns(_members)
+        reset_bulk_editor("truss_nodes_bulk")
+        reset_bulk_editor("truss_members_bulk")
+
+# =========================
+# Invoer: knopen + staven
+# =========================
+def apply_import(state_key, store, editor_key):
+    """Een nieuw geïmporteerd bestand één keer in de opslag zetten (vervangt de tabel)."""
+    cols = imported_columns(state_key)
+    applied_key = f"{state_key}_applied"
+    if cols is None or st.session_state.get(applied_key) == st.session_state[state_key]["file_id"]:
+        return
+    st.session_state[applied_key] = st.session_state[state_key]["file_id"]
+    store.replace_columns({c: np.nan_to_num(v) for c, v in cols.items()})
+    reset_bulk_editor(editor_key)
+
+# Invoer als fragment: tabelbewerkingen herlopen alleen dit blok
+@st.fragment
+def input_grid():
+    nodes, members = st.session_state.truss_nodes, st.session_state.truss_members
+    before = (nodes.version, members.version)
+
+    with st.expander("📂 Importeren uit bestand"):
+        st.caption("Knopen: kolommen `x,y`, optioneel `fix_x,fix_y` (0/1) en `Fx,Fy`. "
+                   "Staven: kolommen `a,b` met knoopnummers (1 = eerste knoop). Een import vervangt de tabel.")
+        import_widget("truss_nodes", "import_truss_nodes", noun="knopen")
+        import_widget("truss_members", "import_truss_members", noun="staven")
+    apply_import("import_truss_nodes", nodes, "truss_nodes_bulk")
+    apply_import("import_truss_members", members, "truss_members_bulk")
+
+    c1, c2 = st.columns([3, 2])
+    with c1:
+        st.subheader(f"Knopen ({len(nodes)})")
+        bulk_editor(
+            nodes, "truss_nodes_bulk",
+            column_config={
+                "x": st.column_config.NumberColumn("x", default=0.0),
+                "y": st.column_config.NumberColumn("y", default=0.0),
+                "fix_x": st.column_config.CheckboxColumn("Vast x", default=False),
+                "fix_y": st.column_config.CheckboxColumn("Vast y", default=False),
+                "Fx": st.column_config.NumberColumn("Fx (N)", default=0.0),
+                "Fy": st.column_config.NumberColumn("Fy (N)", default=0.0),
+            },
+        )
+        st.caption("Knoopnummer = rijnummer (1, 2, ...). Scharnier: vast x én y; rol: alleen vast y (of x).")
+    with c2:
+        st.subheader(f"Staven ({len(members)})")
+        bulk_editor(
+            members, "truss_members_bulk",
+            column_config={
+                "a": st.column_config.NumberColumn("Knoop a", min_value=1, step=1, default=1),
+                "b": st.column_config.NumberColumn("Knoop b", min_value=1, step=1, default=2),
+            },
+        )
+
+    # Alleen bij gewijzigde invoer de hele pagina herberekenen
+    if (nodes.version, members.version) != before:
+        st.rerun()
+
+with prof.phase("invoer"):
+    input_grid()
+
+st.markdown("---")
+
+# =========================
+# Rekenen (gecachet per scenario)
+# =========================
+@st.cache_data(max_entries=SCENE_CACHE_ENTRIES, show_spinner=False)
+def compute_scene(scene_key, _nodes, _members):
+    """Opbouw van het sparse stelsel en één LU-factorisatie per scenario; ValueError bij ongeldige invoer."""
+    xy, ends, fix, loads = truss_arrays(_nodes, _members)
+    N, reactions, residual, L, nnz, status = solve_truss(xy, ends, fix, loads)
+    return xy, ends, fix, loads, N, reactions, residual, L, nnz, status
+
+nodes = st.session_state.truss_nodes
+members = st.session_state.truss_members
+scene_key = scenario_hash(nodes, members)
+
+if len(nodes) < 2 or not len(members):
+    st.info("Voeg minstens twee knopen en één staaf toe (of genereer een ligger in de sidebar).")
+    prof.report()
+    st.stop()
+
+with prof.phase("berekening"):
+    try:
+        xy, ends, fix, loads, N, reactions, residual, L, nnz, status = compute_scene(scene_key, nodes, members)
+    except ValueError as e:
+        st.error(f"Ongeldig vakwerk: {e}.")
+        prof.report()
+        st.stop()
+n, m, r = len(xy), len(ends), int(fix.sum())
+solved = status in (STATUS_OK, STATUS_ILL)
+
+# =========================
+# Uitkomst
+# =========================
+st.markdown("### Uitkomst")
+count = f"{m} staven + {r} reacties = {m + r} onbekenden, 2n = {2 * n} vergelijkingen"
+if status == STATUS_MECHANISM:
+    st.error(f"Geen oplossing: {STATUS_LABELS_TRUSS[status]} ({count}; er ontbreken {2 * n - m - r}).")
+elif status == STATUS_INDETERMINATE:
+    st.error(f"Geen oplossing met alleen evenwicht: {STATUS_LABELS_TRUSS[status]} ({count}; {m + r - 2 * n} te veel).")
+elif not solved:
+    st.error(f"Geen oplossing: {STATUS_LABELS_TRUSS[status]} ({count}). Controleer opleggingen en staven op één lijn.")
+else:
+    if status == STATUS_ILL:
+        st.warning(f"Let op: {STATUS_LABELS_TRUSS[status]} (residu {residual:.2e} N).")
+    kinds = force_kind(N)
+    i_max = int(np.argmax(np.abs(N)))
+    st.write(f"**{m}** staven: **{int((kinds == 'trek').sum())}** trek, **{int((kinds == 'druk').sum())}** druk, "
+             f"**{int((kinds == 'nul').sum())}** nulstaven. Grootste |N| = **{abs(N[i_max]):.2f} N** "
+             f"({kinds[i_max]}, staaf {i_max + 1}).")
+
+# =========================
+# Plot (fragment: weergave-opties herlopen alleen de figuur)
+# =========================
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def build_figure(scene_key, _xy, _ends, _fix, _loads, _N, _reactions, solved, style):
+    """Plotly-figuur per (scenario, weergave); wordt na het bouwen niet meer aangepast en dus gedeeld."""
+    xy, ends, fix = _xy, _ends, _fix
+    fig = go.Figure()
+    if solved:
+        add_members_colormapped(fig, xy, ends, _N, style["linewidth"])
+    else:
+        xs, ys = shaft_coords(xy[ends[:, 1]] - xy[ends[:, 0]], xy[ends[:, 0]])
+        fig.add_trace(go.Scattergl(x=xs, y=ys, mode="lines", line=dict(color="#9e9e9e", width=style["linewidth"]),
+                                   hoverinfo="skip", name="Staven"))
+    fig.add_trace(go.Scattergl(x=xy[:, 0], y=xy[:, 1], mode="markers", marker=dict(size=5, color="#424242"),
+                               text=[f"Knoop {i}" for i in range(1, len(xy) + 1)],
+                               hovertemplate="%{text}<br>(%{x:.2f}, %{y:.2f})<extra></extra>", name="Knopen"))
+    pin, roller = fix.all(axis=1), fix.any(axis=1) & ~fix.all(axis=1)
+    for sel, symbol, label in ((pin, "triangle-up", "Scharnier"), (roller, "circle-open", "Rol")):
+        if sel.any():
+            fig.add_trace(go.Scatter(x=xy[sel, 0], y=xy[sel, 1], mode="markers", name=label, hoverinfo="skip",
+                                     marker=dict(symbol=symbol, size=14, color="#616161", line=dict(width=2))))
+
+    # Pijlen eindigen in de knoop; de grootste kracht krijgt 15% van de afmeting van het vakwerk
+    size = max(float(np.ptp(xy[:, 0])), float(np.ptp(xy[:, 1])), 1e-9)
+    forces = [_loads] + ([_reactions] if solved and style["show_reactions"] else [])
+    scale = 0.15 * size / max(max(float(np.abs(f).max()) for f in forces), 1e-9)
+    pts = [xy]
+    if style["show_loads"]:
+        v, p, k = node_arrows(xy, _loads, scale)
+        add_arrows2d_batched(fig, v, [LOAD_COLOR] * len(v), 2, 4, True, names=[f"Last knoop {i}" for i in k], origins=p)
+        pts.append(p)
+    if solved and style["show_reactions"]:
+        v, p, k = node_arrows(xy, _reactions, scale)
+        add_arrows2d_batched(fig, v, [REACTION_COLOR] * len(v), 2, 4, True, names=[f"Reactie knoop {i}" for i in k],
+                             origins=p)
+        pts.append(p)
+    pts = np.vstack(pts)
+    fig.update_layout(
+        xaxis=dict(title="x", range=list(pad_range(pts[:, 0], 0.05))),
+        yaxis=dict(title="y", range=list(pad_range(pts[:, 1], 0.3)), scaleanchor="x", scaleratio=1),
+        margin=dict(l=10, r=10, t=40, b=10),
+        legend=dict(orientation="h", yanchor="top", y=1.12, xanchor="left", x=0.0),
+    )
+    return fig
+
+@st.fragment
+def plot_section(scene_key, xy, ends, fix, loads, N, reactions, solved):
+    with st.sidebar:
+        st.markdown("---")
+        st.subheader("Weergave")
+        style = dict(
+            linewidth=st.slider("Staafdikte", 1, 12, 4, key="truss_linewidth"),
+            show_loads=st.checkbox("Toon lasten", value=True, key="truss_show_loads"),
+            show_reactions=st.checkbox("Toon reacties", value=True, key="truss_show_reactions"),
+        )
+    st.caption("Kleur: rood = trek, blauw = druk (N > 0 is trek). Groen = last, oranje = reactie.")
+    with prof.phase("figuur bouwen"):
+        fig = build_figure(scene_key, xy, ends, fix, loads, N, reactions, solved, style)
+    with prof.phase("plotly_chart"):
+        st.plotly_chart(fig, width="stretch")
+
+plot_section(scene_key, xy, ends, fix, loads, N, reactions, solved)
+
+# =========================
+# Resultaten (fragmenten: tabellen pas bij openklappen, per pagina)
+# =========================
+def member_frame(rows, ends, L, N):
+    import pandas as pd  # lazy: pandas pas laden bij de eerste tabel
+    idx = np.arange(len(ends))[rows]
+    return pd.DataFrame({
+        "Staaf": idx + 1,
+        "Knoop a": ends[rows, 0] + 1,
+        "Knoop b": ends[rows, 1] + 1,
+        "L": L[rows].round(4),
+        "N (N)": N[rows].round(2) + 0.0,   # + 0.0: geen −0.00 in de tabel
+        "Soort": force_kind(N)[rows],   # drempel t.o.v. de grootste |N| van het hele vakwerk
+    }, index=idx)
+
+def node_frame(rows, xy, fix, loads, reactions):
+    import pandas as pd  # lazy: pandas pas laden bij de eerste tabel
+    idx = np.arange(len(xy))[rows]
+    return pd.DataFrame({
+        "Knoop": idx + 1,
+        "x": xy[rows, 0], "y": xy[rows, 1],
+        "Fx (N)": loads[rows, 0], "Fy (N)": loads[rows, 1],
+        "Rx (N)": np.where(fix[rows, 0], reactions[rows, 0], np.nan).round(2),
+        "Ry (N)": np.where(fix[rows, 1], reactions[rows, 1], np.nan).round(2),
+    }, index=idx)
+
+TABLE_FRAMES = {"members": member_frame, "nodes": node_frame}
+
+@st.cache_data(max_entries=TABLE_CACHE_ENTRIES, show_spinner=False)
+def paged_table(scene_key, name, start, stop, _args):
+    """Alleen de rijen van de zichtbare pagina van tabel `name` (gecachet per scenario en pagina)."""
+    return TABLE_FRAMES[name](slice(start, stop), *_args)
+
+@st.fragment
+def table_section(scene_key, name, args, n, label, key, basename):
+    exp, is_open = lazy_section(label, key=f"{key}_open")
+    if not is_open:
+        return
+    with exp:
+        sl = page_slice(n, key=f"{key}_page")
+        st.dataframe(paged_table(scene_key, name, sl.start, sl.stop, args), width="stretch")
+        # Volledige tabel pas bij het downloaden
+        export_widget(lambda: TABLE_FRAMES[name](slice(None), *args), basename, key=f"export_{key}")
+
+def explanation(n, m, r, nnz, status, residual, reactions, loads):
+    st.markdown("**Werkwijze (in het kort):**")
+    lines = [
+        f"- Per knoop ΣFx = 0 en ΣFy = 0: **2n = {2 * n}** vergelijkingen; onbekend zijn **{m}** staafkrachten N "
+        f"(trek positief) en **{r}** reacties.",
+        f"- Staaf a–b met eenheidsvector u = (x_b − x_a)/L: +N·u in knoop a, −N·u in knoop b. Samen één sparse "
+        f"stelsel A·[N; R] = −P van {2 * n} × {m + r} met **{nnz}** niet-nul coëfficiënten (≤ 4 per staaf).",
+        "- Statisch bepaald alleen als m + r = 2n; dan lost één sparse LU-factorisatie (SuperLU) het hele vakwerk "
+        "in één keer op. Een singuliere factorisatie betekent een geometrisch instabiel vakwerk.",
+    ]
+    if status in (STATUS_OK, STATUS_ILL):
+        Rsum = reactions.sum(axis=0)
+        lines.append(f"- Controle: residu |A·x + P| = {residual:.2e} N; ΣR = ({Rsum[0]:.2f}, {Rsum[1]:.2f}) N "
+                     f"tegen Σlasten = ({loads[:, 0].sum():.2f}, {loads[:, 1].sum():.2f}) N.")
+    st.markdown("\n".join(lines))
+
+if solved:
+    with prof.phase("tabel"):
+        table_section(scene_key, "members", (ends, L, N), m, f"📋 Staafkrachten ({m} staven)",
+                      "truss_members_table", "vakwerk_staven")
+        table_section(scene_key, "nodes", (xy, fix, loads, reactions), n, f"📋 Knopen en reacties ({n} knopen)",
+                      "truss_nodes_table", "vakwerk_knopen")
+explanation(n, m, r, nnz, status, residual, reactions, loads)
+
+prof.report()
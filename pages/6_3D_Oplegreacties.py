@@ -0,0 +1,308 @@
+import numpy as np
+import streamlit as st
+import plotly.graph_objects as go
+
+from statica.rigid3d import (STATUS_OK, STATUS_ILL, STATUS_MECHANISM, STATUS_INDETERMINATE, STATUS_LABELS_RIGID,
+                             free_motions, in_balance, load_vectors, reaction_vectors, rigid_arrays,
+                             solve_reactions, support_matrix)
+from statica.plotting import add_arrows3d_batched
+from statica.export import export_section
+from statica.editor import HEX_COLOR_RE, bulk_editor, reset_bulk_editor
+from statica.store import RIGID_LOAD_FIELDS, RIGID_SUPPORT_FIELDS, VectorStore
+from statica.profiling import Profiler
+from statica.presets import preset_picker
+from statica.scenarios import scenario_section
+from statica.share import share_section
+from statica.paging import lazy_section, page_slice
+from statica.cache import SCENE_CACHE_ENTRIES, TABLE_CACHE_ENTRIES, FIGURE_CACHE_ENTRIES, scenario_hash
+from statica.fileio import import_widget, imported_columns, export_widget, table_to_cart, table_points, table_colors, table_length
+
+st.set_page_config(page_title="🧱 3D Oplegreacties", layout="wide", initial_sidebar_state="expanded")
+st.title("🧱 3D Oplegreacties (evenwicht star lichaam)")
+prof = Profiler("rigid3d")
+preset_picker("rigid3d")
+share_section("rigid3d")
+scenario_section("rigid3d")
+export_section("rigid3d")
+
+# =========================
+# Helpers
+# =========================
+def pad_range(vals, pr=0.15):
+    vmin, vmax = float(np.min(vals)), float(np.max(vals))
+    if abs(vmax - vmin) < 1e-9: vmin -= 1.0; vmax += 1.0
+    pad = (vmax - vmin) * pr
+    return (vmin - pad, vmax + pad)
+
+def unique_names(names):
+    """Reactienamen (leeg → R1, R2, ...); dubbele namen krijgen hun volgnummer erbij."""
+    names = [n or f"R{i}" for i, n in enumerate(names, start=1)]
+    return [f"{n} [{i}]" if names.count(n) > 1 else n for i, n in enumerate(names, start=1)]
+
+PALETTE = ["#1f77b4","#ff7f0e","#2ca02c","#d62728","#9467bd",
+           "#8c564b","#e377c2","#7f7f7f","#bcbd22","#17becf"]
+REACTION_COLOR, COUPLE_COLOR = "#ff7f0e", "#9467bd"
+ROW_LABELS = ["ΣFx", "ΣFy", "ΣFz", "ΣMx", "ΣMy", "ΣMz"]
+
+# =========================
+# Session state + sidebar
+# =========================
+if "rigid_loads" not in st.session_state:
+    # Voorbeeld: ingeklemde console met een verticale en een zijdelingse last
+    st.session_state.rigid_loads = VectorStore(RIGID_LOAD_FIELDS, [
+        {"z": -1000.0, "px": 2.0, "color": "#1f77b4"},
+        {"y": 500.0, "px": 2.0, "pz": 0.5, "color": "#ff7f0e"},
+    ])
+if "rigid_supports" not in st.session_state:
+    st.session_state.rigid_supports = VectorStore(RIGID_SUPPORT_FIELDS, [
+        {"name": "Ax", "x": 1.0}, {"name": "Ay", "y": 1.0}, {"name": "Az", "z": 1.0},
+        {"name": "MAx", "type": "moment", "x": 1.0}, {"name": "MAy", "type": "moment", "y": 1.0},
+        {"name": "MAz", "type": "moment", "z": 1.0},
+    ])
+
+# Startwaarden via session_state (deellinks zetten dezelfde sleutels)
+st.session_state.setdefault("normalize_rigid3d", True)
+with st.sidebar:
+    st.header("Instellingen")
+    normalize_dircos = st.checkbox("Normaliseer α/β/γ-richtingen als cos²α+cos²β+cos²γ ≠ 1", key="normalize_rigid3d")
+
+# =========================
+# Invoer: onbekende reacties + belastingen
+# =========================
+DIR_COLUMNS = {
+    "mode": st.column_config.SelectboxColumn("Modus", options=["cart", "dir"], default="cart", required=True),
+    "x": st.column_config.NumberColumn("X", default=0.0),
+    "y": st.column_config.NumberColumn("Y", default=0.0),
+    "z": st.column_config.NumberColumn("Z", default=0.0),
+    "alpha": st.column_config.NumberColumn("α°", default=0.0),
+    "beta": st.column_config.NumberColumn("β°", default=0.0),
+    "gamma": st.column_config.NumberColumn("γ°", default=0.0),
+    "px": st.column_config.NumberColumn("Px", default=0.0),
+    "py": st.column_config.NumberColumn("Py", default=0.0),
+    "pz": st.column_config.NumberColumn("Pz", default=0.0),
+}
+
+# Invoer als fragment: tabelbewerkingen herlopen alleen dit blok
+@st.fragment
+def input_grid():
+    loads, supports = st.session_state.rigid_loads, st.session_state.rigid_supports
+    before = (loads.version, supports.version)
+
+    st.subheader("Onbekende reacties (opleggingen)")
+    bulk_editor(
+        supports, "rigid_supports_bulk",
+        column_config={**DIR_COLUMNS,
+                       "name": st.column_config.TextColumn("Naam"),
+                       "type": st.column_config.SelectboxColumn("Soort", options=["kracht", "moment"],
+                                                                default="kracht", required=True)},
+    )
+    st.caption("Eén rij per reactiecomponent: een kracht langs de richting door P, of een koppel om die as "
+               "(inklemming). Richting: cart = X/Y/Z (lengte maakt niet uit), dir = α/β/γ. "
+               "Zes onafhankelijke reacties maken het lichaam statisch bepaald.")
+
+    st.subheader("Belastingen")
+    if st.button("🗑️ Leeg lijst"):
+        loads.clear()
+        reset_bulk_editor("rigid_loads_bulk")
+    bulk_editor(
+        loads, "rigid_loads_bulk",
+        column_config={**DIR_COLUMNS,
+                       "case": st.column_config.NumberColumn("Geval", default=1.0, step=1.0),
+                       "force": st.column_config.NumberColumn("Kracht N", min_value=0.0, default=0.0),
+                       "color": st.column_config.TextColumn("Kleur", validate=HEX_COLOR_RE)},
+        palette=PALETTE,
+    )
+    st.caption("Per rij een kracht met aangrijpingspunt P; rijen met hetzelfde gevalnummer vormen samen één "
+               "belastinggeval. cart gebruikt X/Y/Z (optioneel geschaald naar Kracht), dir gebruikt Kracht + α/β/γ.")
+    with st.expander("📂 Belastingen importeren uit bestand"):
+        st.caption("Kolommen `x,y,z` (optioneel `force`) of `force,alpha,beta,gamma`; aangrijpingspunt `px,py,pz` en "
+                   "belastinggeval `case` (ontbreekt: geval 1). Zo zijn duizenden gevallen in één keer op te lossen.")
+        import_widget("rigid3d", "import_rigid3d", noun="belastingen")
+
+    # Alleen bij gewijzigde invoer de hele pagina herberekenen
+    if (loads.version, supports.version) != before:
+        st.rerun()
+
+with prof.phase("invoer"):
+    input_grid()
+
+st.markdown("---")
+
+# =========================
+# Rekenen (gecachet per scenario)
+# =========================
+@st.cache_data(max_entries=SCENE_CACHE_ENTRIES, show_spinner=False)
+def compute_scene(scene_key, _loads, _supports, _imported, normalize_dircos):
+    """Eén matrix A voor de opleggingen, één factorisatie, alle belastinggevallen in één oplossing."""
+    forces, points, cases, is_moment, at, directions = rigid_arrays(_loads, _supports, normalize_dircos)
+    colors = [c or PALETTE[0] for c in _loads.col("color").tolist()]
+    if _imported is not None:
+        n = table_length(_imported)
+        forces = np.vstack([forces, table_to_cart(_imported, normalize_dircos)])
+        points = np.vstack([points, table_points(_imported, 3)])
+        cases = np.concatenate([cases, _imported["case"] if "case" in _imported else np.ones(n)])
+        colors += table_colors(_imported, PALETTE[0])
+    A = support_matrix(is_moment, at, directions)
+    labels, B = load_vectors(points, forces, cases)
+    X, residual, rank, cond, status = solve_reactions(A, B)
+    return (forces, points, cases, colors, is_moment, at, directions, A, labels, B, X, residual,
+            in_balance(residual, B), rank, cond, status)
+
+loads = st.session_state.rigid_loads
+supports = st.session_state.rigid_supports
+imported = imported_columns("import_rigid3d")
+scene_key = scenario_hash(loads, supports, imported, normalize_dircos)
+
+if not len(supports):
+    st.info("Voeg minstens één onbekende reactie toe.")
+    prof.report()
+    st.stop()
+
+with prof.phase("berekening"):
+    (forces, points, cases, colors, is_moment, at, directions, A, labels, B, X, residual, balanced,
+     rank, cond, status) = compute_scene(scene_key, loads, supports, imported, normalize_dircos)
+names = unique_names(supports.col("name").tolist())
+units = ["N·m" if m else "N" for m in is_moment.tolist()]
+k, L = len(names), len(labels)
+solved = np.isfinite(X).all() and L > 0
+
+# =========================
+# Uitkomst
+# =========================
+st.markdown("### Uitkomst (zodat ΣF = 0 en ΣM = 0)")
+degrees = f"{k} onbekenden, rang(A) = {rank}"
+if status == STATUS_INDETERMINATE:
+    st.error(f"Geen eenduidige oplossing: {STATUS_LABELS_RIGID[status]} ({degrees}; {k - rank} overtallig). "
+             "Evenwicht alleen bepaalt de reacties dan niet; verwijder overtallige reacties.")
+elif rank < k:
+    st.error(f"Geen eenduidige oplossing: {STATUS_LABELS_RIGID[status]} ({degrees}): {k - rank} reactie(s) hangen "
+             f"af van de andere en {6 - rank} beweging(en) blijven vrij. Controleer richtingen en punten.")
+elif status == STATUS_MECHANISM:
+    st.warning(f"Let op: {STATUS_LABELS_RIGID[status]} ({degrees} < 6, {6 - rank} vrije beweging(en)). "
+               f"{int(balanced.sum())} van {L} belastinggeval(len) drijven die beweging niet aan en zijn in evenwicht.")
+elif status == STATUS_ILL:
+    st.warning(f"Let op: {STATUS_LABELS_RIGID[status]} (conditiegetal {cond:.2e}).")
+if status != STATUS_OK and rank < 6:
+    motions = free_motions(A)
+    st.markdown("\n".join(
+        f"- Vrije beweging {i}: translatie v = ({w[0]:.3f}, {w[1]:.3f}, {w[2]:.3f}), "
+        f"rotatie ω = ({w[3]:.3f}, {w[4]:.3f}, {w[5]:.3f})" for i, w in enumerate(motions.tolist(), start=1)))
+if not L:
+    st.info("Nog geen belastingen: vul hierboven een kracht in (of importeer een bestand).")
+elif solved and L == 1:
+    st.write(", ".join(f"**{n} = {round(x, 2) + 0.0:.2f} {u}**" for n, x, u in zip(names, X[:, 0].tolist(), units)))
+
+# =========================
+# Plot (fragment: gevalkeuze en weergave herlopen alleen de figuur)
+# =========================
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def build_figure(scene_key, case, _forces, _points, _colors, _R, _is_moment, _at, names, style):
+    """Plotly-figuur per (scenario, belastinggeval, weergave); pijlen geschaald op de afmeting van het lichaam."""
+    size = max(float(np.ptp(np.vstack([_points, _at, np.zeros((1, 3))]), axis=0).max()), 1.0)
+    F_max = max(float(np.abs(_forces).max(initial=0.0)), float(np.abs(_R[~_is_moment]).max(initial=0.0)), 1e-9)
+    M_max = max(float(np.abs(_R[_is_moment]).max(initial=0.0)), 1e-9)
+    fig = go.Figure()
+    loads_v = _forces * (style["arrow_size"] * size / F_max)
+    add_arrows3d_batched(fig, loads_v, _colors, 6, 3, False, True, legendgroup="belasting", label="Belasting",
+                         names=[f"Belasting {i}" for i in range(1, len(_forces) + 1)], origins=_points)
+    shown = np.flatnonzero(np.abs(_R).sum(axis=1) > 0)
+    scale = style["arrow_size"] * size * np.where(_is_moment, 1 / M_max, 1 / F_max)[:, None]
+    for sel, color, label in ((~_is_moment, REACTION_COLOR, "Reactiekracht"), (_is_moment, COUPLE_COLOR, "Reactiekoppel")):
+        idx = shown[sel[shown]]
+        add_arrows3d_batched(fig, (_R * scale)[idx], [color] * len(idx), 7, 3, False, True, legendgroup=label,
+                             label=label, names=[names[i] for i in idx.tolist()], origins=_at[idx])
+    fig.add_trace(go.Scatter3d(x=_at[:, 0], y=_at[:, 1], z=_at[:, 2], mode="markers", name="Opleggingen",
+                               marker=dict(size=6, color="#424242", symbol="square"), hoverinfo="skip"))
+    pts = np.vstack([np.zeros((1, 3)), _points, _points + loads_v, _at, _at + _R * scale])
+    xr, yr, zr = (pad_range(pts[:, j]) for j in range(3))
+    fig.update_layout(
+        title=f"Belastinggeval {case:g}",
+        scene=dict(xaxis=dict(title="X", range=list(xr)), yaxis=dict(title="Y", range=list(yr)),
+                   zaxis=dict(title="Z", range=list(zr)), aspectmode="data"),
+        margin=dict(l=0, r=0, t=40, b=0),
+        legend=dict(orientation="h", yanchor="top", y=1.12, xanchor="left", x=0.0)
+    )
+    return fig
+
+@st.fragment
+def plot_section(scene_key, forces, points, cases, colors, labels, X, is_moment, at, directions, names):
+    with st.sidebar:
+        st.markdown("---")
+        st.subheader("Weergave")
+        case = st.selectbox("Belastinggeval in de figuur", labels.tolist(), format_func=lambda c: f"{c:g}",
+                            key="rigid_case")
+        style = dict(arrow_size=st.slider("Pijllengte (× afmeting lichaam)", 0.1, 1.0, 0.3, 0.05, key="rigid_arrow"))
+    j = int(np.searchsorted(labels, case))
+    sel = cases == case
+    R = reaction_vectors(np.nan_to_num(X[:, j]), directions)
+    st.caption("Groen/eigen kleur = belasting, oranje = reactiekracht, paars = reactiekoppel (as volgens de "
+               "rechterhandregel). Krachten en koppels zijn elk op hun eigen grootste waarde geschaald.")
+    with prof.phase("figuur bouwen"):
+        fig = build_figure(scene_key, float(case), forces[sel], points[sel],
+                           [c for c, s in zip(colors, sel.tolist()) if s], R, is_moment, at, tuple(names), style)
+    with prof.phase("plotly_chart"):
+        st.plotly_chart(fig, width="stretch")
+
+if L:
+    plot_section(scene_key, forces, points, cases, colors, labels, X, is_moment, at, directions, names)
+
+# =========================
+# Resultaten + Uitleg (fragmenten: tabellen pas bij openklappen, per pagina)
+# =========================
+def results_frame(rows, labels, X, residual, balanced, names, units):
+    """Reacties per belastinggeval voor de gevallen in `rows` (slice)."""
+    import pandas as pd  # lazy: pandas pas laden bij de eerste tabel
+    table = {"Geval": labels[rows]}
+    for name, unit, x in zip(names, units, X):
+        table[f"{name} ({unit})"] = x[rows].round(2) + 0.0   # + 0.0: geen −0.00 in de tabel
+    table["Residu"] = residual[rows]
+    table["Evenwicht"] = np.where(balanced[rows], "ja", "nee")
+    return pd.DataFrame(table, index=np.arange(len(labels))[rows])
+
+@st.cache_data(max_entries=TABLE_CACHE_ENTRIES, show_spinner=False)
+def results_table(scene_key, start, stop, _labels, _X, _residual, _balanced, names, units):
+    """Alleen de rijen van de zichtbare pagina (gecachet per scenario en pagina)."""
+    return results_frame(slice(start, stop), _labels, _X, _residual, _balanced, names, units)
+
+@st.fragment
+def results_section(scene_key, labels, X, residual, balanced, names, units):
+    exp, is_open = lazy_section(f"📋 Reacties per belastinggeval ({len(labels)} gevallen)", key="results_open_rigid3d")
+    if not is_open:
+        return
+    args = (labels, X, residual, balanced, names, units)
+    with exp:
+        sl = page_slice(len(labels), key="results_page_rigid3d")
+        st.dataframe(results_table(scene_key, sl.start, sl.stop, *args), width="stretch")
+        # Volledige tabel pas bij het downloaden
+        export_widget(lambda: results_frame(slice(None), *args), "oplegreacties_3d", key="export_rigid3d")
+
+@st.fragment
+def explanation_section(A, B, labels, names, k, rank, cond, status):
+    exp, is_open = lazy_section("📝 Uitleg (stap voor stap)", key="explain_open_rigid3d")
+    if not is_open:
+        return
+    import pandas as pd  # lazy: pandas pas laden bij de eerste tabel
+    with exp:
+        st.markdown(
+        f"""
+- Evenwicht van een star lichaam: **ΣF = 0** en **ΣM = 0** (momenten om de oorsprong), zes vergelijkingen.
+- Reactiekracht met eenheidsrichting u in P: kolom **[u; P × u]**; reactiekoppel om as u: kolom **[0; u]**. Samen A (6 × {k}).
+- Belasting per geval: **b = [ΣF; Σ P × F]**, op te lossen **A·x = −b**.
+- Rang(A) = **{rank}**, conditiegetal {cond:.2e} → **{STATUS_LABELS_RIGID[status]}**. Rang 6 met 6 onbekenden is statisch bepaald; rang < 6 laat een beweging vrij, meer onbekenden dan de rang zijn overtallig.
+- A hangt alleen van de opleggingen af: één factorisatie ({"LU" if k == 6 else "QR"}) en daarna één oplossing voor alle {len(labels)} rechterleden samen.
+        """
+        )
+        st.markdown("**Coëfficiëntenmatrix A:**")
+        st.dataframe(pd.DataFrame(A.round(4) + 0.0, index=ROW_LABELS, columns=names), width="stretch")
+        st.markdown(f"**Rechterleden b** (geval {labels[0]:g}" + (f" t/m {labels[-1]:g}" if len(labels) > 1 else "") + "):")
+        sl = page_slice(len(labels), key="explain_page_rigid3d")
+        st.dataframe(pd.DataFrame(B[:, sl].round(2) + 0.0, index=ROW_LABELS,
+                                  columns=[f"Geval {c:g}" for c in labels[sl].tolist()]), width="stretch")
+
+if L:
+    with prof.phase("tabel"):
+        results_section(scene_key, labels, X, residual, balanced, tuple(names), tuple(units))
+    with prof.phase("uitleg"):
+        explanation_section(A, B, labels, names, k, rank, cond, status)
+
+prof.report()
@@ -0,0 +1 @@
+"""Gedeelde rekenkern en hulpfuncties voor de Statica Toolbox-pagina's."""
@@ -0,0 +1,128 @@
+"""Headless batch-solver: JSONL met opgaven in, JSONL met F₁ per opgave uit.
+
+Gebruik:
+    python -m statica.batch opgaven.jsonl -o uitkomsten.jsonl [--chunk 10000] [--workers 4]
+
+Elke invoerregel is één opgave, bv.
+    {"id": "opg-1", "known": [{"F": 450, "theta": 45}, {"F": 200, "theta": 0}], "R": 1000, "phi": 0}
+De regels worden in blokken gelezen, per blok gevectoriseerd opgelost en meteen
+weggeschreven; met `--workers` gaan de blokken over een procespool met hooguit
+`WINDOW_PER_WORKER` × workers blokken tegelijk in behandeling (volgorde blijft
+behouden, geheugen begrensd). Ongeldige regels leveren een regel met `error` op.
+"""
+import argparse
+import itertools
+import json
+import math
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from statica.solver import parse_problem, solve_problems
+
+CHUNK_LINES = 10_000
+WINDOW_PER_WORKER = 2   # ingediende blokken per proces; meer houdt alleen extra invoer in het geheugen
+
+
+# Eén encoder voor alle regels (json.dumps met opties bouwt er anders per aanroep een nieuwe)
+_ENCODE = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _columns(res, ndigits):
+    """Uitkomst-arrays → per kolom een Python-lijst (afgerond, NaN → None)."""
+    cols = {}
+    for k, arr in res.items():
+        if ndigits is not None:
+            arr = np.round(arr, ndigits)
+        vals = arr.tolist()
+        if np.isnan(arr).any():
+            vals = [None if math.isnan(v) else v for v in vals]
+        cols[k] = vals
+    return cols
+
+
+def solve_chunk(args):
+    """(eerste regelnummer, regels, decimalen) → lijst JSON-strings met de uitkomst per regel."""
+    start, lines, ndigits = args
+    keys, problems, out = [], [], [None] * len(lines)
+    for i, line in enumerate(lines):
+        lineno = start + i
+        if not line.strip():
+            continue
+        try:
+            rec = json.loads(line)
+            problems.append(parse_problem(rec))
+            keys.append((i, rec.get("id", lineno)))
+        except (ValueError, TypeError, AttributeError) as e:
+            out[i] = _ENCODE({"line": lineno, "error": str(e)})
+
+    cols = _columns(solve_problems(problems), ndigits)
+    names = list(cols)
+    for (i, pid), row in zip(keys, zip(*cols.values())):
+        out[i] = _ENCODE({"id": pid, **dict(zip(names, row))})
+    return [o for o in out if o is not None]
+
+
+def _chunks(stream, size, ndigits):
+    """Lever (eerste regelnummer, regels, decimalen) per blok van `size` regels."""
+    lineno = 1
+    while True:
+        block = list(itertools.islice(stream, size))
+        if not block:
+            return
+        yield lineno, block, ndigits
+        lineno += len(block)
+
+
+def run(src, dst, chunk=CHUNK_LINES, workers=1, ndigits=None):
+    """Stream alle opgaven uit `src` naar uitkomsten in `dst`; geeft het aantal regels terug."""
+    jobs = _chunks(src, chunk, ndigits)
+    n = 0
+
+    def emit(out):
+        nonlocal n
+        dst.write("\n".join(out) + "\n" if out else "")
+        n += len(out)
+
+    if workers > 1:
+        # pool.map dient alle blokken vooraf in (hele invoer in het geheugen); hier een begrensd venster
+        window = WINDOW_PER_WORKER * workers
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for job in jobs:
+                pending.append(pool.submit(solve_chunk, job))
+                if len(pending) >= window:
+                    emit(pending.popleft().result())
+            while pending:
+                emit(pending.popleft().result())
+    else:
+        for job in jobs:
+            emit(solve_chunk(job))
+    return n
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(prog="python -m statica.batch", description="Los een JSONL-bestand met 2D-opgaven (één onbekende kracht F₁) op.")
+    p.add_argument("input", help="JSONL met opgaven ('-' voor stdin)")
+    p.add_argument("-o", "--output", default="-", help="JSONL met uitkomsten ('-' voor stdout, standaard)")
+    p.add_argument("--chunk", type=int, default=CHUNK_LINES, help=f"regels per gevectoriseerd blok (standaard {CHUNK_LINES})")
+    p.add_argument("--workers", type=int, default=1, help="aantal processen (standaard 1: geen pool)")
+    p.add_argument("--round", type=int, default=None, dest="ndigits", help="rond uitkomsten af op dit aantal decimalen")
+    args = p.parse_args(argv)
+
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        n = run(src, dst, chunk=max(1, args.chunk), workers=args.workers, ndigits=args.ndigits)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    print(f"{n} opgaven verwerkt", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Scenario-hash en cachegroottes voor de gememoïseerde reken-, figuur- en tabelbouwers.
+
+De caches zelf zijn `st.cache_data` / `st.cache_resource` op de bouwers in de
+pagina's: per serverproces gedeeld door alle sessies en met `max_entries`
+begrensd (minst recent gebruikte scenario valt eruit). De bouwers krijgen de
+scenario-hash als gewoon argument en de grote arrays als `_`-argument, zodat
+Streamlit alleen de korte hash (plus weergave-instellingen) hoeft te hashen.
+"""
+import hashlib
+import json
+import numpy as np
+
+SCENE_CACHE_ENTRIES = 128   # conversies/resultante (klein: alleen arrays)
+TABLE_CACHE_ENTRIES = 64    # resultaten-DataFrames
+FIGURE_CACHE_ENTRIES = 32   # Plotly-figuren (groot)
+
+
+def _feed(h, obj):
+    if obj is None:
+        h.update(b"\x00none")
+    elif hasattr(obj, "fingerprint"):   # VectorStore: kolommen i.p.v. lijst van dicts
+        _feed(h, obj.fingerprint())
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype == object:
+            _feed(h, obj.tolist())
+        else:
+            h.update(f"{obj.dtype.str}{obj.shape}".encode())
+            h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict) and any(isinstance(v, np.ndarray) for v in obj.values()):
+        for k in sorted(obj):
+            h.update(str(k).encode())
+            _feed(h, obj[k])
+    else:
+        h.update(json.dumps(obj, sort_keys=True, default=str, separators=(",", ":")).encode())
+
+
+def scenario_hash(*parts):
+    """Stabiele hash van een scenario: invoeropslag, kolom-arrays en instellingen."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        _feed(h, part)
+        h.update(b"\x1f")
+    return h.hexdigest()
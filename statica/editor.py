@@ -0,0 +1,83 @@
+"""Bulk-invoer: één `st.data_editor` voor alle vectoren i.p.v. een widgetrij per vector."""
+import numpy as np
+import streamlit as st
+
+INPUT_MODES = ["Per rij", "Tabel (bulk)"]
+# Vanaf dit aantal rijen start een pagina standaard in tabelmodus
+BULK_DEFAULT_THRESHOLD = 25
+
+HEX_COLOR_RE = r"^#[0-9a-fA-F]{6}$"
+ID_COLUMN = "_id"   # verborgen kolom in de bron-DataFrame met de rij-ID's van de opslag
+
+
+def input_mode_radio(n_entries, key):
+    """Keuze tussen widgetrijen en de bulk-tabel; geeft True terug voor tabelmodus."""
+    mode = st.radio(
+        "Invoermodus", INPUT_MODES, horizontal=True, key=key,
+        index=1 if n_entries > BULK_DEFAULT_THRESHOLD else 0,
+        help="Tabelmodus gebruikt één bewerkbare tabel: snel bij veel vectoren.",
+    )
+    return mode == INPUT_MODES[1]
+
+
+def reset_bulk_editor(key):
+    """Vergeet de tabelbron en de bewerkingen, zodat de tabel opnieuw uit de invoerlijst wordt opgebouwd."""
+    st.session_state.pop(f"{key}_src", None)
+    st.session_state.pop(f"{key}_new_ids", None)
+    st.session_state.pop(key, None)
+
+
+def bulk_editor(store, key, column_config, visible=None, palette=None):
+    """Toon alle invoerrijen van `store` (VectorStore) in één data_editor; True als de opslag veranderde.
+
+    Kolommen, volgorde en typen komen uit het schema van de opslag; lege
+    cellen van nieuwe rijen krijgen de standaardwaarde (kleur: uit `palette`).
+    Kolommen buiten `visible` blijven verborgen maar gaan mee, net als de rij-ID's
+    (verborgen kolom `ID_COLUMN`): een rij houdt haar ID als rijen erboven
+    verwijderd worden, alleen nieuwe rijen krijgen een nieuw ID. De bron-DataFrame
+    wordt maar één keer opgebouwd; daarna stuurt de editor alleen nog per
+    bewerking een delta naar de server, en de bewerkte tabel wordt kolom voor
+    kolom in place teruggeschreven.
+    """
+    import pandas as pd  # lazy: niet nodig zolang de tabelmodus niet gebruikt wordt
+
+    columns = list(store.fields)
+    src_key = f"{key}_src"
+    if src_key not in st.session_state:
+        # Kopieën: de opslag wordt later in place gewijzigd, de bron moet vast blijven
+        src = pd.DataFrame({c: store.col(c).copy() for c in columns}, columns=columns)
+        src[ID_COLUMN] = store.ids.astype(float)   # float: nieuwe rijen in de editor krijgen NaN
+        st.session_state[src_key] = src
+    edited = st.data_editor(
+        st.session_state[src_key],
+        key=key,
+        num_rows="dynamic",
+        hide_index=True,
+        width="stretch",
+        column_order=visible or columns,
+        column_config=column_config,
+    )
+    out = {}
+    for c, default in store.fields.items():
+        col = edited[c]
+        missing = col.isna().to_numpy()
+        if store.kinds[c] == "text":
+            vals = col.to_numpy(dtype=object, copy=True)
+            if c == "color" and palette:
+                vals[missing] = [palette[i % len(palette)] for i in np.flatnonzero(missing).tolist()]
+            else:
+                vals[missing] = default
+        else:
+            vals = pd.to_numeric(col.where(~missing, default)).to_numpy(dtype=float)
+            if store.kinds[c] == "bool":
+                vals = vals.astype(bool)
+        out[c] = vals
+
+    # Nieuwe rijen (geen ID): vaste ID's per editor, op volgorde van toevoegen, zodat reruns ze niet vernieuwen
+    ids = edited[ID_COLUMN].to_numpy(dtype=float, copy=True)
+    fresh = np.isnan(ids)
+    pool = st.session_state.setdefault(f"{key}_new_ids", [])
+    if fresh.sum() > len(pool):
+        pool.extend(store.new_ids(int(fresh.sum()) - len(pool)).tolist())
+    ids[fresh] = pool[:int(fresh.sum())]
+    return store.assign_columns(out, ids=ids)
@@ -0,0 +1,126 @@
+"""Batch-export: rapporten voor een hele set opgeslagen scenario's, als zip.
+
+De rapporten (`statica.report`) worden in een gedeelde procespool gemaakt; elke
+taak leest zelf de inhoud van zijn scenario uit de SQLite-bibliotheek, zodat
+de Streamlit-sessie alleen id's verstuurt. Een fragment kijkt elke
+`POLL_SECONDS` welke rapporten klaar zijn, schrijft die meteen in de zip en
+toont de voortgang; de rest van de pagina blijft intussen gewoon bruikbaar.
+"""
+import io
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, wait
+
+import streamlit as st
+
+from statica.paging import lazy_section
+from statica.report import render_report, slug
+from statica.scenarios import ScenarioStore
+
+EXPORT_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+POLL_SECONDS = 1.0
+
+
+def render_job(db_path, sid, kind, name, index):
+    """Eén rapport in een werkproces: (id, [(bestandsnaam, bytes), ...])."""
+    raw = ScenarioStore(db_path).payload(sid)
+    if raw is None:
+        raise ValueError("scenario bestaat niet meer")
+    page, svg = render_report(kind, name, raw)
+    base = f"{index:03d}_{slug(name)}"
+    return sid, [(f"{base}.html", page.encode("utf-8")), (f"{base}.svg", svg.encode("utf-8"))]
+
+
+@st.cache_resource(show_spinner=False)
+def _pool():
+    """Eén procespool per serverproces, gedeeld door alle sessies."""
+    return ProcessPoolExecutor(max_workers=EXPORT_WORKERS)
+
+
+class ExportJob:
+    """Lopende export van één sessie: openstaande taken en de zip waarin klare rapporten landen."""
+
+    def __init__(self, kind, store, metas):
+        self.total = len(metas)
+        self.errors = []
+        self.buffer = io.BytesIO()
+        self.zip = zipfile.ZipFile(self.buffer, "w", zipfile.ZIP_DEFLATED)
+        pool = _pool()
+        self.pending = {pool.submit(render_job, store.path, m["id"], kind, m["name"], i)
+                        for i, m in enumerate(metas, start=1)}
+        self.done = 0      # verwerkt (ook mislukt of geannuleerd)
+        self.written = 0   # rapporten in de zip
+        self.data = None
+
+    def collect(self):
+        """Schrijf klaar gekomen rapporten in de zip; True zodra alles verwerkt is."""
+        finished, self.pending = wait(self.pending, timeout=0)
+        for fut in finished:
+            self.done += 1
+            if fut.cancelled():
+                continue
+            try:
+                _, files = fut.result()
+            except Exception as e:   # fout in één rapport mag de rest niet stoppen
+                self.errors.append(str(e))
+                continue
+            for fname, data in files:
+                self.zip.writestr(fname, data)
+            self.written += 1
+        if not self.pending and self.data is None:
+            if self.errors:
+                self.zip.writestr("fouten.txt", "\n".join(self.errors))
+            self.zip.close()
+            self.data = self.buffer.getvalue()
+        return self.data is not None
+
+    def cancel(self):
+        for fut in self.pending:
+            fut.cancel()
+
+
+def export_section(kind, store=None):
+    """Sidebar-blok: kies opgeslagen scenario's van deze pagina en maak er in de achtergrond rapporten van.
+
+    Dichtgeklapt en zonder lopende export wordt de database niet gelezen.
+    """
+    job_key = f"export_job_{kind}"
+    job = st.session_state.get(job_key)
+    with st.sidebar:
+        exp, is_open = lazy_section("📦 Batch-rapporten", key=f"export_section_{kind}")
+    if not is_open and job is None:
+        return
+    store = store or ScenarioStore()
+    with exp:
+        if job is None:
+            courses = store.courses(kind)
+            course = st.selectbox("Vak", courses, index=None, placeholder="Alle vakken",
+                                  format_func=lambda c: c or "(geen vak)", key=f"export_course_{kind}")
+            tag = st.selectbox("Tag", store.tags(kind), index=None, placeholder="Alle tags", key=f"export_tag_{kind}")
+            metas = store.list(kind, course=course, tag=tag)
+            st.caption(f"{len(metas)} scenario's → HTML-rapport en SVG-figuur per scenario, samen in één zip.")
+            if st.button("Rapporten maken", key=f"export_start_{kind}", disabled=not metas, width="stretch"):
+                st.session_state[job_key] = ExportJob(kind, store, metas)
+                st.rerun()
+            return
+        if job.data is None:
+            _progress(kind, job_key)
+            return
+        st.caption(f"{job.written} van {job.total} rapporten in de zip."
+                   + (f" {len(job.errors)} mislukt; zie fouten.txt in de zip." if job.errors else ""))
+        st.download_button("⬇️ Download zip", job.data, file_name=f"rapporten_{kind}.zip", mime="application/zip",
+                           key=f"export_dl_{kind}", width="stretch")
+        if st.button("Nieuwe export", key=f"export_new_{kind}", width="stretch"):
+            del st.session_state[job_key]
+            st.rerun()
+
+
+@st.fragment(run_every=POLL_SECONDS)
+def _progress(kind, job_key):
+    """Voortgang tijdens de export; bij de laatste taak één volledige rerun voor de downloadknop."""
+    job = st.session_state.get(job_key)
+    if job is None or job.collect():
+        st.rerun(scope="app")
+    st.progress(job.done / max(job.total, 1), text=f"{job.done} van {job.total} rapporten klaar")
+    if st.button("Annuleren", key=f"export_cancel_{kind}", width="stretch"):
+        job.cancel()
@@ -0,0 +1,300 @@
+"""Import en export van krachtensets (CSV, Parquet, JSON/JSONL).
+
+Bestanden worden in blokken van `CHUNK_ROWS` rijen gelezen en per kolom direct
+in NumPy-arrays verzameld; er wordt geen dict per rij opgebouwd.
+pandas en pyarrow worden pas bij een import of export geladen, niet bij het
+openen van een pagina.
+"""
+import io
+import json
+import numpy as np
+import streamlit as st
+
+from statica.vectors import columns_to_cart, columns_to_xy
+
+CHUNK_ROWS = 50_000
+UPLOAD_TYPES = ["csv", "parquet", "json", "jsonl"]
+
+# Per pagina: (numerieke kolommen, tekstkolommen) — zelfde namen als de invoerdicts
+SCHEMAS = {
+    "3d": (("force", "x", "y", "z", "alpha", "beta", "gamma", "px", "py", "pz"), ("mode", "color")),
+    "2d": (("force", "x", "y", "theta", "px", "py"), ("mode", "ref", "color")),
+    "solver": (("F", "theta"), ("color",)),
+    # 3D-solver: één opgave per rij (som bekende krachten S, doel R, richtingen u1..u3)
+    "solver3d": (("Sx", "Sy", "Sz", "Rx", "Ry", "Rz") + tuple(f"u{k}{c}" for k in (1, 2, 3) for c in "xyz"), ("id",)),
+    # Vakwerk: knopen (opleggingen als 0/1) en staven (knoopnummers, 1-based) in twee bestanden
+    "truss_nodes": (("x", "y", "fix_x", "fix_y", "Fx", "Fy"), ()),
+    "truss_members": (("a", "b"), ()),
+    # Oplegreacties: belastingen met aangrijpingspunt, één belastinggeval per waarde van `case`
+    "rigid3d": (("case", "force", "x", "y", "z", "alpha", "beta", "gamma", "px", "py", "pz"), ("mode", "color")),
+}
+ALIASES = {
+    "3d": {"f": "force", "kracht": "force", "α": "alpha", "β": "beta", "γ": "gamma"},
+    "2d": {"f": "force", "kracht": "force", "θ": "theta"},
+    "solver": {"force": "F", "kracht": "F", "θ": "theta"},
+    "solver3d": {},
+    "truss_nodes": {"vast_x": "fix_x", "vast_y": "fix_y"},
+    "truss_members": {"i": "a", "j": "b", "van": "a", "naar": "b"},
+    "rigid3d": {"f": "force", "kracht": "force", "geval": "case", "α": "alpha", "β": "beta", "γ": "gamma"},
+}
+
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "JSON": ("jsonl", "application/jsonl"),
+}
+
+
+# ===================================
+# Inlezen
+# ===================================
+def _column_map(columns, kind):
+    """Bronkolom → schemakolom (hoofdletterongevoelig, met aliassen)."""
+    numeric, text = SCHEMAS[kind]
+    by_lower = {c.lower(): c for c in numeric + text}
+    aliases = ALIASES[kind]
+    out = {}
+    for col in columns:
+        key = str(col).strip().lower()
+        target = by_lower.get(key) or aliases.get(key)
+        if target and target not in out.values():
+            out[col] = target
+    return out
+
+
+def _iter_chunks(buf, ext, kind):
+    """Lever het bestand blok voor blok als dict schemakolom → array."""
+    import pandas as pd
+    if ext == "parquet":
+        import pyarrow.parquet as pq
+        pf = pq.ParquetFile(buf)
+        cmap = _column_map(pf.schema_arrow.names, kind)
+        for batch in pf.iter_batches(batch_size=CHUNK_ROWS, columns=list(cmap)):
+            yield {cmap[name]: batch.column(name).to_numpy(zero_copy_only=False) for name in batch.schema.names}
+        return
+
+    if ext == "csv":
+        head = buf.readline()
+        buf.seek(0)
+        if isinstance(head, bytes):
+            head = head.decode("utf-8", errors="replace")
+        # Nederlandstalige Excel-export: ';' als scheiding en ',' als decimaalteken
+        semicolon = head.count(";") > head.count(",")
+        reader = pd.read_csv(buf, chunksize=CHUNK_ROWS, sep=";" if semicolon else ",",
+                             decimal="," if semicolon else ".", skipinitialspace=True)
+    elif ext == "json" and not _is_json_lines(buf):
+        data = json.load(buf)
+        # Kolomgeoriënteerd {"x": [...], ...} gaat direct naar arrays; één record {"x": 1, ...} is één rij
+        if isinstance(data, dict) and not any(isinstance(v, list) for v in data.values()):
+            reader = [pd.DataFrame([data])]
+        elif isinstance(data, dict):
+            reader = [pd.DataFrame({k: np.asarray(v) for k, v in data.items()})]
+        else:
+            reader = [pd.DataFrame(data)]
+    else:
+        reader = pd.read_json(buf, lines=True, chunksize=CHUNK_ROWS)
+
+    for frame in reader:
+        cmap = _column_map(frame.columns, kind)
+        yield {target: frame[src].to_numpy() for src, target in cmap.items()}
+
+
+def _is_json_lines(buf):
+    """True als de eerste regel al een compleet JSON-object is en er daarna nog data volgt."""
+    first = buf.readline()
+    rest = buf.read(64)
+    buf.seek(0)
+    try:
+        json.loads(first)
+    except ValueError:
+        return False
+    return bool(rest.strip())
+
+
+def read_force_table(buf, filename, kind):
+    """Lees een krachtenbestand naar een dict kolom → array (ontbrekende getallen → 0)."""
+    ext = filename.rsplit(".", 1)[-1].lower()
+    if ext not in UPLOAD_TYPES:
+        raise ValueError(f"Onbekend bestandstype '.{ext}'. Gebruik {', '.join(UPLOAD_TYPES)}.")
+    import pandas as pd
+    numeric, text = SCHEMAS[kind]
+    parts = {}
+    try:
+        for chunk in _iter_chunks(buf, ext, kind):
+            for col, arr in chunk.items():
+                parts.setdefault(col, []).append(arr)
+    except (ValueError, pd.errors.ParserError, OSError) as e:
+        raise ValueError(f"Kon '{filename}' niet lezen: {e}") from e
+
+    cols = {}
+    for col, arrs in parts.items():
+        arr = np.concatenate(arrs) if arrs else np.zeros(0)
+        if col in numeric:
+            arr = pd.to_numeric(arr, errors="coerce").astype(float)
+            cols[col] = np.nan_to_num(arr, nan=0.0)
+        else:
+            cols[col] = arr.astype(object)
+    _validate(cols, kind, filename)
+    return cols
+
+
+def _validate(cols, kind, filename):
+    has = set(cols)
+    if kind in ("3d", "rigid3d"):
+        ok = {"x", "y", "z"} <= has or {"force", "alpha", "beta", "gamma"} <= has
+        need = "x/y/z of force/alpha/beta/gamma"
+    elif kind == "2d":
+        ok = {"x", "y"} <= has or {"force", "theta"} <= has
+        need = "x/y of force/theta"
+    elif kind == "solver3d":
+        ok = {"u1x", "u1y", "u1z"} <= has
+        need = "u1x/u1y/u1z (en optioneel u2*, u3*, Sx/Sy/Sz, Rx/Ry/Rz)"
+    elif kind == "truss_nodes":
+        ok = {"x", "y"} <= has
+        need = "x/y (en optioneel fix_x/fix_y, Fx/Fy)"
+    elif kind == "truss_members":
+        ok = {"a", "b"} <= has
+        need = "a/b (knoopnummers)"
+    else:
+        ok = {"F", "theta"} <= has
+        need = "F/theta"
+    if not ok:
+        raise ValueError(f"'{filename}' mist kolommen: verwacht {need} (gevonden: {', '.join(sorted(has)) or 'geen'}).")
+
+
+def table_length(cols):
+    return len(next(iter(cols.values()))) if cols else 0
+
+
+def _num(cols, name, n):
+    return cols[name] if name in cols else np.zeros(n)
+
+
+def table_to_cart(cols, normalize_dircos=True):
+    """Geïmporteerde 3D-kolommen → (N,3). Zonder `mode`-kolom bepaalt de vorm van het bestand de modus."""
+    n = table_length(cols)
+    if "mode" in cols:
+        is_dir = cols["mode"] == "dir"
+    else:
+        is_dir = np.full(n, not {"x", "y", "z"} <= set(cols))
+    xyz = np.column_stack([_num(cols, c, n) for c in ("x", "y", "z")])
+    abg = np.column_stack([_num(cols, c, n) for c in ("alpha", "beta", "gamma")])
+    return columns_to_cart(is_dir, _num(cols, "force", n), xyz, abg, normalize_dircos)
+
+
+def table_to_xy(cols):
+    """Geïmporteerde 2D-kolommen → (N,2). Zonder `mode`-kolom bepaalt de vorm van het bestand de modus."""
+    n = table_length(cols)
+    if "mode" in cols:
+        is_angle = cols["mode"] == "angle"
+    else:
+        is_angle = np.full(n, not {"x", "y"} <= set(cols))
+    from_y = cols["ref"] == "Y-as" if "ref" in cols else np.zeros(n, dtype=bool)
+    xy = np.column_stack([_num(cols, "x", n), _num(cols, "y", n)])
+    return columns_to_xy(is_angle, _num(cols, "force", n), xy, _num(cols, "theta", n), from_y)
+
+
+def table_points(cols, dim):
+    """Aangrijpingspunten (N,dim) uit de kolommen px/py(/pz); ontbrekend → oorsprong."""
+    n = table_length(cols)
+    return np.column_stack([_num(cols, c, n) for c in ("px", "py", "pz")[:dim]]) if n else np.zeros((0, dim))
+
+
+def table_to_problems3d(cols):
+    """Geïmporteerde 3D-solveropgaven → D = R − S (N,3) en richtingen U (N,k,3).
+
+    k is het aantal volledig aanwezige richtingsgroepen u1, u2, u3 (op volgorde).
+    """
+    n = table_length(cols)
+    S = np.column_stack([_num(cols, f"S{c}", n) for c in "xyz"])
+    R = np.column_stack([_num(cols, f"R{c}", n) for c in "xyz"])
+    k = 0
+    while k < 3 and all(f"u{k+1}{c}" in cols for c in "xyz"):
+        k += 1
+    U = np.stack([np.column_stack([cols[f"u{j}{c}"] for c in "xyz"]) for j in range(1, k+1)], axis=1)
+    return R - S, U
+
+
+def table_colors(cols, default):
+    """Kleur per rij: kolom `color` waar geldig, anders `default`."""
+    n = table_length(cols)
+    if "color" not in cols:
+        return [default] * n
+    return [c if isinstance(c, str) and c.startswith("#") else default for c in cols["color"].tolist()]
+
+
+# ===================================
+# Exporteren
+# ===================================
+def table_to_bytes(table, fmt):
+    """DataFrame → (bytes, extensie, mime) in het gekozen formaat."""
+    ext, mime = EXPORT_FORMATS[fmt]
+    if fmt == "CSV":
+        data = table.to_csv(index=False).encode("utf-8")
+    elif fmt == "Parquet":
+        out = io.BytesIO()
+        table.to_parquet(out, index=False)
+        data = out.getvalue()
+    else:
+        data = table.to_json(orient="records", lines=True, force_ascii=False).encode("utf-8")
+    return data, ext, mime
+
+
+# ===================================
+# UI
+# ===================================
+def imported_columns(state_key):
+    """Eerder geïmporteerde kolommen uit session_state (of None)."""
+    state = st.session_state.get(state_key)
+    return state["columns"] if state else None
+
+
+def import_widget(kind, state_key, noun="krachten"):
+    """Uploadveld; een nieuw bestand wordt één keer ingelezen en als kolommen in session_state bewaard.
+
+    Na een nieuwe import (of het verwijderen ervan) volgt een volledige rerun,
+    zodat ook vanuit een fragment alle afhankelijke secties bijwerken.
+    Geeft de geïmporteerde kolommen terug (of None).
+    """
+    up = st.file_uploader(f"📂 Importeer {noun} (CSV, Parquet, JSON/JSONL)", type=UPLOAD_TYPES, key=f"{state_key}_upload")
+    state = st.session_state.get(state_key)
+    if up is not None and (state is None or state["file_id"] != up.file_id):
+        try:
+            cols = read_force_table(up, up.name, kind)
+        except ValueError as e:
+            st.error(str(e))
+            cols = None
+        st.session_state[state_key] = {"file_id": up.file_id, "name": up.name, "columns": cols}
+        if cols is not None:
+            st.rerun()
+        state = st.session_state[state_key]
+
+    if state and state["columns"] is not None:
+        c1, c2 = st.columns([3, 1])
+        with c1:
+            st.caption(f"Geïmporteerd: **{table_length(state['columns'])}** {noun} uit `{state['name']}`")
+        with c2:
+            if st.button("✖️ Verwijder import", key=f"{state_key}_clear"):
+                state["columns"] = None
+                st.rerun()
+        return state["columns"]
+    return None
+
+
+def export_widget(table, basename, key):
+    """Eén downloadknop voor de resultatentabel in het gekozen formaat.
+
+    `table` is een DataFrame of een functie zonder argumenten die hem oplevert; een
+    functie wordt pas bij de klik op de knop uitgevoerd (volledige tabel alleen als
+    er echt gedownload wordt).
+    """
+    c1, c2 = st.columns([1, 3])
+    with c1:
+        fmt = st.selectbox("Exportformaat", list(EXPORT_FORMATS), key=f"{key}_fmt", label_visibility="collapsed")
+    if callable(table):
+        ext, mime = EXPORT_FORMATS[fmt]
+        data = lambda: table_to_bytes(table(), fmt)[0]   # noqa: E731
+    else:
+        data, ext, mime = table_to_bytes(table, fmt)
+    with c2:
+        st.download_button(f"⬇️ Download resultaten ({fmt})", data, file_name=f"{basename}.{ext}", mime=mime, key=f"{key}_dl", on_click="ignore")
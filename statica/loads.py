@@ -0,0 +1,175 @@
+"""Verdeelde belastingen q(x) langs een ligger: resultante, ligging en equivalente puntkrachten (zonder Streamlit).
+
+Een profiel is een reeks steunpunten (x, q) met lineair verloop daartussen:
+uniform en lineair zijn twee steunpunten, een tabelprofiel willekeurig veel.
+Voor zo'n stuksgewijs lineair profiel zijn ∫q dx en ∫x·q dx exact in gesloten
+vorm (trapezium resp. zwaartepunt van elk trapezium), in één gevectoriseerde
+stap over alle segmenten; ook op willekeurige tussenpunten.
+
+Bij opdelen in N gelijke stukken krijgt elk stuk één puntkracht gelijk aan zijn
+eigen belasting, in zijn eigen zwaartepunt. Een stuk waarin q van teken wisselt
+wordt eerst in het nulpunt gesplitst (anders kan zijn netto belasting nul zijn
+terwijl er wel een koppel is); elk deel heeft dan één teken en dus een
+zwaartepunt. Resultante en moment van de puntkrachten zijn daardoor voor elke N
+gelijk aan die van de verdeelde last; N bepaalt alleen hoe fijn het verloop van
+de last (de dwarskrachtlijn) wordt benaderd. Het adaptieve N is de kleinste waarbij geen stuk meer dan `tol` van
+de totale belasting ∫|q| dx draagt.
+"""
+import re
+
+import numpy as np
+
+from statica.vectors import EPS
+
+LOAD_SHAPES = ("uniform", "lineair", "tabel")
+LOAD_TOL = 0.05      # max. aandeel van ∫|q| per puntkracht (adaptief N)
+LOAD_N_MAX = 200     # hoogstens zoveel puntkrachten per last (houdt de figuur licht)
+
+_SAMPLE_RE = re.compile(r"^\s*([-+0-9.eE]+)\s*:\s*([-+0-9.eE]+)\s*$")
+
+
+# ===================================
+# Profielen
+# ===================================
+def parse_samples(text):
+    """Tabelprofiel als tekst "x:q; x:q; ..." → gesorteerde arrays (x, q); ValueError bij fouten."""
+    parts = [p for p in re.split(r"[;\n]+", text or "") if p.strip()]
+    if len(parts) < 2:
+        raise ValueError("een tabelprofiel heeft minstens twee punten x:q nodig")
+    try:
+        pairs = np.array([[float(v) for v in _SAMPLE_RE.match(p).groups()] for p in parts])
+    except (AttributeError, ValueError):
+        raise ValueError(f"ongeldig tabelprofiel {text!r} (verwacht bijv. 0:0; 2:5; 4:3)")
+    pairs = pairs[np.argsort(pairs[:, 0], kind="stable")]
+    if np.any(np.diff(pairs[:, 0]) <= 0):
+        raise ValueError("dubbele x-waarden in het tabelprofiel")
+    return pairs[:, 0], pairs[:, 1]
+
+
+def load_profile(shape, x0=0.0, x1=0.0, q0=0.0, q1=0.0, samples=""):
+    """Steunpunten (x, q) van een profiel; uniform gebruikt alleen q0."""
+    if shape == "tabel":
+        return parse_samples(samples)
+    if x1 <= x0:
+        raise ValueError(f"x1 ({x1:g}) moet groter zijn dan x0 ({x0:g})")
+    q_end = q0 if shape == "uniform" else q1
+    return np.array([x0, x1], dtype=float), np.array([q0, q_end], dtype=float)
+
+
+# ===================================
+# Integratie
+# ===================================
+def _cumulative(x, q, t):
+    """∫q dx en ∫x·q dx van x[0] tot elk punt in `t` (exact voor lineair verloop tussen de steunpunten)."""
+    h = np.diff(x)
+    F_nodes = np.concatenate([[0.0], np.cumsum(h * (q[:-1] + q[1:]) / 2)])
+    G_nodes = np.concatenate([[0.0], np.cumsum(h / 6 * (x[:-1] * (2 * q[:-1] + q[1:]) + x[1:] * (q[:-1] + 2 * q[1:])))])
+    t = np.clip(np.asarray(t, dtype=float), x[0], x[-1])
+    k = np.clip(np.searchsorted(x, t, side="right") - 1, 0, len(x) - 2)
+    xk, qk = x[k], q[k]
+    qt = qk + (q[k + 1] - qk) * (t - xk) / h[k]
+    d = t - xk
+    return F_nodes[k] + d * (qk + qt) / 2, G_nodes[k] + d / 6 * (xk * (2 * qk + qt) + t * (qk + 2 * qt))
+
+
+def _split_at_roots(x, q):
+    """Voeg de nulpunten van q in, zodat |q| ook stuksgewijs lineair is."""
+    q0, q1 = q[:-1], q[1:]
+    cross = np.flatnonzero(q0 * q1 < 0)
+    if not len(cross):
+        return x, q
+    roots = x[cross] - q0[cross] * (x[cross + 1] - x[cross]) / (q1[cross] - q0[cross])
+    order = np.argsort(np.concatenate([x, roots]), kind="stable")
+    return np.concatenate([x, roots])[order], np.concatenate([q, np.zeros(len(roots))])[order]
+
+
+def load_resultant(x, q):
+    """Totale belasting W = ∫q dx en de ligging x̄ = ∫x·q dx / W (None bij W = 0)."""
+    x, q = np.asarray(x, dtype=float), np.asarray(q, dtype=float)
+    F, G = _cumulative(x, q, [x[-1]])
+    W, M = float(F[0]), float(G[0])
+    return W, (M / W if abs(W) > EPS else None)
+
+
+def equivalent_forces(x, q, n):
+    """N gelijke stukken, gesplitst in de nulpunten van q → (posities, grootten): per stuk zijn belasting in zijn zwaartepunt.
+
+    Geeft n puntkrachten plus één per tekenwisseling van q binnen een stuk.
+    """
+    x, q = _split_at_roots(np.asarray(x, dtype=float), np.asarray(q, dtype=float))
+    edges = np.union1d(np.linspace(x[0], x[-1], n + 1), x[q == 0.0])
+    F, G = _cumulative(x, q, edges)
+    w, m = np.diff(F), np.diff(G)
+    mid = (edges[:-1] + edges[1:]) / 2
+    # Elk stuk heeft één teken; alleen een stuk met q ≡ 0 heeft geen zwaartepunt (kracht en moment nul)
+    ok = np.abs(w) > EPS * max(float(np.abs(F).max()), 1.0)
+    pos = np.where(ok, m / np.where(ok, w, 1.0), mid)
+    return pos, w
+
+
+def discretization_error(x, q, n):
+    """Grootste aandeel van ∫|q| dx dat één van de N puntkrachten draagt."""
+    xs, qs = _split_at_roots(np.asarray(x, dtype=float), np.asarray(q, dtype=float))
+    A, _ = _cumulative(xs, np.abs(qs), np.linspace(xs[0], xs[-1], n + 1))
+    total = float(A[-1])
+    return float(np.diff(A).max()) / total if total > EPS else 0.0
+
+
+def adaptive_count(x, q, tol=LOAD_TOL, n_max=LOAD_N_MAX):
+    """Kleinste N (≤ n_max) met `discretization_error` ≤ tol: verdubbelen, daarna bisectie."""
+    def meets(n):
+        return discretization_error(x, q, n) <= tol + EPS   # EPS: uniform met tol = 1/N geeft precies N
+
+    if meets(1):
+        return 1
+    hi = 2
+    while hi < n_max and not meets(hi):
+        hi *= 2
+    hi = min(hi, n_max)
+    lo = hi // 2   # voldoet niet
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if meets(mid):
+            hi = mid
+        else:
+            lo = mid
+    return hi
+
+
+# ===================================
+# Naar puntkrachten
+# ===================================
+def loads_to_forces(store, discretize=True, tol=LOAD_TOL, n_max=LOAD_N_MAX, default_color=None):
+    """Alle lasten van een opslag (schema LOAD2D_FIELDS) → puntkrachten voor de 2D-pagina.
+
+    Geeft (vectoren (M,2), aangrijpingspunten (M,2), kleuren, info) met per last
+    een dict: W, x̄, aantal puntkrachten n en eventuele foutmelding. Zonder
+    `discretize` wordt elke last één kracht W in x̄. q is positief in de richting θ
+    (graden vanaf de X-as; standaard −90°, naar beneden) op de lijn y = `y`.
+    """
+    vectors, points, colors, info = [], [], [], []
+    for i in range(len(store)):
+        ent = store.row(i)
+        try:
+            x, q = load_profile(ent["shape"], ent["x0"], ent["x1"], ent["q0"], ent["q1"], ent["samples"])
+        except ValueError as e:
+            info.append({"W": 0.0, "xbar": None, "n": 0, "error": str(e)})
+            continue
+        W, xbar = load_resultant(x, q)
+        if discretize:
+            n = adaptive_count(x, q, tol, n_max)
+            pos, w = equivalent_forces(x, q, n)
+        elif xbar is not None:
+            pos, w = np.array([xbar]), np.array([W])
+        else:   # W = 0: geen enkele kracht, wel een koppel → één kracht per deel met hetzelfde teken
+            pos, w = equivalent_forces(x, q, 1)
+            keep = np.abs(w) > EPS
+            pos, w = pos[keep], w[keep]
+        theta = np.radians(ent["theta"])
+        vectors.append(np.outer(w, [np.cos(theta), np.sin(theta)]))
+        points.append(np.column_stack([pos, np.full(len(pos), ent["y"])]))
+        colors += [ent["color"] or default_color] * len(pos)
+        info.append({"W": W, "xbar": xbar, "n": len(pos), "error": None})
+    if not vectors:
+        return np.zeros((0, 2)), np.zeros((0, 2)), colors, info
+    return np.vstack(vectors), np.vstack(points), colors, info
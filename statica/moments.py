@@ -0,0 +1,83 @@
+"""Momenten van een krachtenstelsel met aangrijpingspunten (zonder Streamlit).
+
+Moment van kracht F_i met aangrijpingspunt P_i om punt A: M_i = (P_i − A) × F_i.
+Alles gaat in één gevectoriseerde stap over de hele set: de momenten per
+kracht via één `np.cross`, de som via M_A = Σ P_i × F_i − A × R (zo hoeft
+voor een ander momentpunt alleen de laatste term opnieuw). In 2D is het
+moment de z-component (scalair, positief = tegen de klok in).
+
+Het equivalente kracht-koppelstelsel in A is (R, M_A). De werklijn van de
+resultante (3D: de centrale as) gaat door P₀ = A + (R × M_A)/|R|²; in 3D
+blijft er een koppel M∥ = (R·M_A)/|R|² · R langs die as over (een 'wrench'),
+dat nul is als het stelsel tot één kracht te herleiden is.
+"""
+import numpy as np
+
+from statica.vectors import EPS, as_rows, vec_norm
+
+# Relatieve grens waaronder M∥ als nul geldt (stelsel te herleiden tot één kracht)
+PARALLEL_TOL = 1e-9
+
+
+def _cross2(r, F):
+    """z-component van r × F voor (N,2)-arrays."""
+    return r[:, 0] * F[:, 1] - r[:, 1] * F[:, 0]
+
+
+def moments_about(points, forces, about=None):
+    """Moment per kracht om `about` (standaard de oorsprong): (N,3) in 3D, (N,) in 2D."""
+    forces = np.asarray(forces, dtype=float)
+    dim = forces.shape[-1]
+    forces = as_rows(forces, dim)
+    r = as_rows(points, dim)
+    if about is not None:
+        r = r - np.asarray(about, dtype=float).reshape(1, dim)
+    return _cross2(r, forces) if dim == 2 else np.cross(r, forces)
+
+
+def force_couple(points, forces, about=None):
+    """Equivalent kracht-koppelstelsel in `about`: R ((dim,)) en M_A ((3,) in 3D, scalair in 2D)."""
+    forces = np.asarray(forces, dtype=float)
+    dim = forces.shape[-1]
+    forces = as_rows(forces, dim)
+    points = as_rows(points, dim)
+    R = forces.sum(axis=0)
+    if dim == 2:
+        M = float(_cross2(points, forces).sum())
+        if about is not None:
+            M -= float(_cross2(np.asarray(about, dtype=float).reshape(1, 2), R[None])[0])
+        return R, M
+    M = np.cross(points, forces).sum(axis=0)
+    if about is not None:
+        M = M - np.cross(np.asarray(about, dtype=float).reshape(3), R)
+    return R, M
+
+
+def line_of_action(R, M, about=None):
+    """Werklijn van de resultante bij kracht-koppelstelsel (R, M) in `about`.
+
+    Geeft (P₀, eenheidsrichting, M∥) met P₀ het punt van de werklijn dat het
+    dichtst bij `about` ligt; M∥ is het koppel langs de werklijn (3D-vector,
+    in 2D altijd 0). Bij R = 0 (zuiver koppel) is er geen werklijn: None.
+    """
+    R = np.asarray(R, dtype=float)
+    dim = len(R)
+    about = np.zeros(dim) if about is None else np.asarray(about, dtype=float).reshape(dim)
+    r2 = float(R @ R)
+    if r2 < EPS:
+        return None
+    u = R / np.sqrt(r2)
+    if dim == 2:
+        return about + float(M) * np.array([R[1], -R[0]]) / r2, u, 0.0
+    M = np.asarray(M, dtype=float)
+    M_par = (float(R @ M) / r2) * R
+    return about + np.cross(R, M) / r2, u, M_par
+
+
+def reduces_to_single_force(R, M):
+    """True als het stelsel (R ≠ 0) tot één kracht zonder koppel te herleiden is (R ⊥ M)."""
+    R = np.asarray(R, dtype=float)
+    if len(R) == 2:
+        return float(R @ R) > EPS
+    M = np.asarray(M, dtype=float)
+    return float(R @ R) > EPS and abs(float(R @ M)) <= PARALLEL_TOL * float(vec_norm(R)) * max(float(vec_norm(M)), 1.0)
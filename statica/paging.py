@@ -0,0 +1,42 @@
+"""Inklapbare, gepagineerde secties voor resultaten en uitleg.
+
+Een sectie wordt pas opgebouwd als de gebruiker haar openklapt, en dan alleen
+voor de zichtbare pagina; zo blijft de payload per rerun klein bij duizenden
+vectoren. Somregels ("Rx = a + b + ...") worden boven `SUM_TERMS_MAX` termen
+samengevat tot de eerste en laatste termen plus het aantal.
+"""
+import streamlit as st
+
+PAGE_SIZE = 50
+SUM_TERMS_MAX = 20
+SUM_TERMS_SHOWN = 3
+
+
+def lazy_section(label, key, expanded=False):
+    """Expander (standaard ingeklapt) die de pagina alleen bij open/dicht herloopt; geeft (container, open) terug."""
+    exp = st.expander(label, expanded=expanded, key=key, on_change="rerun")
+    return exp, bool(exp.open)
+
+
+def page_slice(n, key, page_size=PAGE_SIZE):
+    """Paginakeuze voor `n` rijen; geeft de slice van de zichtbare rijen terug."""
+    if n <= page_size:
+        return slice(0, n)
+    pages = -(-n // page_size)
+    page = st.number_input(f"Pagina (van {pages})", min_value=1, max_value=pages, value=1, step=1, key=key)
+    start = (int(page) - 1) * page_size
+    stop = min(n, start + page_size)
+    st.caption(f"Rij {start+1}–{stop} van {n}")
+    return slice(start, stop)
+
+
+def sum_line(label, values, total, fmt="{:.2f}", max_terms=SUM_TERMS_MAX):
+    """'Rx = a + b + ... = totaal'; boven `max_terms` termen alleen de eerste/laatste termen plus het aantal."""
+    n = len(values)
+    if n <= max_terms:
+        terms = " + ".join(fmt.format(v) for v in values)
+    else:
+        head = " + ".join(fmt.format(v) for v in values[:SUM_TERMS_SHOWN])
+        tail = " + ".join(fmt.format(v) for v in values[-SUM_TERMS_SHOWN:])
+        terms = f"{head} + … + {tail} ({n} termen)"
+    return f"{label} = {terms} = {fmt.format(total)}"
@@ -0,0 +1,278 @@
+"""Gebatchte Plotly-traces: alle vectoren in een vast aantal traces i.p.v. één of twee per vector."""
+import numpy as np
+import plotly.graph_objects as go
+
+from statica.vectors import EPS, vec_norm
+
+# Vanaf dit aantal vectoren wordt standaard gebatcht getekend
+BATCH_THRESHOLD_3D = 50
+# Maximaal aantal legenda-items (één per kleur) in gebatchte modus
+MAX_LEGEND_ITEMS = 12
+
+HEAD_LENGTH = 0.10   # fractie van de vectorlengte
+HEAD_RADIUS = 0.035  # fractie van de vectorlengte
+HEAD_SEGMENTS = 8
+
+# Level-of-detail (3D): vanaf dit aantal vectoren staat LOD standaard aan
+LOD_THRESHOLD = 5_000
+LOD_TOP_K = 500
+LOD_LAT_BINS = 12     # breedtegraad-banden; lengtegraad krijgt er twee keer zoveel
+LOD_COLOR = "#7f7f7f"
+
+# Kleurgecodeerde staven (vakwerk): markers langs elke staaf, samen hoogstens zoveel
+MEMBER_SAMPLES_PER_SPAN = 300
+MEMBER_SAMPLES_MAX = 150_000
+MEMBER_COLORSCALE = "RdBu_r"   # druk blauw, trek rood, nul wit
+
+
+# ===================================
+# Helpers
+# ===================================
+def shaft_coords(vectors, origins=None):
+    """(N,k) → k vlakke arrays [p, p+v, NaN, ...] (p = aangrijpingspunt, standaard 0); NaN breekt de lijn."""
+    n, k = vectors.shape
+    out = np.full((n, 3, k), np.nan)
+    out[:, 0, :] = 0.0 if origins is None else origins
+    out[:, 1, :] = vectors if origins is None else origins + vectors
+    out = out.reshape(-1, k)
+    return [out[:, j] for j in range(k)]
+
+
+def add_legend_group(fig, colors, legendgroup, label="Vectoren", symbol_3d=True):
+    """Lichte legenda: één lege trace per unieke kleur, gekoppeld aan de batch via `legendgroup`."""
+    uniq = list(dict.fromkeys(colors))
+    counts = {c: 0 for c in uniq}
+    for c in colors:
+        counts[c] += 1
+    trace = go.Scatter3d if symbol_3d else go.Scatter
+    empty = dict(x=[None], y=[None], z=[None]) if symbol_3d else dict(x=[None], y=[None])
+    for c in uniq[:MAX_LEGEND_ITEMS]:
+        fig.add_trace(trace(
+            mode="lines", line=dict(color=c, width=6),
+            name=f"{label} {c} (n={counts[c]})",
+            legendgroup=legendgroup, hoverinfo="skip", **empty
+        ))
+    if len(uniq) > MAX_LEGEND_ITEMS:
+        rest = sum(counts[c] for c in uniq[MAX_LEGEND_ITEMS:])
+        fig.add_trace(trace(
+            mode="lines", line=dict(color="#9e9e9e", width=6),
+            name=f"{label} overige kleuren (n={rest})",
+            legendgroup=legendgroup, hoverinfo="skip", **empty
+        ))
+
+
+# ===================================
+# 3D
+# ===================================
+def arrowhead_mesh(vectors, colors, origins=None):
+    """Kegelvormige pijlkoppen voor alle vectoren als één mesh (vertices, faces, kleur per face)."""
+    vectors = np.asarray(vectors, dtype=float)
+    mag = vec_norm(vectors)
+    keep = mag > EPS
+    v, mag = vectors[keep], mag[keep]
+    cols = np.asarray(colors, dtype=object)[keep]
+    n, K = len(v), HEAD_SEGMENTS
+
+    d = v / mag[:, None]
+    # Loodrechte basis (e1, e2) rond elke richting d
+    helper = np.where((np.abs(d[:, 0]) > 0.9)[:, None], [0.0, 1.0, 0.0], [1.0, 0.0, 0.0])
+    e1 = np.cross(d, helper)
+    e1 /= vec_norm(e1)[:, None]
+    e2 = np.cross(d, e1)
+
+    phi = np.linspace(0.0, 2*np.pi, K, endpoint=False)
+    base = v - (HEAD_LENGTH * mag)[:, None] * d
+    r = (HEAD_RADIUS * mag)[:, None, None]
+    ring = base[:, None, :] + r * (np.cos(phi)[None, :, None] * e1[:, None, :] + np.sin(phi)[None, :, None] * e2[:, None, :])
+
+    # Per pijl: K ringpunten, dan de punt, dan het midden van de basis
+    verts = np.concatenate([ring, v[:, None, :], base[:, None, :]], axis=1)
+    if origins is not None:
+        verts += np.asarray(origins, dtype=float).reshape(-1, 3)[keep][:, None, :]
+    verts = verts.reshape(-1, 3)
+    k = np.arange(K)
+    k1 = (k + 1) % K
+    side = np.stack([np.full(K, K), k, k1], axis=1)
+    cap = np.stack([np.full(K, K + 1), k1, k], axis=1)
+    local = np.concatenate([side, cap])                       # (2K, 3)
+    offs = (np.arange(n) * (K + 2))[:, None, None]
+    faces = (local[None, :, :] + offs).reshape(-1, 3)
+    facecolor = np.repeat(cols, 2*K)
+    return verts, faces, facecolor
+
+
+def add_arrows3d_batched(fig, vectors, colors, linewidth, markersize, show_points, draw_arrowheads,
+                         legendgroup="vectoren", label="Vectoren", names=None, origins=None):
+    """Teken alle vectoren als één Scatter3d (schachten) en één Mesh3d (pijlkoppen); `origins` = aangrijpingspunten."""
+    vectors = np.asarray(vectors, dtype=float).reshape(-1, 3)
+    if len(vectors) == 0:
+        return
+    if names is None:
+        names = [f"Vector {i}" for i in range(1, len(vectors)+1)]
+    if origins is not None:
+        origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+    xs, ys, zs = shaft_coords(vectors, origins)
+    vcolors = np.repeat(np.asarray(colors, dtype=object), 3)
+    labels = np.repeat(np.asarray(names, dtype=object), 3)
+    fig.add_trace(go.Scatter3d(
+        x=xs, y=ys, z=zs,
+        mode="lines+markers" if show_points else "lines",
+        line=dict(width=linewidth, color=vcolors.tolist()),
+        marker=dict(size=markersize, color=vcolors.tolist()),
+        text=labels.tolist(),
+        hovertemplate="%{text}<br>(%{x:.2f}, %{y:.2f}, %{z:.2f})<extra></extra>",
+        name=label, legendgroup=legendgroup, showlegend=False
+    ))
+    if draw_arrowheads:
+        verts, faces, facecolor = arrowhead_mesh(vectors, colors, origins)
+        if len(faces):
+            fig.add_trace(go.Mesh3d(
+                x=verts[:, 0], y=verts[:, 1], z=verts[:, 2],
+                i=faces[:, 0], j=faces[:, 1], k=faces[:, 2],
+                facecolor=facecolor.tolist(), flatshading=True,
+                hoverinfo="skip", name="Pijlkoppen",
+                legendgroup=legendgroup, showlegend=False
+            ))
+    add_legend_group(fig, colors, legendgroup, label=label)
+
+
+def lod_reduce(vectors, top_k=LOD_TOP_K, lat_bins=LOD_LAT_BINS, box=None, origins=None):
+    """Level-of-detail voor grote 3D-sets: top-K los, de rest opgeteld per richtingsvak.
+
+    De K grootste vectoren (binnen `box`, als opgegeven) blijven individueel.
+    Alle overige vectoren worden op een bolrooster (`lat_bins` × 2·`lat_bins`
+    vakken op poolhoek/azimut) ingedeeld en per vak opgeteld tot één
+    representatieve pijl. `box` = ((xmin,xmax),(ymin,ymax),(zmin,zmax)): alleen
+    vectoren met hun eindpunt in dit kader komen in aanmerking voor de top-K
+    (zo verfijnt inzoomen via de as-bereiken; met `origins` telt het eindpunt
+    vanaf het aangrijpingspunt). Geeft (index top-K, vak-sommen
+    (M,3), aantal per vak (M,), aangrijpingspunt per vak (M,3)) terug; lege
+    vakken vallen weg. Het aangrijpingspunt van een bundel is het met |F|
+    gewogen gemiddelde van de `origins` in dat vak (zonder `origins`: de oorsprong).
+    """
+    vectors = np.asarray(vectors, dtype=float).reshape(-1, 3)
+    n = len(vectors)
+    mag = vec_norm(vectors)
+    candidate = mag > EPS
+    if box is not None:
+        lo = np.array([b[0] for b in box]); hi = np.array([b[1] for b in box])
+        tips = vectors if origins is None else vectors + origins
+        candidate &= np.all((tips >= lo) & (tips <= hi), axis=1)
+    cand_idx = np.flatnonzero(candidate)
+    k = min(top_k, len(cand_idx))
+    if k < len(cand_idx):
+        top = cand_idx[np.argpartition(-mag[cand_idx], k - 1)[:k]]
+    else:
+        top = cand_idx
+    top = top[np.argsort(-mag[top])]
+
+    rest = np.ones(n, dtype=bool)
+    rest[top] = False
+    rest &= mag > EPS
+    v = vectors[rest]
+    if len(v) == 0:
+        return top, np.zeros((0, 3)), np.zeros(0, dtype=int), np.zeros((0, 3))
+    lon_bins = 2 * lat_bins
+    polar = np.arccos(np.clip(v[:, 2] / mag[rest], -1.0, 1.0))              # [0, π]
+    azimuth = np.arctan2(v[:, 1], v[:, 0])                                   # [-π, π]
+    i_lat = np.minimum((polar / np.pi * lat_bins).astype(int), lat_bins - 1)
+    i_lon = np.minimum(((azimuth + np.pi) / (2*np.pi) * lon_bins).astype(int), lon_bins - 1)
+    cell = i_lat * lon_bins + i_lon
+    m = lat_bins * lon_bins
+    counts = np.bincount(cell, minlength=m)
+    sums = np.column_stack([np.bincount(cell, weights=v[:, j], minlength=m) for j in range(3)])
+    used = counts > 0
+    if origins is None:
+        at = np.zeros((int(used.sum()), 3))
+    else:
+        p, w = np.asarray(origins, dtype=float).reshape(-1, 3)[rest], mag[rest]
+        wsum = np.bincount(cell, weights=w, minlength=m)[used]
+        at = np.column_stack([np.bincount(cell, weights=w * p[:, j], minlength=m)[used] for j in range(3)]) / wsum[:, None]
+    return top, sums[used], counts[used], at
+
+
+# ===================================
+# 2D
+# ===================================
+def add_arrows2d_batched(fig, vectors, colors, linewidth, markersize, draw_arrowheads=True, names=None, origins=None):
+    """Teken 2D-vectoren: schachten gebundeld per kleur, alle pijlkoppen als één markertrace.
+
+    Een `go.Scatter`-lijn heeft één kleur, dus schachten worden per unieke kleur
+    in één trace gebundeld (aantal traces = aantal kleuren, niet aantal vectoren).
+    Pijlkoppen zijn driehoek-markers op de eindpunten, gedraaid naar de vectorhoek.
+    `origins` (N,2): aangrijpingspunten (standaard de oorsprong).
+    """
+    vectors = np.asarray(vectors, dtype=float).reshape(-1, 2)
+    if len(vectors) == 0:
+        return
+    origins = np.zeros_like(vectors) if origins is None else np.asarray(origins, dtype=float).reshape(-1, 2)
+    if names is None:
+        names = [f"Vector {i}" for i in range(1, len(vectors)+1)]
+    colors = np.asarray(colors, dtype=object)
+    names = np.asarray(names, dtype=object)
+
+    for c in dict.fromkeys(colors.tolist()):
+        sel = colors == c
+        xs, ys = shaft_coords(vectors[sel], origins[sel])
+        n = int(sel.sum())
+        fig.add_trace(go.Scatter(
+            x=xs, y=ys,
+            mode="lines+markers",
+            line=dict(color=c, width=linewidth),
+            marker=dict(size=markersize, color=c),
+            text=np.repeat(names[sel], 3).tolist(),
+            hovertemplate="%{text}<br>(%{x:.2f}, %{y:.2f})<extra></extra>",
+            name=names[sel][0] if n == 1 else f"Vectoren {c} (n={n})",
+            legendgroup=f"vec2d_{c}"
+        ))
+
+    if draw_arrowheads:
+        keep = np.abs(vectors).sum(axis=1) > EPS
+        v = vectors[keep]
+        tips = origins[keep] + v
+        # Plotly draait markers met de klok mee vanaf "omhoog"; atan2 meet tegen de klok in vanaf +X
+        angle = 90.0 - np.degrees(np.arctan2(v[:, 1], v[:, 0]))
+        fig.add_trace(go.Scatter(
+            x=tips[:, 0], y=tips[:, 1],
+            mode="markers",
+            marker=dict(symbol="triangle-up", angle=angle, size=max(8, 2*linewidth + 6),
+                        color=colors[keep].tolist(), line=dict(width=0)),
+            hoverinfo="skip", name="Pijlkoppen", showlegend=False
+        ))
+
+
+def add_members_colormapped(fig, xy, ends, values, linewidth, names=None, colorbar_title="N (N)"):
+    """Teken staven (m) als één grijze lijntrace plus één kleurgecodeerde markertrace voor alle staven.
+
+    Een Plotly-lijn heeft één kleur; daarom liggen er dicht opeen markers langs elke
+    staaf (aantal naar lengte, samen hoogstens MEMBER_SAMPLES_MAX), gekleurd op
+    `values` met een divergerende schaal rond 0 en één kleurbalk.
+    """
+    xy, ends = np.asarray(xy, dtype=float), np.asarray(ends)
+    if len(ends) == 0:
+        return
+    a, b = xy[ends[:, 0]], xy[ends[:, 1]]
+    xs, ys = shaft_coords(b - a, a)
+    fig.add_trace(go.Scattergl(x=xs, y=ys, mode="lines", line=dict(color="#bdbdbd", width=1),
+                               hoverinfo="skip", name="Staven", showlegend=False))
+
+    L = vec_norm(b - a)
+    span = max(float(np.ptp(xy[:, 0])), float(np.ptp(xy[:, 1])), EPS)
+    counts = np.maximum(np.ceil(L / span * MEMBER_SAMPLES_PER_SPAN), 2).astype(np.int64)
+    if counts.sum() > MEMBER_SAMPLES_MAX:
+        counts = np.maximum((counts * (MEMBER_SAMPLES_MAX / counts.sum())).astype(np.int64), 2)
+    member = np.repeat(np.arange(len(ends)), counts)
+    start = np.cumsum(counts) - counts
+    t = (np.arange(len(member)) - start[member]) / (counts[member] - 1)
+    pts = a[member] + t[:, None] * (b - a)[member]
+    values = np.asarray(values, dtype=float)
+    vmax = max(float(np.nanmax(np.abs(values))), EPS)
+    names = [f"Staaf {i}" for i in range(1, len(ends) + 1)] if names is None else list(names)
+    fig.add_trace(go.Scattergl(
+        x=pts[:, 0], y=pts[:, 1], mode="markers",
+        marker=dict(size=max(3, linewidth), color=values[member], colorscale=MEMBER_COLORSCALE,
+                    cmin=-vmax, cmax=vmax, colorbar=dict(title=colorbar_title), line=dict(width=0)),
+        text=np.asarray(names, dtype=object)[member], customdata=values[member],
+        hovertemplate="%{text}<br>N = %{customdata:.2f}<extra></extra>",
+        name="Staafkrachten", showlegend=False,
+    ))
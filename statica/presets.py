@@ -0,0 +1,178 @@
+"""Voorbeeldbibliotheek: benoemde standaardopgaven per pagina, te laden vanuit de sidebar.
+
+Een voorbeeld vult in één keer de invoeropslag van de pagina (en eventuele
+doelwaarden zoals |R| en φ). Componenten, resultante, solver-uitkomst, tabel
+en figuur komen daarna uit de gewone gecachete bouwers van de pagina
+(`compute_scene`, `build_figure`, ...): die zijn per serverproces gedeeld door
+alle sessies, sleutelen op de inhoud van het scenario en zijn met
+`max_entries` begrensd. Een voorbeeld dat één sessie al eens geladen heeft,
+komt voor elke volgende sessie dus direct uit de cache.
+"""
+import streamlit as st
+
+from statica.editor import reset_bulk_editor
+from statica.share import SHARE_SPEC
+from statica.store import STORE_FIELDS, VectorStore
+from statica.truss import pratt_truss
+
+# Per pagina: naam → {sessie-sleutel: rijen (lijst), kolommen (dict) of widgetwaarde}
+PRESETS = {
+    "3d": {
+        "Drie krachten langs de assen": {"entries": [
+            {"x": 300.0, "color": "#1f77b4"},
+            {"y": 400.0, "color": "#ff7f0e"},
+            {"z": -500.0, "color": "#2ca02c"},
+        ]},
+        "Krachten met richtingshoeken (α, β, γ)": {"entries": [
+            {"mode": "dir", "force": 500.0, "alpha": 60.0, "beta": 45.0, "gamma": 120.0, "color": "#1f77b4"},
+            {"mode": "dir", "force": 300.0, "alpha": 45.0, "beta": 60.0, "gamma": 60.0, "color": "#ff7f0e"},
+        ]},
+        "Drie kabels aan een mastkop": {"entries": [
+            {"force": 600.0, "x": -2.0, "y": -3.0, "z": -6.0, "color": "#1f77b4"},
+            {"force": 400.0, "x": 3.0, "y": -2.0, "z": -6.0, "color": "#ff7f0e"},
+            {"force": 500.0, "x": 0.0, "y": 4.0, "z": -6.0, "color": "#2ca02c"},
+        ]},
+        "Krachten op een hoeksteun (moment om de inklemming)": {
+            "entries": [
+                {"z": -500.0, "px": 0.3, "py": 0.2, "color": "#1f77b4"},
+                {"x": 200.0, "px": 0.3, "pz": 0.1, "color": "#ff7f0e"},
+                {"y": -150.0, "py": 0.2, "pz": 0.1, "color": "#2ca02c"},
+            ],
+            "moment_ax_3d": 0.0, "moment_ay_3d": 0.0, "moment_az_3d": 0.0,
+        },
+    },
+    "2d": {
+        "Twee krachten op een haak": {"entries2d": [
+            {"mode": "angle", "force": 600.0, "theta": 45.0, "color": "#1f77b4"},
+            {"mode": "angle", "force": 800.0, "theta": -60.0, "color": "#ff7f0e"},
+        ]},
+        "Drie krachten op een bout": {"entries2d": [
+            {"mode": "angle", "force": 200.0, "theta": 30.0, "color": "#1f77b4"},
+            {"mode": "angle", "force": 150.0, "theta": 135.0, "color": "#ff7f0e"},
+            {"mode": "angle", "force": 250.0, "theta": -90.0, "color": "#2ca02c"},
+        ]},
+        "Hoek vanaf de Y-as en cartesisch": {"entries2d": [
+            {"mode": "angle", "force": 400.0, "theta": 30.0, "ref": "Y-as", "color": "#1f77b4"},
+            {"x": 300.0, "y": -100.0, "color": "#ff7f0e"},
+        ]},
+        "Ligger met drie lasten (moment om oplegging A)": {
+            "entries2d": [
+                {"y": -200.0, "px": 1.0, "color": "#1f77b4"},
+                {"y": -300.0, "px": 3.0, "color": "#ff7f0e"},
+                {"mode": "angle", "force": 400.0, "theta": -60.0, "px": 5.0, "color": "#2ca02c"},
+            ],
+            "moment_ax_2d": 0.0, "moment_ay_2d": 0.0,
+        },
+        "Ligger met driehoekslast en gelijkmatige last": {
+            "entries2d": [
+                {"y": -500.0, "px": 2.0, "color": "#1f77b4"},
+            ],
+            "loads2d": [
+                {"shape": "lineair", "x0": 0.0, "x1": 3.0, "q0": 0.0, "q1": 400.0, "color": "#ff7f0e"},
+                {"shape": "uniform", "x0": 3.0, "x1": 6.0, "q0": 200.0, "color": "#2ca02c"},
+            ],
+            "moment_ax_2d": 0.0, "moment_ay_2d": 0.0,
+        },
+    },
+    "solver": {
+        "Sleepboten: resultante langs de vaarrichting": {
+            "known_forces": [{"F": 450.0, "theta": 45.0, "color": "#1f77b4"},
+                             {"F": 200.0, "theta": 0.0, "color": "#ff7f0e"}],
+            "target_ori": "Hoek vanaf X-as (φ)", "target_R": 1000.0, "target_phi": 0.0,
+        },
+        "Evenwicht van een ring": {
+            "known_forces": [{"F": 300.0, "theta": 0.0, "color": "#1f77b4"},
+                             {"F": 400.0, "theta": 90.0, "color": "#ff7f0e"}],
+            "target_ori": "Hoek vanaf X-as (φ)", "target_R": 0.0, "target_phi": 0.0,
+        },
+        "Bout met hellende resultante": {
+            "known_forces": [{"F": 250.0, "theta": 120.0, "color": "#1f77b4"},
+                             {"F": 180.0, "theta": -30.0, "color": "#ff7f0e"}],
+            "target_ori": "Hoek vanaf X-as (φ)", "target_R": 600.0, "target_phi": 60.0,
+        },
+    },
+    "solver3d": {
+        "Last aan drie kabels": {
+            "known3d": [{"z": -500.0, "color": "#1f77b4"}],
+            "unknowns3d": [{"name": "F_A", "x": -2.0, "y": -3.0, "z": 6.0},
+                           {"name": "F_B", "x": 3.0, "y": -2.0, "z": 6.0},
+                           {"name": "F_C", "x": 0.0, "y": 4.0, "z": 6.0}],
+            "goal_3d": "Nul (evenwicht)",
+        },
+        "Mast met twee tuidraden": {
+            "known3d": [{"x": 1000.0, "y": 500.0, "color": "#1f77b4"}],
+            "unknowns3d": [{"name": "Kabel A", "x": -4.0, "y": 3.0, "z": -8.0},
+                           {"name": "Kabel B", "x": -4.0, "y": -3.0, "z": -8.0},
+                           {"name": "Mast", "z": 1.0}],
+            "goal_3d": "Nul (evenwicht)",
+        },
+        "Last aan twee schuine kabels (vlak)": {
+            "known3d": [{"z": -800.0, "color": "#1f77b4"}],
+            "unknowns3d": [{"name": "F_L", "y": -1.0, "z": 1.0},
+                           {"name": "F_R", "y": 1.0, "z": 1.0}],
+            "goal_3d": "Nul (evenwicht)",
+        },
+    },
+    "truss": {
+        "Driehoeksspant met toplast": {
+            "truss_nodes": [{"fix_x": True, "fix_y": True}, {"x": 4.0, "fix_y": True}, {"x": 2.0, "y": 2.0, "Fy": -10_000.0}],
+            "truss_members": [{"a": 1.0, "b": 2.0}, {"a": 1.0, "b": 3.0}, {"a": 2.0, "b": 3.0}],
+        },
+        "Pratt-ligger, 6 vakken": dict(zip(("truss_nodes", "truss_members"), pratt_truss(6, 12.0, 2.0, 10_000.0))),
+        "Pratt-brug, 500 vakken": dict(zip(("truss_nodes", "truss_members"), pratt_truss(500, 500.0, 8.0, 20_000.0))),
+    },
+    "rigid3d": {
+        "Console met inklemming": {
+            "rigid_loads": [{"z": -1000.0, "px": 2.0, "color": "#1f77b4"},
+                            {"y": 500.0, "px": 2.0, "pz": 0.5, "color": "#ff7f0e"}],
+            "rigid_supports": [{"name": "Ax", "x": 1.0}, {"name": "Ay", "y": 1.0}, {"name": "Az", "z": 1.0},
+                               {"name": "MAx", "type": "moment", "x": 1.0}, {"name": "MAy", "type": "moment", "y": 1.0},
+                               {"name": "MAz", "type": "moment", "z": 1.0}],
+        },
+        "Plaat op kogelscharnier, scharnier en kabel": {
+            "rigid_loads": [{"z": -2000.0, "px": 1.5, "py": 1.0, "color": "#1f77b4"}],
+            "rigid_supports": [{"name": "Ax", "x": 1.0}, {"name": "Ay", "y": 1.0}, {"name": "Az", "z": 1.0},
+                               {"name": "By", "y": 1.0, "px": 3.0}, {"name": "Bz", "z": 1.0, "px": 3.0},
+                               {"name": "Kabel", "mode": "dir", "alpha": 90.0, "beta": 135.0, "gamma": 45.0,
+                                "px": 3.0, "py": 2.0}],
+        },
+        "As in twee lagers (mechanisme om de as)": {
+            "rigid_loads": [{"z": -800.0, "px": 1.0, "color": "#1f77b4"},
+                            {"case": 2.0, "z": -800.0, "px": 1.0, "color": "#1f77b4"},
+                            {"case": 2.0, "y": 300.0, "px": 3.0, "pz": 0.2, "color": "#ff7f0e"}],
+            "rigid_supports": [{"name": "Ax", "x": 1.0}, {"name": "Ay", "y": 1.0}, {"name": "Az", "z": 1.0},
+                               {"name": "By", "y": 1.0, "px": 4.0}, {"name": "Bz", "z": 1.0, "px": 4.0}],
+        },
+    },
+}
+
+
+def load_preset(kind, name):
+    """Zet een voorbeeld in de sessie: invoerlijsten in place (nieuwe rij-ID's), overige waarden als widgetstatus.
+
+    Invoerlijsten van de pagina die het voorbeeld niet noemt, worden leeggemaakt.
+    """
+    preset = PRESETS[kind][name]
+    for key in SHARE_SPEC[kind][0]:
+        if key not in preset and key in st.session_state:
+            st.session_state[key].clear()
+            reset_bulk_editor(f"{key}_bulk")
+    for key, value in preset.items():
+        if isinstance(value, (list, dict)):
+            store = st.session_state.setdefault(key, VectorStore(STORE_FIELDS[key]))
+            if isinstance(value, dict):
+                store.replace_columns(value)
+            else:
+                store.replace(value)
+            reset_bulk_editor(f"{key}_bulk")
+        else:
+            st.session_state[key] = value
+
+
+def preset_picker(kind):
+    """Sidebar-keuze uit de voorbeeldbibliotheek; laadt het voorbeeld vóór de invoer wordt opgebouwd."""
+    with st.sidebar:
+        name = st.selectbox("📚 Voorbeeldopgave", list(PRESETS[kind]), index=None, placeholder="Kies een voorbeeld…",
+                            key=f"preset_{kind}")
+        if st.button("Laad voorbeeld", key=f"preset_load_{kind}", disabled=name is None, width="stretch"):
+            load_preset(kind, name)
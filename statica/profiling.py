@@ -0,0 +1,84 @@
+"""Opt-in tijdmeting per fase van een rerun (invoer, rekenen, figuur, plotly_chart, tabel, ...).
+
+Aan te zetten met de sidebar-toggle "⏱️ Profiling" of met `?profile=1` in de URL.
+Uit staat er geen meetcode in de weg: `phase()` is dan een lege context.
+Metingen blijven per sessie bewaard (laatste `ROLLING_WINDOW` per fase) en
+kunnen als JSONL naar een logbestand worden weggeschreven. Het pad komt uit
+`$STATICA_PROFILE_LOG` (serverinstelling), nooit uit de UI.
+"""
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+import streamlit as st
+
+ROLLING_WINDOW = 50
+DEFAULT_LOG = "statica_profile.jsonl"
+LOG_PATH = os.environ.get("STATICA_PROFILE_LOG", DEFAULT_LOG)
+
+
+class Profiler:
+    """Meet fasen van één pagina; maak er één per pagina aan, direct na `set_page_config`."""
+
+    def __init__(self, page):
+        self.page = page
+        qp = str(st.query_params.get("profile", "")).lower() in ("1", "true", "ja")
+        with st.sidebar:
+            self.enabled = st.toggle("⏱️ Profiling", value=qp, key="profiling_on",
+                                     help="Meet de duur van elke fase per rerun (ook via ?profile=1).")
+            self.log_path = None
+            self.log_error = None
+            if self.enabled:
+                if st.checkbox("Schrijf metingen naar logbestand", key="profiling_log",
+                               help=f"JSONL naar `{LOG_PATH}` (in te stellen met $STATICA_PROFILE_LOG)."):
+                    self.log_path = LOG_PATH
+        store = st.session_state.setdefault("profiling", {})
+        self.samples = store.setdefault(page, {})
+        self._t0 = time.perf_counter()
+
+    def phase(self, name):
+        """Context manager die de duur van `name` vastlegt (no-op als profiling uit staat)."""
+        return self._measure(name) if self.enabled else nullcontext()
+
+    @contextmanager
+    def _measure(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - t0) * 1000.0)
+
+    def record(self, name, ms):
+        self.samples.setdefault(name, deque(maxlen=ROLLING_WINDOW)).append(ms)
+        if self.log_path:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"ts": time.time(), "page": self.page, "phase": name, "ms": round(ms, 3)}) + "\n")
+            except OSError as e:
+                # Loggen mag een rerun nooit laten mislukken: rest van deze rerun niet meer schrijven
+                self.log_error, self.log_path = str(e), None
+
+    def report(self):
+        """Sluit de volledige rerun af (fase 'totaal') en toon de tabel met laatste/p50/p95 in de sidebar."""
+        if not self.enabled:
+            return
+        self.record("totaal", (time.perf_counter() - self._t0) * 1000.0)
+        rows = []
+        for name, vals in self.samples.items():
+            arr = np.fromiter(vals, dtype=float)
+            rows.append({"Fase": name, "Laatste (ms)": round(arr[-1], 1),
+                         "p50 (ms)": round(float(np.percentile(arr, 50)), 1),
+                         "p95 (ms)": round(float(np.percentile(arr, 95)), 1), "n": len(arr)})
+        with st.sidebar:
+            st.markdown("---")
+            st.subheader("⏱️ Profiling")
+            st.dataframe(rows, hide_index=True, width="stretch")
+            if self.log_error:
+                st.warning(f"Logbestand niet beschrijfbaar: {self.log_error}")
+            st.caption(f"Rollend over de laatste {ROLLING_WINDOW} metingen per fase. "
+                       "Metingen uit fragment-reruns verschijnen bij de volgende volledige rerun.")
+            if st.button("Wis metingen", key="profiling_clear"):
+                self.samples.clear()
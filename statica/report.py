@@ -0,0 +1,493 @@
+"""Zelfstandige rapporten (HTML met ingebedde SVG) per scenario, zonder Streamlit of Plotly.
+
+Een rapport bevat dezelfde onderdelen als de pagina: figuur, componententabel
+en uitleg. De figuur wordt hier zelf als SVG getekend (2D direct, 3D in een
+vaste isometrische projectie), zodat er geen browser of Kaleido nodig is en
+rapporten in een procespool gemaakt kunnen worden (zie `statica.export`).
+Invoer is de compacte scenario-inhoud van `share.pack`.
+"""
+import html
+import re
+from datetime import datetime
+
+import numpy as np
+
+from statica.loads import LOAD_TOL, loads_to_forces
+from statica.moments import force_couple, line_of_action, moments_about
+from statica.paging import sum_line
+from statica.rigid3d import (STATUS_LABELS_RIGID, in_balance, load_vectors, reaction_vectors, rigid_arrays,
+                             solve_reactions, support_matrix)
+from statica.share import unpack
+from statica.solver import STATUS_LABELS, STATUS_SINGULAR, solve_two_magnitudes, solve_unknown_force
+from statica.solver3d import STATUS_LABELS_3D, solve_magnitudes3d, unit_rows
+from statica.store import STORE_FIELDS, VectorStore
+from statica.truss import STATUS_LABELS_TRUSS, STATUS_ILL, STATUS_OK, force_kind, solve_truss, truss_arrays
+from statica.vectors import (EPS, cart_to_alpha_beta_gamma, columns_to_cart, entries2d_to_xy, entries_to_cart,
+                             polar_to_xy, resultant, xy_to_polar)
+
+KIND_TITLES = {"3d": "3D-vectoren", "2d": "2D-vectoren", "solver": "2D-solver", "solver3d": "3D-solver",
+               "truss": "2D-vakwerk", "rigid3d": "3D-oplegreacties"}
+# Boven deze aantallen worden figuur, tabel en uitleg ingekort (de som blijft over alle vectoren)
+SVG_MAX_ARROWS = 2_000
+TABLE_MAX_ROWS = 1_000
+SVG_SIZE = 560
+SVG_HEAD = 0.06      # pijlpunt als fractie van de figuurbreedte (begrensd door de pijllengte)
+VIEW_AZIMUTH = 35.0  # 3D-projectie: kijkrichting in graden
+VIEW_ELEVATION = 25.0
+RESULTANT_COLOR = "#e41a1c"
+UNKNOWN_COLORS = ["#d62728", "#9467bd", "#17becf"]
+DEFAULT_COLOR = "#1f77b4"
+MEMBER_COLORS = {"trek": "#d62728", "druk": "#1f77b4", "nul": "#9e9e9e"}
+LOAD_COLOR, REACTION_COLOR = "#2ca02c", "#ff7f0e"
+COUPLE_COLOR = "#9467bd"
+
+
+def _f(v):
+    return "" if v is None or (isinstance(v, float) and np.isnan(v)) else f"{v:.2f}"
+
+
+def _stores(kind, columns):
+    out = {}
+    for key, cols in columns.items():
+        out[key] = VectorStore(STORE_FIELDS[key])
+        out[key].assign_columns(cols)
+    return out
+
+
+def _colors(store, n=None):
+    cols = [c or DEFAULT_COLOR for c in store.col("color").tolist()]
+    return cols if n is None else cols[:n]
+
+
+# ===================================
+# SVG
+# ===================================
+def _project(points):
+    """(N,3) → (N,2) schermcoördinaten (x rechts, y omhoog) voor de vaste 3D-kijkrichting."""
+    az, el = np.radians(VIEW_AZIMUTH), np.radians(VIEW_ELEVATION)
+    right = np.array([-np.sin(az), np.cos(az), 0.0])
+    up = np.array([-np.sin(el) * np.cos(az), -np.sin(el) * np.sin(az), np.cos(el)])
+    return np.column_stack([points @ right, points @ up])
+
+
+def svg_arrows(groups, axes=None):
+    """Teken groepen pijlen als één SVG-string.
+
+    groups: lijst (vectoren (N,2) of (N,3), kleuren (N,), breedte[, beginpunten (N,dim)[, pijlpunten]]);
+    zonder beginpunten starten de pijlen in de oorsprong, met pijlpunten=False worden het
+    gewone lijnstukken (bijv. staven). 3D wordt geprojecteerd.
+    axes: optioneel {label: eenheidsvector} voor assen door de oorsprong (zelfde dimensie).
+    Per kleur één `<path>` voor alle schachten en punten, zodat duizenden pijlen compact blijven.
+    """
+    flat = []
+    for g in groups:
+        if len(g[0]):
+            v = np.asarray(g[0], dtype=float)
+            start = np.asarray(g[3], dtype=float) if len(g) > 3 else np.zeros_like(v)
+            flat.append((v, list(g[1]), g[2], start, g[4] if len(g) > 4 else True))
+    dim = flat[0][0].shape[1] if flat else 2
+    to2d = _project if dim == 3 else (lambda p: p)
+    starts = [to2d(p) for _, _, _, p, _ in flat]
+    tips = [to2d(p + v) for v, _, _, p, _ in flat]
+    pts = np.vstack([np.zeros((1, 2))] + starts + tips)
+    span = float(np.max(np.abs(pts))) or 1.0
+    axis_tips = {}
+    if axes:
+        axis_tips = {lab: to2d(np.asarray(u, dtype=float)[None] * span)[0] for lab, u in axes.items()}
+        pts = np.vstack([pts] + [t[None] for t in axis_tips.values()])
+    lo, hi = pts.min(axis=0), pts.max(axis=0)
+    pad = 0.08 * max(float(np.max(hi - lo)), EPS)
+    lo, hi = lo - pad, hi + pad
+    scale = SVG_SIZE / max(float(np.max(hi - lo)), EPS)
+
+    def screen(p):
+        return np.column_stack([(p[:, 0] - lo[0]) * scale, (hi[1] - p[:, 1]) * scale])
+
+    o = screen(np.zeros((1, 2)))[0]
+    w = (hi[0] - lo[0]) * scale
+    h = (hi[1] - lo[1]) * scale
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {w:.0f} {h:.0f}" width="{w:.0f}" height="{h:.0f}" '
+           'font-family="sans-serif" font-size="12">']
+    for lab, t in axis_tips.items():
+        (x, y), = screen(t[None])
+        out.append(f'<line x1="{o[0]:.1f}" y1="{o[1]:.1f}" x2="{x:.1f}" y2="{y:.1f}" stroke="#9e9e9e" stroke-dasharray="4 3"/>'
+                   f'<text x="{x:.1f}" y="{y:.1f}" fill="#616161">{html.escape(lab)}</text>')
+    for (_, colors, width, _, with_heads), start, tip in zip(flat, starts, tips):
+        s, s0 = screen(tip), screen(start)
+        d = s - s0
+        length = np.hypot(d[:, 0], d[:, 1])
+        ok = length > 0.5
+        head = np.minimum(SVG_HEAD * SVG_SIZE, 0.35 * length) if with_heads else np.zeros_like(length)
+        u = np.divide(d, length[:, None], out=np.zeros_like(d), where=length[:, None] > 0)
+        n = np.column_stack([-u[:, 1], u[:, 0]])
+        base = s - u * head[:, None]
+        left, right = base + n * (0.4 * head)[:, None], base - n * (0.4 * head)[:, None]
+        by_color = {}
+        for i in np.flatnonzero(ok).tolist():
+            by_color.setdefault(colors[i], []).append(i)
+        for color, idx in by_color.items():
+            idx = np.asarray(idx)
+            shafts = "".join(f"M{a:.1f} {b:.1f}L{x:.1f} {y:.1f}"
+                             for (a, b), (x, y) in zip(s0[idx].tolist(), base[idx].tolist()))
+            heads = "".join(f"M{a:.1f} {b:.1f}L{c:.1f} {d_:.1f}L{e:.1f} {f:.1f}Z"
+                            for (a, b), (c, d_), (e, f) in zip(s[idx].tolist(), left[idx].tolist(), right[idx].tolist()))
+            c = html.escape(color)
+            out.append(f'<path d="{shafts}" stroke="{c}" stroke-width="{width}" fill="none"/>'
+                       + (f'<path d="{heads}" fill="{c}"/>' if with_heads else ""))
+    out.append("</svg>")
+    return "".join(out)
+
+
+def _largest(vectors, k=SVG_MAX_ARROWS):
+    """Indices van de `k` grootste vectoren (alle als het er minder zijn)."""
+    if len(vectors) <= k:
+        return np.arange(len(vectors))
+    mags = np.einsum("ij,ij->i", vectors, vectors)
+    return np.sort(np.argpartition(mags, -k)[-k:])
+
+
+AXES_2D = {"X": (1.0, 0.0), "Y": (0.0, 1.0)}
+AXES_3D = {"X": (1.0, 0.0, 0.0), "Y": (0.0, 1.0, 0.0), "Z": (0.0, 0.0, 1.0)}
+
+
+# ===================================
+# Rapportinhoud per pagina
+# ===================================
+def _sum_lines(labels, vectors, R):
+    return [sum_line(lab, vectors[:, j].tolist(), float(R[j])) for j, lab in enumerate(labels)]
+
+
+def _report_3d(stores, settings):
+    store = stores["entries"]
+    blank = (store.col("force") <= 0) & (store.is_("mode", "dir") | ~store.stack("x", "y", "z").any(axis=1))
+    usable = np.flatnonzero(~blank)
+    vectors = entries_to_cart(store, normalize_dircos=settings.get("normalize_3d", True))[usable]
+    points = store.stack("px", "py", "pz")[usable]
+    colors = np.asarray(_colors(store), dtype=object)[usable].tolist()
+    R = resultant(vectors) if len(vectors) else np.zeros(3)
+    rc = settings.get("resultant_color_3d", RESULTANT_COLOR)
+    about = tuple(float(settings.get(f"moment_a{c}_3d", 0.0)) for c in "xyz")
+    _, M_A = force_couple(points, vectors, about)
+    axis = line_of_action(R, M_A, about) if len(vectors) else None
+    M = moments_about(points[:TABLE_MAX_ROWS], vectors[:TABLE_MAX_ROWS], about)
+    angles, mags = cart_to_alpha_beta_gamma(vectors)
+    R_angles, R_mag = cart_to_alpha_beta_gamma(R)
+    rows = [[str(i + 1), *map(_f, v), _f(m), *map(_f, a), *map(_f, p), *map(_f, mi)]
+            for i, (v, m, a, p, mi) in enumerate(zip(vectors[:TABLE_MAX_ROWS].tolist(), mags.tolist(), angles.tolist(),
+                                                     points.tolist(), M.tolist()))]
+    R_at = np.zeros(3) if axis is None else axis[0]
+    rows.append(["Resultante", *map(_f, R.tolist()), _f(float(R_mag[0])), *map(_f, R_angles[0].tolist()),
+                 *(map(_f, R_at.tolist()) if axis is not None else ["", "", ""]), *map(_f, M_A.tolist())])
+    explain = []
+    for i, (pos, (X, Y, Z)) in enumerate(zip(usable[:TABLE_MAX_ROWS].tolist(), vectors.tolist()), start=1):
+        ent = store.row(pos)
+        if ent["mode"] == "dir":
+            explain.append(f"Vector {i} (dir): F={ent['force']:.2f} N, α={ent['alpha']:.2f}°, β={ent['beta']:.2f}°, "
+                           f"γ={ent['gamma']:.2f}° → X={X:.2f}, Y={Y:.2f}, Z={Z:.2f}")
+        else:
+            explain.append(f"Vector {i} (cart): ({ent['x']:.2f}, {ent['y']:.2f}, {ent['z']:.2f}), F={ent['force']:.2f} N "
+                           f"→ X={X:.2f}, Y={Y:.2f}, Z={Z:.2f}")
+    explain += _sum_lines(("Rx", "Ry", "Rz"), vectors, R)
+    Ra, Rb, Rg = R_angles[0].tolist()
+    explain.append(f"Resultante: R=({R[0]:.2f}, {R[1]:.2f}, {R[2]:.2f}), |R|={float(R_mag[0]):.2f} N, "
+                   f"α={_f(Ra)}°, β={_f(Rb)}°, γ={_f(Rg)}°")
+    explain.append(f"Moment om A=({about[0]:.2f}, {about[1]:.2f}, {about[2]:.2f}): M_i = (P_i − A) × F_i")
+    explain += _sum_lines(("Mx", "My", "Mz"), moments_about(points, vectors, about), M_A)
+    if axis is None:
+        explain.append("R = 0: zuiver koppel, zonder centrale as.")
+    else:
+        p0, _, M_par = axis
+        explain.append(f"Centrale as door P₀ = A + (R × M_A)/|R|² = ({p0[0]:.2f}, {p0[1]:.2f}, {p0[2]:.2f}); "
+                       f"koppel langs de as M∥ = ({M_par[0]:.2f}, {M_par[1]:.2f}, {M_par[2]:.2f}) N·m")
+    shown = _largest(vectors)
+    return {
+        "summary": f"{len(vectors)} vectoren; |R| = {float(R_mag[0]):.2f} N; "
+                   f"M_A = ({M_A[0]:.2f}, {M_A[1]:.2f}, {M_A[2]:.2f}) N·m",
+        "groups": [(vectors[shown], [colors[i] for i in shown.tolist()], 3, points[shown]), (R[None], [rc], 5, R_at[None])],
+        "axes": AXES_3D,
+        "shown": (len(shown), len(vectors)),
+        "header": ["Vector", "X", "Y", "Z", "|F| (N)", "α (°)", "β (°)", "γ (°)",
+                   "Px", "Py", "Pz", "Mx (N·m)", "My (N·m)", "Mz (N·m)"],
+        "rows": rows, "n_rows": len(vectors) + 1, "explain": explain,
+    }
+
+
+def _report_2d(stores, settings):
+    store = stores["entries2d"]
+    all_xy = entries2d_to_xy(store)
+    keep = np.abs(all_xy).sum(axis=1) > 0
+    vectors = all_xy[keep]
+    points = store.stack("px", "py")[keep]
+    colors = np.asarray(_colors(store), dtype=object)[keep].tolist()
+    # Verdeelde lasten als puntkrachten achter de invoer, zoals op de pagina
+    load_xy, load_points, load_colors, load_info = loads_to_forces(
+        stores["loads2d"], settings.get("load_discretize_2d", True),
+        float(settings.get("load_tol_2d", LOAD_TOL * 100)) / 100, default_color=DEFAULT_COLOR)
+    vectors = np.vstack([vectors, load_xy])
+    points = np.vstack([points, load_points])
+    colors += load_colors
+    R = resultant(vectors) if len(vectors) else np.zeros(2)
+    rc = settings.get("resultant_color_2d", RESULTANT_COLOR)
+    about = (float(settings.get("moment_ax_2d", 0.0)), float(settings.get("moment_ay_2d", 0.0)))
+    _, M_A = force_couple(points, vectors, about)
+    line = line_of_action(R, M_A, about) if len(vectors) else None
+    M = moments_about(points, vectors, about)
+    angles, mags = xy_to_polar(vectors)
+    (Rang,), (Rmag,) = xy_to_polar(R)
+    rows = [[str(i + 1), _f(x), _f(y), _f(m), _f(t), _f(px), _f(py), _f(mi)]
+            for i, ((x, y), m, t, (px, py), mi) in enumerate(zip(vectors[:TABLE_MAX_ROWS].tolist(), mags.tolist(),
+                                                                  angles.tolist(), points.tolist(), M.tolist()))]
+    R_at = np.zeros(2) if line is None else line[0]
+    rows.append(["Resultante", _f(R[0]), _f(R[1]), _f(float(Rmag)), _f(float(Rang)),
+                 *(map(_f, R_at.tolist()) if line is not None else ["", ""]), _f(M_A)])
+    explain = []
+    for i, (x, y) in zip(range(min(len(store), TABLE_MAX_ROWS)), all_xy.tolist()):
+        ent = store.row(i)
+        if ent["mode"] == "cart":
+            explain.append(f"Vector {i + 1} (cart): ({ent['x']:.2f}, {ent['y']:.2f}), F={ent['force']:.2f} N → X={x:.2f}, Y={y:.2f}")
+        else:
+            ref = "X" if ent["ref"] == "X-as" else "Y"
+            explain.append(f"Vector {i + 1} (hoek vanaf {ref}): F={ent['force']:.2f} N, θ={ent['theta']:.2f}° → X={x:.2f}, Y={y:.2f}")
+    for k, inf in enumerate(load_info, start=1):
+        if inf["error"]:
+            explain.append(f"Verdeelde last {k} genegeerd: {inf['error']}")
+        else:
+            where = "" if inf["xbar"] is None else f" op x̄ = {inf['xbar']:.2f}"
+            explain.append(f"Verdeelde last {k}: W = ∫q dx = {inf['W']:.2f} N{where} → {inf['n']} puntkracht(en)")
+    explain += _sum_lines(("Rx", "Ry"), vectors, R)
+    explain.append(f"R = ({R[0]:.2f}, {R[1]:.2f}), |R| = √(Rx²+Ry²) = {float(Rmag):.2f} N"
+                   + (f", θ = atan2(Ry, Rx) = {float(Rang):.2f}°" if Rmag > 0 else ""))
+    explain.append(f"Moment om A=({about[0]:.2f}, {about[1]:.2f}) (tegen de klok in positief):")
+    explain.append(sum_line("M_A", M.tolist(), M_A))
+    if line is None:
+        explain.append(f"R = 0: zuiver koppel van {M_A:.2f} N·m, zonder werklijn.")
+    else:
+        explain.append(f"Werklijn van R door P₀ = A + M_A·(Ry, −Rx)/|R|² = ({R_at[0]:.2f}, {R_at[1]:.2f})")
+    shown = _largest(vectors)
+    return {
+        "summary": f"{len(vectors)} vectoren; |R| = {float(Rmag):.2f} N; M_A = {M_A:.2f} N·m",
+        "groups": [(vectors[shown], [colors[i] for i in shown.tolist()], 3, points[shown]), (R[None], [rc], 5, R_at[None])],
+        "axes": AXES_2D,
+        "shown": (len(shown), len(vectors)),
+        "header": ["Vector", "X", "Y", "|v| (N)", "θ (° vanaf X-as)", "Px", "Py", "M_A (N·m)"],
+        "rows": rows, "n_rows": len(vectors) + 1, "explain": explain,
+    }
+
+
+def _report_solver(stores, settings):
+    known = stores["known_forces"]
+    Rmag = float(settings.get("target_R", 1000.0))
+    along_x = settings.get("target_ori", "").startswith("Langs")
+    phi = float(settings.get("target_alpha", -30.0) if along_x else settings.get("target_phi", 0.0))
+    known_xy = polar_to_xy(known.col("F"), known.col("theta"))
+    S = resultant(known_xy) if len(known_xy) else np.zeros(2)
+    (Rx, Ry), = polar_to_xy(Rmag, phi).tolist()
+    D = np.array([Rx, Ry]) - S
+    rows = [[f"F{i}", _f(F), _f(t), _f(x), _f(y)] for i, (F, t, (x, y)) in
+            enumerate(zip(known.col("F").tolist(), known.col("theta").tolist(), known_xy.tolist()), start=1)]
+    explain = [f"Som bekende krachten: Sx = {S[0]:.2f}, Sy = {S[1]:.2f}.",
+               f"Doel: Rx = {Rmag:.2f}·cos({phi:.2f}°) = {Rx:.2f}, Ry = {Rmag:.2f}·sin({phi:.2f}°) = {Ry:.2f}.",
+               f"De onbekende(n) moeten leveren: Dx = Rx − Sx = {D[0]:.2f}, Dy = Ry − Sy = {D[1]:.2f}."]
+    if settings.get("unknown_mode", "").startswith("Twee"):
+        ta, tb = float(settings.get("theta_a", 30.0)), float(settings.get("theta_b", -45.0))
+        Fa, Fb, cond, status = solve_two_magnitudes(D, ta, tb)
+        Fa, Fb, status = float(Fa[0]), float(Fb[0]), int(status[0])
+        solved = polar_to_xy([Fa, Fb], [ta, tb]) if status != STATUS_SINGULAR else np.zeros((0, 2))
+        rows += [["F₁ (oplossing)", _f(Fa), _f(ta), *map(_f, polar_to_xy(Fa, ta)[0].tolist())],
+                 ["F₂ (oplossing)", _f(Fb), _f(tb), *map(_f, polar_to_xy(Fb, tb)[0].tolist())]]
+        explain.append(f"F₁·u(θ₁={ta:.2f}°) + F₂·u(θ₂={tb:.2f}°) = D → F₁ = {_f(Fa)} N, F₂ = {_f(Fb)} N "
+                       f"({STATUS_LABELS[status]}, conditiegetal {float(cond[0]):.2e}).")
+        summary = f"F₁ = {_f(Fa)} N, F₂ = {_f(Fb)} N ({STATUS_LABELS[status]})"
+    else:
+        _, F1, theta1 = solve_unknown_force(S, (Rx, Ry))
+        F1, theta1 = float(F1[0]), float(theta1[0])
+        solved = D[None]
+        rows.append(["F₁ (oplossing)", _f(F1), _f(theta1), _f(D[0]), _f(D[1])])
+        explain.append(f"F₁ = √(Dx² + Dy²) = {F1:.2f} N, θ₁ = atan2(Dy, Dx) = {_f(theta1) or '0.00'}°.")
+        summary = f"F₁ = {F1:.2f} N @ {_f(theta1) or '0.00'}°"
+    rows.append(["R (gewenst)", _f(Rmag), _f(phi), _f(Rx), _f(Ry)])
+    return {
+        "summary": summary,
+        "groups": [(known_xy, _colors(known), 3), (solved, UNKNOWN_COLORS[:len(solved)], 4),
+                   (np.array([[Rx, Ry]]), [RESULTANT_COLOR], 5)],
+        "axes": AXES_2D,
+        "shown": (len(known_xy), len(known_xy)),
+        "header": ["Kracht", "F (N)", "θ (°)", "X", "Y"],
+        "rows": rows, "n_rows": len(rows), "explain": explain,
+    }
+
+
+def _report_solver3d(stores, settings):
+    known, unknowns = stores["known3d"], stores["unknowns3d"]
+    normalize = settings.get("normalize_solver3d", True)
+    if settings.get("goal_3d", "").startswith("Gewenste"):
+        R_target = np.array([float(settings.get(f"target3d_{c}", 0.0)) for c in "xyz"])
+    else:
+        R_target = np.zeros(3)
+    known_xyz = entries_to_cart(known, normalize_dircos=normalize)
+    S = resultant(known_xyz) if len(known_xyz) else np.zeros(3)
+    D = R_target - S
+    k = min(len(unknowns), len(UNKNOWN_COLORS))
+    U = columns_to_cart(unknowns.is_("mode", "dir"), np.ones(len(unknowns)), unknowns.stack("x", "y", "z"),
+                        unknowns.stack("alpha", "beta", "gamma"), normalize)[:k]
+    names = [n or f"F{i}" for i, n in enumerate(unknowns.col("name")[:k].tolist(), start=1)]
+    rows = [[f"Bekend {i}", *map(_f, v)] for i, v in enumerate(known_xyz[:TABLE_MAX_ROWS].tolist(), start=1)]
+    explain = [f"Som bekende krachten: S = ({S[0]:.2f}, {S[1]:.2f}, {S[2]:.2f}); "
+               f"de onbekenden moeten leveren D = R − S = ({D[0]:.2f}, {D[1]:.2f}, {D[2]:.2f})."]
+    solved = np.zeros((0, 3))
+    if not k:
+        summary = "Geen onbekende richtingen."
+    else:
+        F, residual, cond, det, status = solve_magnitudes3d(D, U[None])
+        F, status = F[0], int(status[0])
+        explain.append(f"Σ F_k·u_k = D als 3×{k}-stelsel: {STATUS_LABELS_3D[status]} "
+                       f"(conditiegetal {float(cond[0]):.2e}, residu {float(residual[0]):.2e} N).")
+        if status != STATUS_SINGULAR:
+            solved = F[:, None] * unit_rows(U)
+            rows += [[f"{n} (oplossing)", *map(_f, v)] for n, v in zip(names, solved.tolist())]
+        summary = ", ".join(f"{n} = {_f(f)} N" for n, f in zip(names, F.tolist())) + f" ({STATUS_LABELS_3D[status]})"
+    rows.append(["R (gewenst)", *map(_f, R_target.tolist())])
+    return {
+        "summary": summary,
+        "groups": [(known_xyz, _colors(known), 3), (solved, UNKNOWN_COLORS[:len(solved)], 4),
+                   (R_target[None] if R_target.any() else np.zeros((0, 3)), [RESULTANT_COLOR], 5)],
+        "axes": AXES_3D,
+        "shown": (len(known_xyz), len(known_xyz)),
+        "header": ["Kracht", "X", "Y", "Z"],
+        "rows": rows, "n_rows": len(known_xyz) + len(solved) + 1, "explain": explain,
+    }
+
+
+def _node_arrows(xy, forces, scale):
+    """Knoopkrachten als pijlen die in de knoop eindigen (lengte ∝ |F|); nulkrachten vallen weg."""
+    keep = np.abs(forces).sum(axis=1) > 0
+    v = forces[keep] * scale
+    return v, xy[keep] - v
+
+
+def _report_truss(stores, settings):
+    try:
+        xy, ends, fix, loads = truss_arrays(stores["truss_nodes"], stores["truss_members"])
+    except ValueError as e:
+        return {"summary": f"Ongeldig vakwerk: {e}", "groups": [], "axes": None, "shown": (0, 0),
+                "header": ["Staaf"], "rows": [], "n_rows": 0, "explain": [str(e)]}
+    N, reactions, residual, L, nnz, status = solve_truss(xy, ends, fix, loads)
+    n, m, r = len(xy), len(ends), int(fix.sum())
+    solved = status in (STATUS_OK, STATUS_ILL)
+    kinds = force_kind(N) if solved else np.full(m, "nul")
+    rows = [[f"S{k}", str(a + 1), str(b + 1), _f(length), _f(f) if solved else "", kind if solved else ""]
+            for k, ((a, b), length, f, kind) in enumerate(zip(ends[:TABLE_MAX_ROWS].tolist(), L.tolist(), N.tolist(),
+                                                                kinds.tolist()), start=1)]
+    explain = [f"{n} knopen → 2n = {2 * n} evenwichtsvergelijkingen; {m} staven + {r} reacties = {m + r} onbekenden.",
+               f"Stelsel A·[N; R] = −P: {2 * n} × {m + r}, {nnz} niet-nul coëfficiënten, één sparse LU-factorisatie.",
+               f"Status: {STATUS_LABELS_TRUSS[status]}" + (f", residu {residual:.2e} N." if solved else ".")]
+    span = max(float(np.ptp(xy[:, 0])), float(np.ptp(xy[:, 1])), 1.0) if n else 1.0
+    F_max = max(float(np.abs(loads).max(initial=0.0)), float(np.abs(reactions).max(initial=0.0)), EPS)
+    scale = 0.15 * span / F_max
+    if solved:
+        Rsum = reactions.sum(axis=0)
+        explain.append(f"Reacties: ΣRx = {Rsum[0]:.2f} N, ΣRy = {Rsum[1]:.2f} N "
+                       f"(som lasten: {loads[:, 0].sum():.2f}, {loads[:, 1].sum():.2f} N).")
+        n_kind = {k: int((kinds == k).sum()) for k in MEMBER_COLORS}
+        summary = (f"{m} staven: {n_kind['trek']} trek, {n_kind['druk']} druk, {n_kind['nul']} nul; "
+                   f"max |N| = {float(np.abs(N).max(initial=0.0)):.2f} N")
+        shown = _largest(N[:, None])
+    else:
+        summary = f"Geen oplossing: {STATUS_LABELS_TRUSS[status]}"
+        shown = np.arange(min(m, SVG_MAX_ARROWS))
+    a, b = xy[ends[shown, 0]], xy[ends[shown, 1]]
+    P, P0 = _node_arrows(xy, loads, scale)
+    R, R0 = _node_arrows(xy, reactions, scale)
+    return {
+        "summary": summary,
+        "groups": [(b - a, [MEMBER_COLORS[k] for k in kinds[shown].tolist()], 2, a, False),
+                   (P, [LOAD_COLOR] * len(P), 3, P0), (R, [REACTION_COLOR] * len(R), 3, R0)],
+        "axes": None,
+        "shown": (len(shown), m),
+        "header": ["Staaf", "Knoop a", "Knoop b", "L", "N (N)", "Soort"],
+        "rows": rows, "n_rows": m, "explain": explain,
+    }
+
+
+def _report_rigid3d(stores, settings):
+    loads, supports = stores["rigid_loads"], stores["rigid_supports"]
+    forces, points, cases, is_moment, at, directions = rigid_arrays(loads, supports,
+                                                                    settings.get("normalize_rigid3d", True))
+    names = [n or f"R{i}" for i, n in enumerate(supports.col("name").tolist(), start=1)]
+    labels, B = load_vectors(points, forces, cases)
+    X, residual, rank, cond, status = solve_reactions(support_matrix(is_moment, at, directions), B)
+    ok = in_balance(residual, B)
+    k, L = len(names), len(labels)
+    rows = [[f"{c:g}", *map(_f, x), _f(res), "ja" if good else "nee"]
+            for c, x, res, good in zip(labels[:TABLE_MAX_ROWS].tolist(), X.T.tolist(), residual.tolist(), ok.tolist())]
+    cases_txt = f"{L} belastinggeval" + ("len" if L != 1 else "")
+    explain = [f"{k} onbekende reacties, {cases_txt}; ΣF = 0 en ΣM = 0 om de oorsprong: A·x = −b met A 6 × {k}.",
+               f"Rang(A) = {rank}, conditiegetal {cond:.2e}: {STATUS_LABELS_RIGID[status]}."]
+    if np.isfinite(X).all() and L:
+        explain.append("A één keer gefactoriseerd (" + ("LU" if k == 6 else "QR") + f"), daarna opgelost voor {cases_txt}.")
+    summary = f"{STATUS_LABELS_RIGID[status]}; {int(ok.sum())} van {L} belastinggevallen in evenwicht"
+    groups = []
+    if L:
+        # Figuur: eerste belastinggeval, pijlen geschaald op de afmeting van het lichaam
+        first = cases == labels[0]
+        R = reaction_vectors(np.nan_to_num(X[:, 0]), directions)
+        size = max(float(np.ptp(np.vstack([points, at, np.zeros((1, 3))]), axis=0).max()), 1.0)
+        F_max = max(float(np.abs(forces[first]).max(initial=0.0)), float(np.abs(R[~is_moment]).max(initial=0.0)), EPS)
+        M_max = max(float(np.abs(R[is_moment]).max(initial=0.0)), EPS)
+        scale = 0.3 * size * np.where(is_moment, 1 / M_max, 1 / F_max)[:, None]
+        shown = np.flatnonzero(np.abs(R).sum(axis=1) > 0)
+        groups = [(forces[first] * 0.3 * size / F_max, [LOAD_COLOR] * int(first.sum()), 3, points[first]),
+                  ((R * scale)[shown], [COUPLE_COLOR if is_moment[i] else REACTION_COLOR for i in shown.tolist()],
+                   3, at[shown])]
+        if np.isfinite(X[:, 0]).all():
+            explain.append(f"Geval {labels[0]:g}: " + ", ".join(
+                f"{n} = {x:.2f} {'N·m' if m else 'N'}" for n, x, m in zip(names, X[:, 0].tolist(), is_moment.tolist())))
+    return {
+        "summary": summary,
+        "groups": groups,
+        "axes": AXES_3D,
+        "shown": (sum(len(g[0]) for g in groups), len(forces) + k),
+        "header": ["Geval", *names, "Residu", "Evenwicht"],
+        "rows": rows, "n_rows": L, "explain": explain,
+    }
+
+
+BUILDERS = {"3d": _report_3d, "2d": _report_2d, "solver": _report_solver, "solver3d": _report_solver3d,
+            "truss": _report_truss, "rigid3d": _report_rigid3d}
+
+
+# ===================================
+# HTML
+# ===================================
+_CSS = ("body{font-family:sans-serif;max-width:960px;margin:2em auto;color:#212121}"
+        "table{border-collapse:collapse;font-size:13px}td,th{border:1px solid #ddd;padding:3px 8px;text-align:right}"
+        "th{background:#f5f5f5}td:first-child{text-align:left}.meta{color:#757575}svg{border:1px solid #eee}")
+
+
+def slug(name):
+    """Bestandsnaamveilige versie van een scenarionaam."""
+    return re.sub(r"[^0-9A-Za-z._-]+", "_", name).strip("_") or "scenario"
+
+
+def render_report(kind, name, raw):
+    """Scenario-inhoud (`share.pack`) → (html-tekst, svg-tekst) voor één rapport."""
+    columns, settings = unpack(kind, raw)
+    rep = BUILDERS[kind](_stores(kind, columns), settings)
+    svg = svg_arrows(rep["groups"], rep["axes"])
+    esc = html.escape
+    parts = [f"<!DOCTYPE html><html lang=\"nl\"><head><meta charset=\"utf-8\"><title>{esc(name)}</title>"
+             f"<style>{_CSS}</style></head><body>",
+             f"<h1>{esc(name)}</h1>",
+             f"<p class=\"meta\">{esc(KIND_TITLES[kind])} · {datetime.now():%d-%m-%Y %H:%M}</p>",
+             f"<p><b>{esc(rep['summary'])}</b></p>", svg]
+    shown, total = rep["shown"]
+    if shown < total:
+        parts.append(f"<p class=\"meta\">Figuur: de {shown} grootste van {total} vectoren.</p>")
+    parts.append("<h2>Componenten</h2><table><tr>" + "".join(f"<th>{esc(h)}</th>" for h in rep["header"]) + "</tr>")
+    parts += ["<tr>" + "".join(f"<td>{esc(c)}</td>" for c in row) + "</tr>" for row in rep["rows"]]
+    parts.append("</table>")
+    if len(rep["rows"]) < rep["n_rows"]:
+        parts.append(f"<p class=\"meta\">Tabel en uitleg ingekort tot de eerste {TABLE_MAX_ROWS} rijen.</p>")
+    parts.append("<h2>Uitleg</h2><ul>" + "".join(f"<li>{esc(line)}</li>" for line in rep["explain"]) + "</ul>")
+    parts.append("</body></html>")
+    return "".join(parts), svg
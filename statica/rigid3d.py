@@ -0,0 +1,137 @@
+"""Rekenkern van de oplegreacties-pagina: evenwicht van een star lichaam in 3D.
+
+ΣF = 0 en ΣM = 0 (om de oorsprong) zijn zes vergelijkingen A·x = −b. Een
+reactiekracht met richting u in punt P geeft de kolom [u; P × u], een
+reactiekoppel met as u de kolom [0; u]; b = [ΣF; Σ P_i × F_i] per
+belastinggeval. De rang van A zegt hoe het lichaam is opgelegd: rang 6 met
+zes onbekenden is statisch bepaald, rang < 6 een mechanisme (het lichaam kan
+nog bewegen) en meer onbekenden dan de rang is statisch onbepaald.
+
+A hangt alleen van de opleggingen af. Voor alle belastinggevallen samen wordt
+A daarom één keer gefactoriseerd (LU bij zes onbekenden, QR bij minder) en
+daarna in één stap voor de hele (6, L)-matrix van rechterleden opgelost.
+"""
+import numpy as np
+
+from statica.solver import COND_MAX
+from statica.solver3d import unit_rows
+from statica.vectors import EPS, as_rows, columns_to_cart, entries_to_cart
+
+STATUS_OK, STATUS_ILL, STATUS_MECHANISM, STATUS_INDETERMINATE, STATUS_IMPROPER = 0, 1, 2, 3, 4
+STATUS_LABELS_RIGID = {
+    STATUS_OK: "statisch bepaald",
+    STATUS_ILL: "bijna beweeglijk (slecht geconditioneerd)",
+    STATUS_MECHANISM: "mechanisme (het lichaam kan nog bewegen)",
+    STATUS_INDETERMINATE: "statisch onbepaald (overtallige reacties)",
+    STATUS_IMPROPER: "onbepaald én beweeglijk (afhankelijke reacties)",
+}
+RANK_TOL = 1e-10       # singuliere waarden onder RANK_TOL × de grootste tellen niet mee voor de rang
+RESIDUAL_TOL = 1e-9    # relatief t.o.v. max(1, |b|): daaronder is een belastinggeval in evenwicht
+
+
+# ===================================
+# Invoer
+# ===================================
+def rigid_arrays(loads, supports, normalize_dircos=True):
+    """Belastingen- en reactieopslag → arrays voor `load_vectors` en `support_matrix`.
+
+    Geeft belastingen (N,3), hun aangrijpingspunten (N,3) en gevalnummers (N,),
+    en per reactie: koppel ja/nee (k,), aangrijpingspunt (k,3) en richting (k,3).
+    """
+    forces = entries_to_cart(loads, normalize_dircos=normalize_dircos)
+    directions = columns_to_cart(supports.is_("mode", "dir"), np.ones(len(supports)), supports.stack("x", "y", "z"),
+                                 supports.stack("alpha", "beta", "gamma"), normalize_dircos)
+    return (forces, loads.stack("px", "py", "pz"), loads.col("case"),
+            supports.is_("type", "moment"), supports.stack("px", "py", "pz"), directions)
+
+
+def reaction_vectors(x, directions):
+    """Reactiewaarden van één belastinggeval (k,) → vectoren x·u (k,3) langs de reactierichtingen."""
+    return np.asarray(x, dtype=float)[:, None] * unit_rows(as_rows(directions, 3))
+
+
+# ===================================
+# Stelsel
+# ===================================
+def support_matrix(is_moment, points, directions):
+    """Coëfficiëntenmatrix A (6,k): kolom [u; P × u] per reactiekracht, [0; u] per reactiekoppel."""
+    u = unit_rows(as_rows(directions, 3))
+    is_moment = np.asarray(is_moment, dtype=bool).reshape(-1)
+    moment = np.cross(as_rows(points, 3), u)
+    moment[is_moment] = u[is_moment]
+    force = np.where(is_moment[:, None], 0.0, u)
+    return np.vstack([force.T, moment.T])
+
+
+def load_vectors(points, forces, cases):
+    """Rechterleden per belastinggeval: (gevalnummers (L,), B (6,L) met [ΣF; Σ P × F] om de oorsprong)."""
+    forces = as_rows(forces, 3)
+    wrench = np.hstack([forces, np.cross(as_rows(points, 3), forces)])
+    labels, inverse = np.unique(np.asarray(cases, dtype=float), return_inverse=True)
+    B = np.zeros((len(labels), 6))
+    np.add.at(B, inverse, wrench)
+    return labels, B.T
+
+
+def classify(A, cond_max=COND_MAX):
+    """Rang, conditiegetal (binnen de rang) en status van de oplegging uit één SVD van A."""
+    k = A.shape[1]
+    if not k:
+        return 0, np.inf, STATUS_MECHANISM
+    sv = np.linalg.svd(A, compute_uv=False)
+    rank = int((sv > RANK_TOL * max(float(sv[0]), EPS)).sum())
+    cond = float(sv[0] / sv[rank - 1]) if rank else np.inf
+    if rank < k:
+        status = STATUS_IMPROPER if rank < 6 else STATUS_INDETERMINATE
+    elif rank < 6:
+        status = STATUS_MECHANISM
+    else:
+        status = STATUS_ILL if cond > cond_max else STATUS_OK
+    return rank, cond, status
+
+
+# ===================================
+# Oplossen
+# ===================================
+def solve_reactions(A, B, cond_max=COND_MAX):
+    """Reacties voor alle belastinggevallen tegelijk: A·X = −B.
+
+    Geeft X (k,L; NaN als de reacties niet eenduidig zijn), residu |A·X + B| per
+    geval (L,), rang, conditiegetal en status. Bij een mechanisme met
+    onafhankelijke reacties is er per geval alleen een oplossing als de
+    belasting de vrije beweging niet aandrijft; het residu laat zien welke
+    gevallen dat wel doen (kleinste-kwadratenoplossing, niet in evenwicht).
+    """
+    k, L = A.shape[1], B.shape[1]
+    rank, cond, status = classify(A, cond_max)
+    X = np.full((k, L), np.nan)
+    residual = np.full(L, np.nan)
+    if not k or rank < k:
+        return X, residual, rank, cond, status
+    from scipy.linalg import lu_factor, lu_solve, solve_triangular  # lazy: scipy pas laden bij de eerste berekening
+    if k == 6:
+        X = lu_solve(lu_factor(A), -B)
+    else:
+        Q, R = np.linalg.qr(A)
+        X = solve_triangular(R, Q.T @ -B)
+    residual = np.linalg.norm(A @ X + B, axis=0)
+    return X, residual, rank, cond, status
+
+
+def free_motions(A):
+    """Bewegingen die de opleggingen toelaten: rijen (v, ω) (6−rang, 6) met wᵀ·A = 0, genormaliseerd.
+
+    v is de snelheid van het punt in de oorsprong, ω de rotatie; een reactie met
+    richting u in P levert geen arbeid als de snelheid v + ω × P in P loodrecht op u staat.
+    """
+    if not A.shape[1]:
+        return np.eye(6)
+    U, sv, _ = np.linalg.svd(A)
+    rank = int((sv > RANK_TOL * max(float(sv[0]), EPS)).sum())
+    W = U[:, rank:].T
+    return W * np.sign(W[np.arange(len(W)), np.abs(W).argmax(axis=1)])[:, None]   # grootste component positief
+
+
+def in_balance(residual, B):
+    """Per belastinggeval: True als de reacties de belasting (binnen RESIDUAL_TOL) in evenwicht houden."""
+    return residual <= RESIDUAL_TOL * np.maximum(1.0, np.linalg.norm(B, axis=0))
@@ -0,0 +1,207 @@
+"""Lokale scenariobibliotheek: benoemde opgaven per vak in één SQLite-bestand.
+
+Geen externe dienst: het bestand staat standaard in `~/.statica/scenarios.sqlite3`
+(of in `$STATICA_DB`). Metadata (pagina, vak, naam, tags, tijden, aantal rijen)
+en inhoud staan in aparte tabellen: de lijstweergave leest alleen de metadata
+via de indexen op naam, vak, tag en datum; de inhoud wordt pas gelezen als een
+scenario geopend wordt. De inhoud is het kolomformaat van de deellinks
+(`share.pack`, verliesvrij): één compacte blob per scenario i.p.v. JSON per rij.
+"""
+import os
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime
+
+import streamlit as st
+
+from statica.paging import lazy_section
+from statica.share import apply_scenario, pack, session_scenario, unpack
+
+DB_PATH = os.environ.get("STATICA_DB", os.path.join(os.path.expanduser("~"), ".statica", "scenarios.sqlite3"))
+LIST_LIMIT = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenario (
+    id      INTEGER PRIMARY KEY,
+    kind    TEXT NOT NULL,
+    course  TEXT NOT NULL DEFAULT '',
+    name    TEXT NOT NULL,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    n_rows  INTEGER NOT NULL,
+    nbytes  INTEGER NOT NULL,
+    UNIQUE (kind, course, name)
+);
+CREATE INDEX IF NOT EXISTS ix_scenario_name ON scenario (kind, name);
+CREATE INDEX IF NOT EXISTS ix_scenario_updated ON scenario (kind, updated DESC);
+CREATE TABLE IF NOT EXISTS scenario_tag (
+    tag         TEXT NOT NULL,
+    scenario_id INTEGER NOT NULL REFERENCES scenario (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, scenario_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_scenario_tag_scenario ON scenario_tag (scenario_id);
+CREATE TABLE IF NOT EXISTS scenario_data (
+    scenario_id INTEGER PRIMARY KEY REFERENCES scenario (id) ON DELETE CASCADE,
+    payload     BLOB NOT NULL
+);
+"""
+_ready = set()
+
+
+def split_tags(text):
+    """'statica, week 3,  ' → ['statica', 'week 3'] (uniek, in volgorde)."""
+    return list(dict.fromkeys(t.strip() for t in str(text).split(",") if t.strip()))
+
+
+class ScenarioStore:
+    """SQLite-bibliotheek; elke bewerking opent een eigen verbinding (veilig over Streamlit-threads)."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+
+    def _connect(self):
+        first = self.path not in _ready
+        if first:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        con = sqlite3.connect(self.path, timeout=10)
+        con.execute("PRAGMA foreign_keys = ON")
+        if first:
+            con.execute("PRAGMA journal_mode = WAL")
+            con.executescript(_SCHEMA)
+            _ready.add(self.path)
+        return con
+
+    # ---------- schrijven ----------
+    def save(self, kind, name, payload, course="", tags=(), n_rows=0):
+        """Sla op onder (pagina, vak, naam); een bestaand scenario met die naam wordt overschreven. Geeft het id."""
+        name, course = name.strip(), course.strip()
+        if not name:
+            raise ValueError("een scenario heeft een naam nodig")
+        now = time.time()
+        with closing(self._connect()) as con, con:
+            row = con.execute("SELECT id FROM scenario WHERE kind = ? AND course = ? AND name = ?",
+                              (kind, course, name)).fetchone()
+            if row is None:
+                sid = con.execute(
+                    "INSERT INTO scenario (kind, course, name, created, updated, n_rows, nbytes) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (kind, course, name, now, now, n_rows, len(payload))).lastrowid
+            else:
+                sid = row[0]
+                con.execute("UPDATE scenario SET updated = ?, n_rows = ?, nbytes = ? WHERE id = ?",
+                            (now, n_rows, len(payload), sid))
+                con.execute("DELETE FROM scenario_tag WHERE scenario_id = ?", (sid,))
+            con.execute("INSERT OR REPLACE INTO scenario_data (scenario_id, payload) VALUES (?, ?)",
+                        (sid, sqlite3.Binary(payload)))
+            con.executemany("INSERT INTO scenario_tag (tag, scenario_id) VALUES (?, ?)", [(t, sid) for t in tags])
+        return sid
+
+    def delete(self, sid):
+        with closing(self._connect()) as con, con:
+            con.execute("DELETE FROM scenario WHERE id = ?", (sid,))
+
+    # ---------- lezen ----------
+    def list(self, kind, course=None, tag=None, search="", limit=LIST_LIMIT):
+        """Alleen metadata (nieuwste eerst), gefilterd op vak, tag en/of naamprefix."""
+        sql = ["SELECT s.id, s.course, s.name, s.created, s.updated, s.n_rows, s.nbytes FROM scenario s"]
+        args = []
+        if tag:
+            sql.append("JOIN scenario_tag t ON t.scenario_id = s.id AND t.tag = ?")
+            args.append(tag)
+        sql.append("WHERE s.kind = ?")
+        args.append(kind)
+        if course is not None:
+            sql.append("AND s.course = ?")
+            args.append(course)
+        if search:
+            # Prefix-zoeken gebruikt de naamindex; 'GLOB' is hoofdlettergevoelig en heeft geen escape nodig voor %/_
+            sql.append("AND s.name GLOB ?")
+            args.append(search.replace("[", "[[]").replace("*", "[*]").replace("?", "[?]") + "*")
+        sql.append("ORDER BY s.updated DESC LIMIT ?")
+        args.append(limit)
+        cols = ("id", "course", "name", "created", "updated", "n_rows", "nbytes")
+        with closing(self._connect()) as con:
+            rows = [dict(zip(cols, r)) for r in con.execute(" ".join(sql), args)]
+            if rows:
+                ids = [r["id"] for r in rows]
+                tags = {}
+                for t, sid in con.execute(
+                        f"SELECT tag, scenario_id FROM scenario_tag WHERE scenario_id IN ({','.join('?' * len(ids))})", ids):
+                    tags.setdefault(sid, []).append(t)
+                for r in rows:
+                    r["tags"] = sorted(tags.get(r["id"], []))
+        return rows
+
+    def courses(self, kind):
+        with closing(self._connect()) as con:
+            return [r[0] for r in con.execute("SELECT DISTINCT course FROM scenario WHERE kind = ? ORDER BY course", (kind,))]
+
+    def tags(self, kind):
+        with closing(self._connect()) as con:
+            return [r[0] for r in con.execute(
+                "SELECT DISTINCT t.tag FROM scenario_tag t JOIN scenario s ON s.id = t.scenario_id WHERE s.kind = ? "
+                "ORDER BY t.tag", (kind,))]
+
+    def payload(self, sid):
+        """Inhoud van één scenario (bytes), of None als het niet (meer) bestaat."""
+        with closing(self._connect()) as con:
+            row = con.execute("SELECT payload FROM scenario_data WHERE scenario_id = ?", (sid,)).fetchone()
+        return bytes(row[0]) if row else None
+
+
+# ===================================
+# Streamlit
+# ===================================
+def _label(meta):
+    when = datetime.fromtimestamp(meta["updated"]).strftime("%d-%m-%Y %H:%M")
+    course = f"{meta['course']} · " if meta["course"] else ""
+    tags = f" [{', '.join(meta['tags'])}]" if meta["tags"] else ""
+    return f"{course}{meta['name']} — {meta['n_rows']} rijen, {when}{tags}"
+
+
+def scenario_section(kind, store=None):
+    """Sidebar-blok om het huidige scenario op te slaan en opgeslagen scenario's te zoeken en te openen.
+
+    Roep aan vóór de invoer en de instellingen-widgets van de pagina worden opgebouwd. De database wordt
+    alleen gelezen als het blok open is.
+    """
+    with st.sidebar:
+        exp, is_open = lazy_section("💾 Scenario's", key=f"scn_section_{kind}")
+    if not is_open:
+        return
+    store = store or ScenarioStore()
+    with exp:
+        name = st.text_input("Naam", key=f"scn_name_{kind}")
+        course = st.text_input("Vak", key=f"scn_course_{kind}")
+        tags = st.text_input("Tags (komma's)", key=f"scn_tags_{kind}")
+        if st.button("Opslaan", key=f"scn_save_{kind}", disabled=not name.strip(), width="stretch"):
+            stores, settings = session_scenario(kind)
+            store.save(kind, name, pack(kind, stores, settings, exact=True), course=course,
+                       tags=split_tags(tags), n_rows=sum(len(s) for s in stores.values()))
+            st.caption(f"“{name.strip()}” opgeslagen.")
+
+        st.divider()
+        courses = store.courses(kind)
+        known_tags = store.tags(kind)
+        f_course = st.selectbox("Filter vak", courses, index=None, placeholder="Alle vakken",
+                                format_func=lambda c: c or "(geen vak)", key=f"scn_fcourse_{kind}")
+        f_tag = st.selectbox("Filter tag", known_tags, index=None, placeholder="Alle tags", key=f"scn_ftag_{kind}")
+        search = st.text_input("Naam begint met", key=f"scn_search_{kind}")
+        listing = store.list(kind, course=f_course, tag=f_tag, search=search.strip())
+        if not listing:
+            st.caption("Geen opgeslagen scenario's.")
+            return
+        by_id = {m["id"]: m for m in listing}
+        sid = st.selectbox("Scenario", list(by_id), format_func=lambda i: _label(by_id[i]), key=f"scn_pick_{kind}")
+        c1, c2 = st.columns(2)
+        if c1.button("Openen", key=f"scn_open_{kind}", width="stretch"):
+            raw = store.payload(sid)
+            try:
+                if raw is None:
+                    raise ValueError("scenario bestaat niet meer")
+                apply_scenario(kind, *unpack(kind, raw))
+            except ValueError as e:
+                st.warning(f"Scenario kon niet worden geopend: {e}.")
+        if c2.button("Verwijderen", key=f"scn_del_{kind}", width="stretch"):
+            store.delete(sid)
+            st.rerun()
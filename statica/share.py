@@ -0,0 +1,317 @@
+"""Deellinks: de volledige invoer en de rekeninstellingen van een pagina als één compacte queryparameter.
+
+Formaat (versie 3), base64url zonder opvulling in `?s=`:
+  kop     : versie (u8), pagina (u8), vlaggen (u8; bit 0 = romp met zlib gecomprimeerd)
+  romp    : het aantal invoerlijsten (u8; ontbrekende laatste lijsten → leeg), dan
+            per invoerlijst het aantal rijen (u32), het aantal kolommen (u8) en per
+            schemakolom één blok (ontbrekende laatste kolommen → standaardwaarde):
+              - standaard  : alle rijen hebben de standaardwaarde (geen data)
+              - kwantisatie: floats × `SCALE` als int8/int16/int32 (kleinste die past)
+              - float64    : als de kwantisatie niet past
+              - bits       : booleans via np.packbits
+              - tekst      : waardelijst (paletindex of UTF-8) + codes (u8/u16)
+            daarna de instellingen: aantal (u8) en per instelling index (u8) + getypeerde waarde.
+Herstellen gebeurt in één keer: de kolommen gaan rechtstreeks de invoeropslag
+in en de instellingen in `st.session_state`, zonder widget voor widget te herlopen.
+"""
+import base64
+import struct
+import zlib
+
+import numpy as np
+import streamlit as st
+
+from statica.editor import reset_bulk_editor
+from statica.store import STORE_FIELDS, VectorStore, field_kind
+
+FORMAT_VERSION = 3
+# Versie 1 had nog geen kolomtelling: toen bestonden alleen de kolommen vóór het aangrijpingspunt
+_V1_COLUMNS = {"entries": 14, "entries2d": 7}
+# Versie 1 en 2 hadden geen lijsttelling: toen had de 2D-pagina nog geen verdeelde lasten
+_V2_STORES = {"2d": 1}
+QUERY_KEY = "s"
+SCALE = 100   # floats gekwantiseerd op 0,01 (de pagina's tonen alles op 2 decimalen)
+
+KINDS = ("3d", "2d", "solver", "solver3d", "truss", "rigid3d")
+# Per pagina: invoerlijsten (sessie-sleutels) en gedeelde instellingen (widget-sleutels)
+SHARE_SPEC = {
+    "3d": (("entries",), ("normalize_3d", "resultant_color_3d", "moment_ax_3d", "moment_ay_3d", "moment_az_3d")),
+    "2d": (("entries2d", "loads2d"), ("resultant_color_2d", "moment_ax_2d", "moment_ay_2d",
+                                      "load_discretize_2d", "load_tol_2d")),
+    "solver": (("known_forces",), ("target_R", "target_ori", "target_phi", "target_alpha",
+                                   "unknown_mode", "theta_a", "theta_b")),
+    "solver3d": (("known3d", "unknowns3d"), ("goal_3d", "target3d_x", "target3d_y", "target3d_z", "normalize_solver3d")),
+    "truss": (("truss_nodes", "truss_members"), ()),
+    "rigid3d": (("rigid_loads", "rigid_supports"), ("normalize_rigid3d",)),
+}
+# Kleuren als één byte: Plotly-standaardpalet + standaardkleur van de resultante
+PALETTE = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+           "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf", "#e41a1c"]
+_PALETTE_INDEX = {c: i for i, c in enumerate(PALETTE)}
+
+# Kolomblokken
+_COL_DEFAULT, _COL_QUANT, _COL_F64, _COL_BITS, _COL_TEXT = range(5)
+# Losse waarden (tekstlijst en instellingen)
+_VAL_NONE, _VAL_FALSE, _VAL_TRUE, _VAL_FLOAT, _VAL_PALETTE, _VAL_STR = range(6)
+_INT_WIDTHS = ((1, np.dtype("i1")), (2, np.dtype("<i2")), (4, np.dtype("<i4")))
+# Grenzen tegen kwaadaardige links: rijen per lijst en uitgepakte rompgrootte
+MAX_ROWS = 100_000
+MAX_BODY = 16 * 2**20
+
+
+# ===================================
+# Schrijven
+# ===================================
+def _put_value(buf, value):
+    if value is None:
+        buf.append(_VAL_NONE)
+    elif isinstance(value, (bool, np.bool_)):
+        buf.append(_VAL_TRUE if value else _VAL_FALSE)
+    elif isinstance(value, (int, float, np.number)):
+        buf.append(_VAL_FLOAT)
+        buf += struct.pack("<d", float(value))
+    elif value in _PALETTE_INDEX:
+        buf += bytes((_VAL_PALETTE, _PALETTE_INDEX[value]))
+    else:
+        raw = str(value).encode("utf-8")
+        buf.append(_VAL_STR)
+        buf += struct.pack("<H", len(raw)) + raw
+
+
+def _put_column(buf, kind, values, default, exact=False):
+    if kind == "text":
+        if all(v == default for v in values):
+            buf.append(_COL_DEFAULT)
+            return
+        cats = {}
+        codes = [cats.setdefault(v, len(cats)) for v in values]
+        buf.append(_COL_TEXT)
+        buf += struct.pack("<H", len(cats))
+        for v in cats:
+            _put_value(buf, v)
+        buf += np.asarray(codes, dtype="u1" if len(cats) <= 256 else "<u2").tobytes()
+        return
+    values = np.asarray(values)
+    if np.all(values == default):
+        buf.append(_COL_DEFAULT)
+    elif kind == "bool":
+        buf.append(_COL_BITS)
+        buf += np.packbits(values.astype(bool)).tobytes()
+    else:
+        q = np.round(values * SCALE)
+        peak = float(np.max(np.abs(q))) if np.all(np.isfinite(q)) else np.inf
+        if exact and not np.array_equal(q / SCALE, values):
+            peak = np.inf   # verliesvrij gevraagd en niet alles ligt op het 0,01-rooster
+        for width, dtype in _INT_WIDTHS:
+            if peak <= np.iinfo(dtype).max:
+                buf += bytes((_COL_QUANT, width))
+                buf += q.astype(dtype).tobytes()
+                return
+        buf.append(_COL_F64)
+        buf += values.astype("<f8").tobytes()
+
+
+def pack(kind, stores, settings, exact=False):
+    """Invoeropslagen (sessie-sleutel → VectorStore) en instellingen (sleutel → waarde) → bytes.
+
+    Met `exact` worden floats alleen gekwantiseerd als dat verliesvrij is (opslag i.p.v. links).
+    """
+    store_keys, setting_keys = SHARE_SPEC[kind]
+    body = bytearray((len(store_keys),))
+    for key in store_keys:
+        store = stores[key]
+        body += struct.pack("<IB", len(store), len(store.fields))
+        for c, default in store.fields.items():
+            col = store.col(c)
+            _put_column(body, store.kinds[c], col.tolist() if store.kinds[c] == "text" else col, default, exact)
+    present = [(i, settings[k]) for i, k in enumerate(setting_keys) if k in settings]
+    body.append(len(present))
+    for i, value in present:
+        body.append(i)
+        _put_value(body, value)
+    packed = zlib.compress(bytes(body), 9)
+    flags, payload = (1, packed) if len(packed) < len(body) else (0, bytes(body))
+    return bytes((FORMAT_VERSION, KINDS.index(kind), flags)) + payload
+
+
+def encode(kind, stores, settings):
+    """Als `pack`, maar als base64url-token voor in de URL."""
+    return base64.urlsafe_b64encode(pack(kind, stores, settings)).rstrip(b"=").decode("ascii")
+
+
+# ===================================
+# Lezen
+# ===================================
+class _Reader:
+    def __init__(self, data):
+        self.data, self.pos = data, 0
+
+    def take(self, n):
+        if self.pos + n > len(self.data):
+            raise ValueError("deellink is afgekapt")
+        out = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return out
+
+    def u8(self):
+        return self.take(1)[0]
+
+    def unpack(self, fmt):
+        return struct.unpack(fmt, self.take(struct.calcsize(fmt)))[0]
+
+    def array(self, dtype, n):
+        dtype = np.dtype(dtype)
+        return np.frombuffer(self.take(dtype.itemsize * n), dtype=dtype)
+
+    def value(self):
+        tag = self.u8()
+        if tag == _VAL_NONE:
+            return None
+        if tag in (_VAL_FALSE, _VAL_TRUE):
+            return tag == _VAL_TRUE
+        if tag == _VAL_FLOAT:
+            return self.unpack("<d")
+        if tag == _VAL_PALETTE:
+            i = self.u8()
+            if i >= len(PALETTE):
+                raise ValueError(f"onbekende paletkleur {i}")
+            return PALETTE[i]
+        if tag == _VAL_STR:
+            return self.take(self.unpack("<H")).decode("utf-8")
+        raise ValueError(f"onbekend waardetype {tag}")
+
+    def column(self, kind, default, n):
+        tag = self.u8()
+        if tag == _COL_DEFAULT:
+            return [default] * n if kind == "text" else np.full(n, default)
+        if tag == _COL_TEXT:
+            cats = [self.value() for _ in range(self.unpack("<H"))]
+            codes = self.array("u1" if len(cats) <= 256 else "<u2", n)
+            if n and codes.max() >= len(cats):
+                raise ValueError("tekstcode buiten de waardelijst")
+            return np.asarray(cats, dtype=object)[codes].tolist() if n else []
+        if tag == _COL_BITS:
+            return np.unpackbits(self.array(np.uint8, (n + 7) // 8))[:n].astype(bool)
+        if tag == _COL_QUANT:
+            width = self.u8()
+            dtype = dict(_INT_WIDTHS).get(width)
+            if dtype is None:
+                raise ValueError(f"onbekende breedte {width}")
+            return self.array(dtype, n).astype(float) / SCALE
+        if tag == _COL_F64:
+            return self.array("<f8", n).astype(float)
+        raise ValueError(f"onbekend kolomtype {tag}")
+
+
+def _raw(token):
+    try:
+        return base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (ValueError, TypeError):
+        raise ValueError("geen geldige base64-tekst")
+
+
+def token_kind(token):
+    """Pagina waar een token bij hoort (None als de kop onleesbaar is)."""
+    try:
+        raw = _raw(token)
+    except ValueError:
+        return None
+    return KINDS[raw[1]] if len(raw) >= 3 and raw[1] < len(KINDS) else None
+
+
+def decode(kind, token):
+    """Token → (sessie-sleutel → kolommen, instellingen); ValueError bij een ongeldige of vreemde link."""
+    return unpack(kind, _raw(token))
+
+
+def unpack(kind, raw):
+    """Bytes van `pack` → (sessie-sleutel → kolommen, instellingen); ValueError bij ongeldige inhoud."""
+    if len(raw) < 3:
+        raise ValueError("deellink is te kort")
+    version, kind_index, flags = raw[0], raw[1], raw[2]
+    if not 1 <= version <= FORMAT_VERSION:
+        raise ValueError(f"onbekende versie {version} (deze app leest versie {FORMAT_VERSION})")
+    if kind_index >= len(KINDS) or KINDS[kind_index] != kind:
+        raise ValueError("de link hoort bij een andere pagina")
+    body = raw[3:]
+    if flags & 1:
+        inflater = zlib.decompressobj()
+        try:
+            body = inflater.decompress(body, MAX_BODY)
+        except zlib.error:
+            raise ValueError("gecomprimeerde inhoud is beschadigd")
+        if inflater.unconsumed_tail:
+            raise ValueError("deellink is te groot")
+    r = _Reader(body)
+    store_keys, setting_keys = SHARE_SPEC[kind]
+    n_stores = r.u8() if version > 2 else _V2_STORES.get(kind, len(store_keys))
+    if n_stores > len(store_keys):
+        raise ValueError(f"onbekende invoerlijsten ({n_stores}, deze pagina kent er {len(store_keys)})")
+    columns = {}
+    for i, key in enumerate(store_keys):
+        fields = STORE_FIELDS[key]
+        if i >= n_stores:
+            columns[key] = {c: [] if field_kind(default) == "text" else np.zeros(0) for c, default in fields.items()}
+            continue
+        n = r.unpack("<I")
+        if n > MAX_ROWS:
+            raise ValueError(f"te veel rijen ({n}, max. {MAX_ROWS})")
+        n_cols = r.u8() if version > 1 else _V1_COLUMNS.get(key, len(fields))
+        if n_cols > len(fields):
+            raise ValueError(f"onbekende kolommen ({n_cols}, deze app kent er {len(fields)})")
+        columns[key] = {c: r.column(field_kind(default), default, n) if j < n_cols
+                        else ([default] * n if field_kind(default) == "text" else np.full(n, default))
+                        for j, (c, default) in enumerate(fields.items())}
+    settings = {}
+    for _ in range(r.u8()):
+        i = r.u8()
+        if i >= len(setting_keys):
+            raise ValueError(f"onbekende instelling {i}")
+        settings[setting_keys[i]] = r.value()
+    return columns, settings
+
+
+# ===================================
+# Streamlit
+# ===================================
+def apply_scenario(kind, columns, settings):
+    """Zet gedecodeerde kolommen en instellingen in één stap in de sessie (vóór de widgets)."""
+    for key in SHARE_SPEC[kind][0]:
+        if key not in st.session_state:
+            st.session_state[key] = VectorStore(STORE_FIELDS[key])
+        st.session_state[key].replace_columns(columns[key])
+        reset_bulk_editor(f"{key}_bulk")
+    st.session_state.update(settings)
+
+
+def session_scenario(kind):
+    """Huidige invoeropslagen en instellingen van een pagina, zoals `pack` ze verwacht."""
+    store_keys, setting_keys = SHARE_SPEC[kind]
+    stores = {k: st.session_state[k] if k in st.session_state else VectorStore(STORE_FIELDS[k]) for k in store_keys}
+    settings = {k: st.session_state[k] for k in setting_keys if k in st.session_state}
+    return stores, settings
+
+
+def share_section(kind):
+    """Herstel de pagina één keer per link uit `?s=` en toon in de sidebar de knop die een deellink maakt.
+
+    Roep aan vóór de invoer en de instellingen-widgets van de pagina worden opgebouwd.
+    """
+    token = st.query_params.get(QUERY_KEY)
+    # Een link van een andere pagina (bijv. na navigeren) wordt stil genegeerd
+    if token and st.session_state.get("share_applied") != token and token_kind(token) in (kind, None):
+        st.session_state["share_applied"] = token
+        try:
+            columns, settings = decode(kind, token)
+        except ValueError as e:
+            st.warning(f"Deellink kon niet worden geladen: {e}.")
+        else:
+            apply_scenario(kind, columns, settings)
+
+    with st.sidebar:
+        if st.button("🔗 Deellink maken", key=f"share_{kind}", width="stretch",
+                     help="Zet de volledige invoer en instellingen in de URL; kopieer daarna de adresbalk."):
+            token = encode(kind, *session_scenario(kind))
+            st.query_params[QUERY_KEY] = token
+            st.session_state["share_applied"] = token
+            st.caption(f"Link staat in de adresbalk ({len(token)} tekens); kopieer die om dit scenario te delen.")
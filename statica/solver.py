@@ -0,0 +1,113 @@
+"""Rekenkern van de 2D-solver met één onbekende kracht F₁ (zonder Streamlit).
+
+F₁ vult het verschil aan tussen de gewenste resultante R en de som S van de
+bekende krachten: D = R − S, F₁ = |D|, θ₁ = atan2(Dy, Dx). Alle functies
+werken op een hele batch opgaven tegelijk.
+"""
+import itertools
+import numpy as np
+
+from statica.vectors import EPS, as_rows, polar_to_xy, xy_to_polar, vec_norm
+
+
+def solve_unknown_force(S, R_target):
+    """(N,2) som bekende krachten + (N,2) doel → D (N,2), F₁ (N,) en θ₁ (N,, NaN als F₁ = 0)."""
+    D = as_rows(R_target, 2) - as_rows(S, 2)
+    theta1, _ = xy_to_polar(D)
+    return D, vec_norm(D), theta1
+
+
+def parse_problem(rec):
+    """Eén opgave (dict) → (F-lijst, θ-lijst, |R|, φ).
+
+    Bekende krachten als lijst `known` met `F`/`theta`, of als kolommen `F` en
+    `theta`. De richting van R via `phi` of `alpha` (R langs x′, zelfde hoek).
+    Lijsten blijven Python-lijsten; `solve_problems` zet een hele batch in één keer om.
+    """
+    if not isinstance(rec, dict):
+        raise ValueError("opgave moet een JSON-object zijn")
+    if "known" in rec:
+        known = rec["known"] or []
+        F = [float(k.get("F", k.get("force", 0.0))) for k in known]
+        theta = [float(k.get("theta", 0.0)) for k in known]
+    else:
+        F, theta = rec.get("F", []), rec.get("theta", [])
+        F = [float(v) for v in (F if isinstance(F, list) else [F])]
+        theta = [float(v) for v in (theta if isinstance(theta, list) else [theta])]
+    if len(F) != len(theta):
+        raise ValueError(f"F en theta hebben ongelijke lengte ({len(F)} vs {len(theta)})")
+    if "R" not in rec:
+        raise ValueError("doel 'R' ontbreekt")
+    phi = rec.get("phi", rec.get("alpha", 0.0))
+    return F, theta, float(rec["R"]), float(phi)
+
+
+def solve_problems(problems):
+    """Los een lijst geparste opgaven (F, θ, |R|, φ) in één gevectoriseerde stap op.
+
+    Alle bekende krachten gaan plat in één array; de som per opgave volgt uit
+    `np.bincount` met het opgavenummer als index.
+    """
+    n = len(problems)
+    counts = np.fromiter((len(p[0]) for p in problems), dtype=np.intp, count=n)
+    idx = np.repeat(np.arange(n), counts)
+    F = np.fromiter(itertools.chain.from_iterable(p[0] for p in problems), dtype=float, count=int(counts.sum()))
+    theta = np.fromiter(itertools.chain.from_iterable(p[1] for p in problems), dtype=float, count=len(F))
+    xy = polar_to_xy(F, theta)
+    S = np.column_stack([np.bincount(idx, weights=xy[:, 0], minlength=n),
+                         np.bincount(idx, weights=xy[:, 1], minlength=n)])
+    R_target = polar_to_xy([p[2] for p in problems], [p[3] for p in problems])
+    D, F1, theta1 = solve_unknown_force(S, R_target)
+    return {"Sx": S[:, 0], "Sy": S[:, 1], "Dx": D[:, 0], "Dy": D[:, 1], "F1": F1, "theta1": theta1}
+
+
+# ===================================
+# Sweeps: één parameter over een bereik, in één gevectoriseerde stap
+# ===================================
+def sweep_target_angle(S, Rmag, phis):
+    """F₁ en θ₁ als functie van de richting φ van R (vaste som S van de bekende krachten)."""
+    _, F1, theta1 = solve_unknown_force(S, polar_to_xy(Rmag, phis))
+    return F1, theta1
+
+
+def sweep_known_angle(S, F_k, theta_k, Rmag, phi, thetas):
+    """F₁ en θ₁ als functie van de hoek van één bekende kracht F_k (oorspronkelijk onder θ_k)."""
+    S_rest = as_rows(S, 2) - polar_to_xy(F_k, theta_k)
+    _, F1, theta1 = solve_unknown_force(S_rest + polar_to_xy(F_k, thetas), polar_to_xy(Rmag, phi))
+    return F1, theta1
+
+
+# ===================================
+# Twee onbekende grootten langs bekende werklijnen (2×2 per opgave)
+# ===================================
+STATUS_OK, STATUS_ILL, STATUS_SINGULAR = 0, 1, 2
+STATUS_LABELS = {STATUS_OK: "ok", STATUS_ILL: "slecht geconditioneerd", STATUS_SINGULAR: "singulier (evenwijdige werklijnen)"}
+COND_MAX = 1e6
+
+
+def solve_two_magnitudes(D, theta_a, theta_b, cond_max=COND_MAX):
+    """Los F_a·u_a + F_b·u_b = D op voor een hele batch (u = eenheidsvector langs θ).
+
+    D: (N,2) wat de onbekenden samen moeten leveren; θ_a, θ_b: (N,) of scalair.
+    Geeft F_a, F_b (N,, met teken: negatief = tegen de werklijn in; NaN bij
+    singulier), het conditiegetal (N,) en een statuscode per opgave. Alle
+    niet-singuliere stelsels gaan in één `np.linalg.solve`-aanroep.
+    """
+    D = as_rows(D, 2)
+    n = len(D)
+    u_a = polar_to_xy(np.ones(n), np.broadcast_to(theta_a, (n,)))
+    u_b = polar_to_xy(np.ones(n), np.broadcast_to(theta_b, (n,)))
+    A = np.stack([u_a, u_b], axis=2)                  # (N,2,2), kolommen u_a en u_b
+    cond = np.linalg.cond(A)
+    det = u_a[:, 0] * u_b[:, 1] - u_a[:, 1] * u_b[:, 0]
+
+    status = np.full(n, STATUS_OK)
+    status[cond > cond_max] = STATUS_ILL
+    singular = (np.abs(det) < EPS) | ~np.isfinite(cond)
+    status[singular] = STATUS_SINGULAR
+
+    F = np.full((n, 2), np.nan)
+    ok = ~singular
+    if ok.any():
+        F[ok] = np.linalg.solve(A[ok], D[ok][:, :, None])[:, :, 0]
+    return F[:, 0], F[:, 1], cond, status
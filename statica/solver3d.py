@@ -0,0 +1,69 @@
+"""Rekenkern van de 3D-solver: tot drie onbekende grootten langs bekende richtingen.
+
+Per opgave geldt Σ F_k·u_k = D, met D = R − S (gewenste resultante min de som
+van de bekende krachten; bij evenwicht is R = 0). Een batch van N opgaven
+wordt als één (N,3,k)-stelsel opgelost, zonder lus over de opgaven.
+"""
+import numpy as np
+
+from statica.vectors import EPS, as_rows, vec_norm
+from statica.solver import STATUS_OK, STATUS_ILL, STATUS_SINGULAR, STATUS_LABELS, COND_MAX
+
+STATUS_INCONSISTENT = 3
+STATUS_LABELS_3D = {**STATUS_LABELS,
+                    STATUS_ILL: "bijna coplanair / slecht geconditioneerd",
+                    STATUS_SINGULAR: "singulier (richtingen coplanair of evenwijdig)",
+                    STATUS_INCONSISTENT: "geen exacte oplossing (D ligt niet in het vlak/de lijn van de richtingen)"}
+# |det| van drie eenheidsvectoren = volume van het parallellepipedum; daaronder heet de set bijna coplanair
+COPLANAR_TOL = 1e-2
+RESIDUAL_TOL = 1e-9
+
+
+def unit_rows(v):
+    """Normaliseer elke rij van (..., 3); nulrijen blijven nul."""
+    v = np.asarray(v, dtype=float)
+    mag = vec_norm(v)
+    return np.divide(v, mag[..., None], out=np.zeros_like(v), where=mag[..., None] > EPS)
+
+
+def solve_magnitudes3d(D, U, cond_max=COND_MAX, coplanar_tol=COPLANAR_TOL):
+    """Los Σ F_k·u_k = D op voor een batch.
+
+    D: (N,3); U: (N,k,3) met k = 1..3 richtingen per opgave (wordt genormaliseerd).
+    Geeft F (N,k, NaN bij singulier), residu |A·F − D| (N,), conditiegetal (N,),
+    |det| (N,, alleen zinvol bij k = 3; anders NaN) en een statuscode per opgave.
+    Bij k = 3 gaan alle niet-singuliere stelsels in één `np.linalg.solve`; bij
+    k < 3 is het stelsel overbepaald en volgt een kleinste-kwadratenoplossing
+    via de pseudo-inverse (status 'geen exacte oplossing' als het residu niet 0 is).
+    """
+    D = as_rows(D, 3)
+    U = unit_rows(np.asarray(U, dtype=float).reshape(len(D), -1, 3))
+    n, k = U.shape[:2]
+    A = U.transpose(0, 2, 1)                          # (N,3,k), kolommen u_k
+    sv = np.linalg.svd(A, compute_uv=False)           # (N,k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cond = np.where(sv[:, -1] > EPS, sv[:, 0] / sv[:, -1], np.inf)
+
+    status = np.full(n, STATUS_OK)
+    F = np.full((n, k), np.nan)
+    if k == 3:
+        det = np.abs(np.linalg.det(A))
+        status[(det < coplanar_tol) | (cond > cond_max)] = STATUS_ILL
+        singular = (det < EPS) | ~np.isfinite(cond)
+        ok = ~singular
+        if ok.any():
+            F[ok] = np.linalg.solve(A[ok], D[ok][:, :, None])[:, :, 0]
+    else:
+        det = np.full(n, np.nan)
+        status[cond > cond_max] = STATUS_ILL
+        singular = ~np.isfinite(cond)
+        ok = ~singular
+        if ok.any():
+            F[ok] = (np.linalg.pinv(A[ok]) @ D[ok][:, :, None])[:, :, 0]
+    status[singular] = STATUS_SINGULAR
+
+    residual = np.full(n, np.nan)
+    residual[ok] = vec_norm((A[ok] @ F[ok][:, :, None])[:, :, 0] - D[ok])
+    inconsistent = ok & (residual > RESIDUAL_TOL * np.maximum(1.0, vec_norm(D)))
+    status[inconsistent] = STATUS_INCONSISTENT
+    return F, residual, cond, det, status
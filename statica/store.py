@@ -0,0 +1,282 @@
+"""Kolomgewijze invoeropslag (struct-of-arrays) voor de invoerlijsten van alle pagina's.
+
+Eén `VectorStore` per invoerlijst in `st.session_state`: elke numerieke kolom
+is één getypeerde NumPy-array, tekstkolommen (modus, kleur, referentie-as,
+naam) zijn integer-codes in een geïnterneerde waardelijst per kolom, en elke
+rij heeft een stabiel ID dat niet verschuift bij verwijderen (widget-sleutels
+hangen daaraan i.p.v. aan de positie). Wijzigingen gebeuren in place; `version`
+telt elke echte wijziging, zodat een pagina alleen herrekent als er iets
+veranderd is.
+
+Lezen als lijst van dicts blijft mogelijk (`store[i]`, `for ent in store`),
+maar rekenwerk gebruikt de kolommen direct (`store.col("force")`).
+"""
+import numpy as np
+
+# Schema's: kolom → standaardwaarde; het type van de standaard bepaalt de opslag
+# (float → float64, bool → bool, tekst/None → geïnterneerde codes). Nieuwe kolommen
+# komen achteraan, zodat oudere deellinks en opgeslagen scenario's leesbaar blijven.
+# px/py/pz: aangrijpingspunt van de kracht (standaard de oorsprong)
+ENTRY3D_FIELDS = {"mode": "cart", "force": 0.0, "x": 0.0, "y": 0.0, "z": 0.0,
+                  "alpha": 0.0, "beta": 0.0, "gamma": 0.0, "color": None,
+                  "hyb_enable": False, "hyb_beta": 0.0, "hyb_use_z": False, "hyb_z": 0.0, "hyb_xsign": "+",
+                  "px": 0.0, "py": 0.0, "pz": 0.0}
+ENTRY2D_FIELDS = {"mode": "cart", "force": 0.0, "x": 0.0, "y": 0.0, "theta": 0.0, "ref": "X-as", "color": None,
+                  "px": 0.0, "py": 0.0}
+KNOWN2D_FIELDS = {"F": 0.0, "theta": 0.0, "color": None}
+KNOWN3D_FIELDS = {"mode": "cart", "force": 0.0, "x": 0.0, "y": 0.0, "z": 0.0,
+                  "alpha": 0.0, "beta": 0.0, "gamma": 0.0, "color": None}
+UNKNOWN3D_FIELDS = {"name": "", "mode": "cart", "x": 0.0, "y": 0.0, "z": 0.0, "alpha": 0.0, "beta": 0.0, "gamma": 0.0}
+# Verdeelde last langs de X-as op hoogte y (statica.loads): shape "uniform" (q0), "lineair" (q0 → q1)
+# of "tabel" (samples "x:q; x:q; ..."); q positief in richting theta (graden vanaf X-as)
+LOAD2D_FIELDS = {"shape": "uniform", "x0": 0.0, "x1": 1.0, "q0": 0.0, "q1": 0.0, "samples": "",
+                 "theta": -90.0, "y": 0.0, "color": None}
+# Vakwerk (statica.truss): knopen met opleggingen (vast in x/y) en knooplasten; staven tussen knoopnummers a–b (1-based)
+TRUSS_NODE_FIELDS = {"x": 0.0, "y": 0.0, "fix_x": False, "fix_y": False, "Fx": 0.0, "Fy": 0.0}
+TRUSS_MEMBER_FIELDS = {"a": 1.0, "b": 2.0}
+# Evenwicht star lichaam (statica.rigid3d): belastingen met aangrijpingspunt per belastinggeval `case`,
+# en onbekende reacties (type "kracht" of "moment") met richting en aangrijpingspunt
+RIGID_LOAD_FIELDS = {"case": 1.0, "mode": "cart", "force": 0.0, "x": 0.0, "y": 0.0, "z": 0.0,
+                     "alpha": 0.0, "beta": 0.0, "gamma": 0.0, "px": 0.0, "py": 0.0, "pz": 0.0, "color": None}
+RIGID_SUPPORT_FIELDS = {"name": "", "type": "kracht", "mode": "cart", "x": 0.0, "y": 0.0, "z": 0.0,
+                        "alpha": 0.0, "beta": 0.0, "gamma": 0.0, "px": 0.0, "py": 0.0, "pz": 0.0}
+
+# Sessie-sleutel van een invoerlijst → schema van de opslag
+STORE_FIELDS = {
+    "entries": ENTRY3D_FIELDS,
+    "entries2d": ENTRY2D_FIELDS,
+    "known_forces": KNOWN2D_FIELDS,
+    "known3d": KNOWN3D_FIELDS,
+    "unknowns3d": UNKNOWN3D_FIELDS,
+    "loads2d": LOAD2D_FIELDS,
+    "truss_nodes": TRUSS_NODE_FIELDS,
+    "truss_members": TRUSS_MEMBER_FIELDS,
+    "rigid_loads": RIGID_LOAD_FIELDS,
+    "rigid_supports": RIGID_SUPPORT_FIELDS,
+}
+
+_MIN_CAPACITY = 8
+
+
+def field_kind(default):
+    """Opslagsoort van een kolom uit zijn standaardwaarde: 'bool', 'float' of 'text'."""
+    if isinstance(default, bool):
+        return "bool"
+    if isinstance(default, (int, float)):
+        return "float"
+    return "text"
+
+
+_DTYPES = {"bool": np.bool_, "float": np.float64, "text": np.int32}
+
+
+class VectorStore:
+    """Invoerrijen als kolommen met stabiele rij-ID's; zie de moduledocstring."""
+
+    def __init__(self, fields, records=()):
+        self.fields = dict(fields)
+        self.kinds = {c: field_kind(d) for c, d in self.fields.items()}
+        self.version = 0
+        self._n = 0
+        self._next_id = 0
+        self._ids = np.zeros(_MIN_CAPACITY, dtype=np.int64)
+        self._data = {c: np.zeros(_MIN_CAPACITY, dtype=_DTYPES[k]) for c, k in self.kinds.items()}
+        self._cats = {c: [] for c, k in self.kinds.items() if k == "text"}
+        self._lookup = {c: {} for c in self._cats}
+        self.extend(records)
+
+    # ---------- opslag ----------
+    def __len__(self):
+        return self._n
+
+    def _reserve(self, n):
+        cap = len(self._ids)
+        if n <= cap:
+            return
+        cap = max(n, 2 * cap)
+        self._ids = np.resize(self._ids, cap)
+        for c, arr in self._data.items():
+            self._data[c] = np.resize(arr, cap)
+
+    def _code(self, col, value):
+        lookup = self._lookup[col]
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(self._cats[col])
+            self._cats[col].append(value)
+        return code
+
+    def _encode(self, col, value):
+        kind = self.kinds[col]
+        if kind == "text":
+            return self._code(col, value)
+        return bool(value) if kind == "bool" else float(value)
+
+    def _decode(self, col, value):
+        kind = self.kinds[col]
+        if kind == "text":
+            return self._cats[col][value]
+        return bool(value) if kind == "bool" else float(value)
+
+    # ---------- lezen ----------
+    @property
+    def ids(self):
+        """Stabiele rij-ID's (N,); blijven gelijk bij verwijderen/toevoegen van andere rijen."""
+        return self._ids[:self._n]
+
+    def col(self, name):
+        """Kolom als array (N,): numeriek als view op de opslag, tekst als object-array."""
+        arr = self._data[name][:self._n]
+        if self.kinds[name] == "text":
+            return np.asarray(self._cats[name], dtype=object)[arr]
+        return arr
+
+    def stack(self, *names):
+        """Numerieke kolommen naast elkaar als nieuwe (N, k)-array."""
+        return np.column_stack([self._data[c][:self._n] for c in names]).astype(float)
+
+    def is_(self, name, value):
+        """Booleaanse masker (N,) voor tekstkolom == value."""
+        code = self._lookup[name].get(value)
+        if code is None:
+            return np.zeros(self._n, dtype=bool)
+        return self._data[name][:self._n] == code
+
+    def row(self, i):
+        return {c: self._decode(c, self._data[c][i]) for c in self.fields}
+
+    def __getitem__(self, i):
+        if not -self._n <= i < self._n:
+            raise IndexError(i)
+        return self.row(i % self._n)
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self.row(i)
+
+    def records(self):
+        """Alle rijen als lijst van dicts (voor opslaan/exporteren)."""
+        cols = {c: self.col(c).tolist() for c in self.fields}
+        return [{c: cols[c][i] for c in self.fields} for i in range(self._n)]
+
+    def fingerprint(self):
+        """Inhoud (zonder rij-ID's) als dict van arrays, voor `cache.scenario_hash`."""
+        out = {"n": np.asarray([self._n])}
+        for c in self.fields:
+            out[c] = self.col(c)
+        return out
+
+    @property
+    def nbytes(self):
+        return self._ids.nbytes + sum(a.nbytes for a in self._data.values())
+
+    # ---------- schrijven (in place) ----------
+    def extend(self, records):
+        """Voeg rijen (dicts; ontbrekende kolommen → standaard) achteraan toe; geeft hun ID's terug."""
+        records = list(records)
+        k = len(records)
+        if not k:
+            return np.zeros(0, dtype=np.int64)
+        start = self._n
+        self._reserve(start + k)
+        for c, default in self.fields.items():
+            vals = [r.get(c, default) for r in records]
+            if self.kinds[c] == "text":
+                vals = [self._code(c, v) for v in vals]
+            self._data[c][start:start + k] = vals
+        new_ids = np.arange(self._next_id, self._next_id + k, dtype=np.int64)
+        self._ids[start:start + k] = new_ids
+        self._next_id += k
+        self._n += k
+        self.version += 1
+        return new_ids
+
+    def append(self, **values):
+        return int(self.extend([values])[0])
+
+    def set(self, i, col, value):
+        """Zet één cel; True als de waarde echt veranderde."""
+        code = self._encode(col, value)
+        if self._data[col][i] == code:
+            return False
+        self._data[col][i] = code
+        self.version += 1
+        return True
+
+    def update(self, i, values):
+        changed = False
+        for c, v in values.items():
+            changed |= self.set(i, c, v)
+        return changed
+
+    def delete(self, positions):
+        """Verwijder rijen op de gegeven posities; de overige rijen houden hun ID."""
+        positions = np.asarray(positions, dtype=int).reshape(-1)
+        if not len(positions):
+            return
+        keep = np.ones(self._n, dtype=bool)
+        keep[positions] = False
+        m = int(keep.sum())
+        self._ids[:m] = self._ids[:self._n][keep]
+        for arr in self._data.values():
+            arr[:m] = arr[:self._n][keep]
+        self._n = m
+        self.version += 1
+
+    def clear(self):
+        if self._n:
+            self._n = 0
+            self.version += 1
+
+    def replace(self, records):
+        """Vervang alle rijen door `records`; ze krijgen nieuwe ID's, zodat oude widgetstatus niet blijft hangen."""
+        self._n = 0
+        self.extend(records)
+        self.version += 1
+
+    def replace_columns(self, columns):
+        """Als `replace`, maar vanuit kolommen (dict kolom → reeks) in één gevectoriseerde stap."""
+        self._n = 0
+        self.assign_columns(columns)
+        self.version += 1
+
+    def new_ids(self, k):
+        """Reserveer `k` nieuwe rij-ID's (voor rijen die elders, bijv. in de tabeleditor, zijn toegevoegd)."""
+        ids = np.arange(self._next_id, self._next_id + k, dtype=np.int64)
+        self._next_id += k
+        return ids
+
+    def assign_columns(self, columns, ids=None):
+        """Vervang de inhoud door kolommen (dict kolom → reeks van gelijke lengte); True bij wijziging.
+
+        Met `ids` (N,) krijgt elke rij dat ID, zodat een rij haar ID houdt als rijen
+        ervoor verwijderd of verplaatst worden (nieuwe rijen: ID's uit `new_ids`).
+        Zonder `ids` houden rijen op bestaande posities hun ID en krijgen extra rijen een nieuw ID.
+        """
+        n = len(next(iter(columns.values()))) if columns else 0
+        new = {}
+        for c, default in self.fields.items():
+            vals = columns.get(c)
+            if vals is None:
+                vals = [default] * n
+            if self.kinds[c] == "text":
+                new[c] = np.fromiter((self._code(c, v) for v in vals), dtype=np.int32, count=n)
+            else:
+                new[c] = np.asarray(vals, dtype=_DTYPES[self.kinds[c]])
+        if ids is not None:
+            ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        if (n == self._n and all(np.array_equal(self._data[c][:n], new[c]) for c in self.fields)
+                and (ids is None or np.array_equal(self._ids[:n], ids))):
+            return False
+        self._reserve(n)
+        for c in self.fields:
+            self._data[c][:n] = new[c]
+        if ids is not None:
+            self._ids[:n] = ids
+            self._next_id = max(self._next_id, int(ids.max()) + 1 if n else 0)
+        elif n > self._n:
+            self._ids[self._n:n] = np.arange(self._next_id, self._next_id + n - self._n)
+            self._next_id += n - self._n
+        self._n = n
+        self.version += 1
+        return True
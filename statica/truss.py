@@ -0,0 +1,135 @@
+"""Rekenkern van de vakwerk-solver: staafkrachten van een vlak vakwerk (knooppuntenmethode).
+
+Per knoop twee evenwichtsvergelijkingen (ΣFx = 0, ΣFy = 0); onbekenden zijn de
+staafkrachten N (trek positief) en de oplegreacties. Het stelsel A·[N; R] = −P
+heeft per staaf vier en per reactie één niet-nul coëfficiënt; het wordt in één
+gevectoriseerde stap als sparse matrix opgebouwd en met één sparse
+LU-factorisatie (SuperLU) opgelost, zodat ook vakwerken met duizenden staven
+direct rekenen. Vóór het oplossen telt de solver vergelijkingen en onbekenden
+(m + r tegenover 2n); een vierkant maar singulier stelsel is een geometrisch
+instabiel vakwerk.
+"""
+import numpy as np
+
+from statica.vectors import EPS, vec_norm
+
+STATUS_OK, STATUS_ILL, STATUS_MECHANISM, STATUS_INDETERMINATE, STATUS_UNSTABLE = 0, 1, 2, 3, 4
+STATUS_LABELS_TRUSS = {
+    STATUS_OK: "ok (statisch bepaald)",
+    STATUS_ILL: "slecht geconditioneerd (bijna instabiel)",
+    STATUS_MECHANISM: "mechanisme (te weinig staven/opleggingen)",
+    STATUS_INDETERMINATE: "statisch onbepaald (overtallige staven/opleggingen)",
+    STATUS_UNSTABLE: "geometrisch instabiel (singulier stelsel)",
+}
+# Kleinste/grootste pivot van U; daaronder heet het vakwerk bijna instabiel
+PIVOT_TOL = 1e-10
+ZERO_FORCE_TOL = 1e-9   # relatief t.o.v. de grootste staafkracht
+
+
+# ===================================
+# Invoer
+# ===================================
+def truss_arrays(nodes, members):
+    """Knopen- en stavenopslag → xy (n,2), staafeinden (m,2; 0-based), opleggingen (n,2 bool), lasten (n,2).
+
+    Knoopnummers in de stavenlijst zijn 1-based (zoals op de pagina); ValueError
+    bij ongeldige nummers of staven met lengte 0.
+    """
+    xy = nodes.stack("x", "y")
+    fix = np.column_stack([nodes.col("fix_x"), nodes.col("fix_y")]).astype(bool)
+    loads = nodes.stack("Fx", "Fy")
+    ab = members.stack("a", "b")
+    ends = np.rint(ab).astype(np.int64) - 1
+    bad = (np.abs(ab - np.rint(ab)) > 1e-9).any(axis=1) | (ends < 0).any(axis=1) | (ends >= len(xy)).any(axis=1)
+    if bad.any():
+        raise ValueError(f"staaf {int(np.flatnonzero(bad)[0]) + 1}: knoopnummers moeten gehele getallen 1..{len(xy)} zijn")
+    L = vec_norm(xy[ends[:, 1]] - xy[ends[:, 0]]) if len(ends) else np.zeros(0)
+    if (L < EPS).any():
+        raise ValueError(f"staaf {int(np.flatnonzero(L < EPS)[0]) + 1} heeft lengte 0")
+    return xy, ends, fix, loads
+
+
+def pratt_truss(panels, span=12.0, height=2.0, load=10_000.0):
+    """Pratt-ligger met `panels` vakken als kolommen (knopen, staven) voor de opslagen.
+
+    Onderrand-knopen 1..p+1, bovenrand-knopen p+2..2p+2; scharnier links, rol rechts
+    en een last `load` (N) omlaag op elke binnenknoop van de onderrand. 4p+1 staven.
+    """
+    p = int(panels)
+    i = np.arange(p + 1)
+    x = np.concatenate([i, i]) * (span / p)
+    y = np.concatenate([np.zeros(p + 1), np.full(p + 1, height)])
+    fix_x = np.zeros(2 * p + 2, dtype=bool)
+    fix_y = np.zeros(2 * p + 2, dtype=bool)
+    fix_x[0] = fix_y[0] = fix_y[p] = True
+    Fy = np.zeros(2 * p + 2)
+    Fy[1:p] = -load
+    bot, top = i + 1, i + p + 2                      # 1-based knoopnummers
+    k = np.arange(p)
+    left = k < p / 2                                 # diagonalen lopen naar het midden omlaag
+    a = np.concatenate([bot[:-1], top[:-1], bot, np.where(left, top[:-1], bot[:-1])])
+    b = np.concatenate([bot[1:], top[1:], top, np.where(left, bot[1:], top[1:])])
+    nodes = {"x": x, "y": y, "fix_x": fix_x, "fix_y": fix_y, "Fx": np.zeros(2 * p + 2), "Fy": Fy}
+    return nodes, {"a": a.astype(float), "b": b.astype(float)}
+
+
+# ===================================
+# Stelsel en oplossing
+# ===================================
+def assemble(xy, ends, fix):
+    """Sparse evenwichtsmatrix A (2n × (m+r), CSC), staaflengten (m,) en de vrijheidsgraden van de reacties (r,)."""
+    from scipy.sparse import coo_matrix  # lazy: scipy pas laden bij de eerste berekening
+    n, m = len(xy), len(ends)
+    d = xy[ends[:, 1]] - xy[ends[:, 0]]
+    L = vec_norm(d)
+    u = d / L[:, None]
+    dofs = np.flatnonzero(fix.ravel())               # 2·knoop + (0 = x, 1 = y)
+    a, b, k = ends[:, 0], ends[:, 1], np.arange(m)
+    # Trekkracht N trekt knoop a naar b (+u) en knoop b naar a (−u); reactie: 1 in haar eigen rij
+    rows = np.concatenate([2 * a, 2 * a + 1, 2 * b, 2 * b + 1, dofs])
+    cols = np.concatenate([k, k, k, k, m + np.arange(len(dofs))])
+    vals = np.concatenate([u[:, 0], u[:, 1], -u[:, 0], -u[:, 1], np.ones(len(dofs))])
+    A = coo_matrix((vals, (rows, cols)), shape=(2 * n, m + len(dofs))).tocsc()
+    return A, L, dofs
+
+
+def solve_truss(xy, ends, fix, loads):
+    """Staafkrachten en reacties van een vlak vakwerk.
+
+    Geeft N (m,; NaN als er geen eenduidige oplossing is), reacties (n,2; 0 bij
+    vrije richtingen), residu |A·x + P| (N), staaflengten (m,), aantal niet-nullen
+    van A en een statuscode. Alleen een vierkant stelsel (m + r = 2n) wordt
+    gefactoriseerd; anders volgt de status uit de telling.
+    """
+    from scipy.sparse.linalg import splu  # lazy: scipy pas laden bij de eerste berekening
+    xy = np.asarray(xy, dtype=float)
+    n, m = len(xy), len(ends)
+    A, L, dofs = assemble(xy, ends, fix)
+    N = np.full(m, np.nan)
+    reactions = np.zeros((n, 2))
+    n_unknown = m + len(dofs)
+    if n_unknown < 2 * n:
+        return N, reactions, np.nan, L, A.nnz, STATUS_MECHANISM
+    if n_unknown > 2 * n:
+        return N, reactions, np.nan, L, A.nnz, STATUS_INDETERMINATE
+    P = np.asarray(loads, dtype=float).ravel()
+    try:
+        lu = splu(A)
+    except RuntimeError:                             # SuperLU: "Factor is exactly singular"
+        return N, reactions, np.nan, L, A.nnz, STATUS_UNSTABLE
+    pivots = np.abs(lu.U.diagonal())
+    x = lu.solve(-P)
+    residual = float(np.linalg.norm(A @ x + P))
+    status = STATUS_ILL if pivots.min() < PIVOT_TOL * pivots.max() else STATUS_OK
+    if not np.all(np.isfinite(x)):
+        return N, reactions, np.nan, L, A.nnz, STATUS_UNSTABLE
+    N = x[:m]
+    reactions.ravel()[dofs] = x[m:]
+    return N, reactions, residual, L, A.nnz, status
+
+
+def force_kind(N):
+    """'trek', 'druk' of 'nul' per staaf (nul: kleiner dan ZERO_FORCE_TOL × de grootste |N|)."""
+    N = np.asarray(N, dtype=float)
+    tol = ZERO_FORCE_TOL * max(float(np.nanmax(np.abs(N))) if len(N) and np.isfinite(N).any() else 0.0, 1.0)
+    return np.where(np.abs(N) <= tol, "nul", np.where(N > 0, "trek", "druk"))
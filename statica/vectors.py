@@ -0,0 +1,137 @@
+"""Gebatchte vectorconversies (array-in/array-out) voor alle pagina's.
+
+Alle functies werken op NumPy-arrays met één rij per vector, zodat een
+volledige krachtenset in één gevectoriseerde stap wordt omgerekend.
+"""
+import numpy as np
+
+EPS = 1e-12
+
+
+# ===================================
+# Basis
+# ===================================
+def as_rows(v, dim):
+    """Forceer invoer naar een float-array met vorm (N, dim)."""
+    return np.asarray(v, dtype=float).reshape(-1, dim)
+
+
+def vec_norm(v):
+    """Lengte per rij van een (N, k)-array."""
+    v = np.asarray(v, dtype=float)
+    return np.sqrt(np.einsum("...i,...i->...", v, v))
+
+
+def resultant(v):
+    """Som van alle vectoren (componentsgewijs); leeg → nulvector."""
+    v = np.asarray(v, dtype=float)
+    return v.sum(axis=0)
+
+
+def rescale_to_force(v, force):
+    """Schaal elke rij naar grootte `force` waar force > 0 en |v| > 0; anders ongewijzigd."""
+    v = np.asarray(v, dtype=float)
+    force = np.asarray(force, dtype=float)
+    mag = vec_norm(v)
+    scale = np.ones_like(mag)
+    mask = (force > 0) & (mag > EPS)
+    scale[mask] = force[mask] / mag[mask]
+    return v * scale[:, None]
+
+
+# ===================================
+# 3D: cartesisch ↔ richtingshoeken
+# ===================================
+def cart_to_alpha_beta_gamma(xyz):
+    """(N,3) → hoeken (N,3) in graden t.o.v. x/y/z-as en grootte (N,). Nulvector → NaN-hoeken."""
+    xyz = as_rows(xyz, 3)
+    mag = vec_norm(xyz)
+    ok = mag > EPS
+    cos = np.zeros_like(xyz)
+    cos[ok] = xyz[ok] / mag[ok, None]
+    angles = np.degrees(np.arccos(np.clip(cos, -1.0, 1.0)))
+    angles[~ok] = np.nan
+    return angles, mag
+
+
+def alpha_beta_gamma_to_cart(mag, angles_deg, normalize_if_needed=True):
+    """Grootte (N,) + hoeken (N,3) in graden → (N,3) componenten.
+
+    Als de cos²-som merkbaar van 1 afwijkt worden de richtingscosinussen
+    (optioneel) genormaliseerd; een cos²-som van ~0 geeft de nulvector.
+    """
+    c = np.cos(np.radians(as_rows(angles_deg, 3)))
+    mag = np.broadcast_to(np.asarray(mag, dtype=float), (c.shape[0],))
+    s = np.einsum("ij,ij->i", c, c)
+    k = np.ones_like(s)
+    if normalize_if_needed:
+        fix = np.abs(s - 1.0) > 1e-3
+        k[fix] = np.sqrt(s[fix])
+    out = c * (mag / np.where(s > EPS, k, 1.0))[:, None]
+    out[s <= EPS] = 0.0
+    return out
+
+
+# ===================================
+# 2D: grootte/hoek ↔ XY
+# ===================================
+def polar_to_xy(F, theta_deg, from_y=False):
+    """Grootte + hoek → (N,2). `from_y` (scalair of per rij): hoek gemeten vanaf de Y-as."""
+    F = np.asarray(F, dtype=float).reshape(-1)
+    t = np.radians(np.asarray(theta_deg, dtype=float).reshape(-1))
+    c, s = np.cos(t), np.sin(t)
+    from_y = np.broadcast_to(np.asarray(from_y, dtype=bool), c.shape)
+    x = F * np.where(from_y, s, c)
+    y = F * np.where(from_y, c, s)
+    return np.column_stack([x, y])
+
+
+def xy_to_polar(xy):
+    """(N,2) → hoek vanaf X-as in graden ([-180,180], NaN bij nulvector) en grootte (N,)."""
+    xy = as_rows(xy, 2)
+    mag = vec_norm(xy)
+    theta = np.degrees(np.arctan2(xy[:, 1], xy[:, 0]))
+    theta[mag < EPS] = np.nan
+    return theta, mag
+
+
+# ===================================
+# Kolommen → componenten
+# ===================================
+def columns_to_cart(is_dir, force, xyz, abg, normalize_dircos=True):
+    """3D-kolommen → (N,3): cart-rijen geschaald naar `force` (indien > 0), dir-rijen via α/β/γ."""
+    out = rescale_to_force(as_rows(xyz, 3), force)
+    is_dir = np.asarray(is_dir, dtype=bool)
+    if is_dir.any():
+        force = np.asarray(force, dtype=float)
+        out[is_dir] = alpha_beta_gamma_to_cart(force[is_dir], as_rows(abg, 3)[is_dir], normalize_if_needed=normalize_dircos)
+    return out
+
+
+def columns_to_xy(is_angle, force, xy, theta, from_y):
+    """2D-kolommen → (N,2): cart-rijen geschaald naar `force` (indien > 0), angle-rijen via θ en referentie-as."""
+    out = rescale_to_force(as_rows(xy, 2), force)
+    is_angle = np.asarray(is_angle, dtype=bool)
+    if is_angle.any():
+        force = np.asarray(force, dtype=float)
+        out[is_angle] = polar_to_xy(force[is_angle], np.asarray(theta)[is_angle], np.asarray(from_y)[is_angle])
+    return out
+
+
+# ===================================
+# Pagina-invoer → arrays
+# ===================================
+def entries_to_cart(entries, normalize_dircos=True):
+    """3D-invoer (VectorStore met mode/force/x/y/z/alpha/beta/gamma) → (N,3) in één stap."""
+    if len(entries) == 0:
+        return np.zeros((0, 3))
+    return columns_to_cart(entries.is_("mode", "dir"), entries.col("force"), entries.stack("x", "y", "z"),
+                           entries.stack("alpha", "beta", "gamma"), normalize_dircos)
+
+
+def entries2d_to_xy(entries):
+    """2D-invoer (VectorStore met mode/force/x/y/theta/ref) → (N,2) in één stap."""
+    if len(entries) == 0:
+        return np.zeros((0, 2))
+    return columns_to_xy(entries.is_("mode", "angle"), entries.col("force"), entries.stack("x", "y"),
+                         entries.col("theta"), entries.is_("ref", "Y-as"))